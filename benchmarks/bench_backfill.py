@@ -0,0 +1,126 @@
+"""Backfill benchmark: one long range of report jobs, serial vs. partitioned over processes.
+
+Runs ``ordercycle.backfill`` against the local mock Odoo server (worker processes
+log into it like the real one) and pastes into the in-memory fake Sheets client,
+first with one process and one Odoo slot (the month-by-month loop done by hand
+today, minus the hand), then with ``--processes`` / ``--odoo_reports``. Reports are
+rendered up front, so Odoo's render time is the ``--report_latency_ms`` sleep only.
+Checks that both rebuilds paste identical tabs (timestamps aside) with every month's
+rows, and reports the speedup.
+Run from the repo root:
+    python benchmarks/bench_backfill.py --months 12 --report_rows 5000 --report_latency_ms 500
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+import warnings
+from datetime import date
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Read at import time, by this process and by the spawned workers (bench_e2e moves the other caches)
+if "DOWNLOAD_DIR" not in os.environ:
+    os.environ["DOWNLOAD_DIR"] = os.path.join(tempfile.mkdtemp(prefix="ordercycle-backfill-"), "downloads")
+os.environ["ZIPPER_RENDER_WAIT"] = "0"
+
+from bench_e2e import TAB_GRID, job_tabs
+from fake_sheets import FakeSheetsClient
+from mock_odoo import MockOdoo, report_xlsx
+from ordercycle import jobs
+from ordercycle.backfill import backfill
+from ordercycle.context import JobContext
+from ordercycle.dates import month_partitions
+from ordercycle.reports import COMPANIES
+
+
+@contextlib.contextmanager
+def quiet(verbose):
+    """Silence stdout of this process and of the worker processes it starts (they share fd 1)."""
+    if verbose:
+        yield
+        return
+    sys.stdout.flush()
+    saved = os.dup(1)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(io.StringIO()):
+        os.dup2(devnull.fileno(), 1)
+        try:
+            yield
+        finally:
+            os.dup2(saved, 1)
+            os.close(saved)
+
+
+def rebuild(names, server, from_date, to_date, processes, odoo_slots, verbose):
+    store = FakeSheetsClient()
+    for name in names:
+        for sheet_id, title in job_tabs(name):
+            store.open_by_key(sheet_id).worksheet(title).resize(*TAB_GRID)
+    ctx = JobContext(gc=store)
+    start = time.perf_counter()
+    with quiet(verbose):
+        results = backfill(names, ctx, from_date, to_date, processes=processes, odoo_slots=odoo_slots)
+    wall = time.perf_counter() - start
+    tabs = {}
+    for name in names:
+        for sheet_id, title in job_tabs(name):
+            cells = [list(row) for row in store.open_by_key(sheet_id).worksheet(title).cells]
+            cells[1][28] = ""  # AC2, the paste timestamp
+            tabs[title] = cells
+    return wall, results, tabs
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jobs", default="Production_data_fetch,Order_realsed")
+    parser.add_argument("--months", type=int, default=12)
+    parser.add_argument("--report_rows", type=int, default=2000, help="rows per monthly XLSX report sheet")
+    parser.add_argument("--report_latency_ms", type=float, default=300.0, help="mock render time per report")
+    parser.add_argument("--latency_ms", type=float, default=2.0, help="mock latency per request")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--odoo_reports", type=int, default=4, help="report generations in flight")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    names = [n.strip() for n in args.jobs.split(",")]
+    year = date.today().year - 3  # a fully past range, up to 36 months
+    parts = month_partitions(f"{year}-01-01", f"{year + 2}-12-31")[:max(1, args.months)]
+    from_date, to_date, months = parts[0][0], parts[-1][1], len(parts)
+
+    server = MockOdoo(report_rows=args.report_rows, latency_ms=args.latency_ms,
+                      report_latency_ms=args.report_latency_ms).start()
+    os.environ.update(ODOO_URL=server.url, ODOO_DB="bench", ODOO_USERNAME="bench", ODOO_PASSWORD="bench")
+    print(f"mock Odoo {server.url}: {months} month(s) {from_date} to {to_date}, {args.report_rows} rows per report, "
+          f"{args.report_latency_ms:.0f} ms render")
+    for name in names:
+        report_type = jobs.load(name).REPORT_TYPE
+        for company_id in COMPANIES:
+            for first, last in parts:
+                server.reports[report_type, first, last, company_id] = report_xlsx(
+                    report_type, args.report_rows, first, last, seed=company_id)
+
+    runs = {}
+    for label, processes, slots in (("serial", 1, 1), ("partitioned", args.processes, args.odoo_reports)):
+        wall, results, tabs = rebuild(names, server, from_date, to_date, processes, slots, args.verbose)
+        runs[label] = wall, tabs
+        status = ", ".join(f"{n} {s}" for n, s, *_ in results)
+        print(f"{label:<12} {processes:>3} proc {slots:>2} slots {wall:8.2f}s   {status}")
+
+    (serial, serial_tabs), (parallel, parallel_tabs) = runs["serial"], runs["partitioned"]
+    rows = {title: sum(any(v != "" for v in row) for row in cells) - 1 for title, cells in parallel_tabs.items()}
+    expected = months * args.report_rows
+    ok = serial_tabs == parallel_tabs and all(n == expected for n in rows.values())
+    print(f"speedup {serial / parallel:.2f}x; tabs {'identical' if serial_tabs == parallel_tabs else 'DIFFER'}, "
+          f"rows per tab {sorted(set(rows.values()))} (expected {expected})")
+    server.shutdown()
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
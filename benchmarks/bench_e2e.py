@@ -0,0 +1,170 @@
+"""End-to-end benchmark: every job against the local mock Odoo server.
+
+Each job runs through the scheduler in a fresh JobContext whose OdooClient
+points at benchmarks/mock_odoo.py and whose Sheets client is the in-memory
+benchmarks/fake_sheets.py, so the whole fetch -> transform -> upload path is
+timed with no network. With ``--sheets http`` (the default) the real gspread
+client talks to the fake Sheets REST server, whose latency and quotas are
+configurable; ``--sheets memory`` skips gspread entirely. Reports wall time,
+input rows/s (fetched records, report rows or source sheet rows), Odoo
+requests, Sheets calls / cells written / MiB uploaded and peak traced memory
+(second, traced pass).
+Run from the repo root:
+    python benchmarks/bench_e2e.py --records 20000 --latency_ms 5 --sheets_latency_ms 150 --jobs ALL
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Local caches go to a scratch dir (read at import time by the job modules)
+SCRATCH = tempfile.mkdtemp(prefix="ordercycle-bench-")
+os.environ["HANDOFF_DIR"] = os.path.join(SCRATCH, "handoff")
+os.environ["CHECKPOINT_DIR"] = os.path.join(SCRATCH, "checkpoints")
+os.environ["GOVERNOR_DIR"] = os.path.join(SCRATCH, "governor")
+os.environ["DOWNLOAD_DIR"] = os.path.join(SCRATCH, "downloads")
+os.environ["SOURCE_CACHE_DIR"] = ""
+os.environ["SLIDER_ROLLUP_STORE"] = ""
+
+from fake_sheets import READ_QUOTA, WRITE_QUOTA, FakeSheetsClient, FakeSheetsServer, sheets_client
+from mock_odoo import MockOdoo
+from ordercycle import jobs, reports, telemetry
+from ordercycle.context import JobContext
+from ordercycle.odoo import OdooClient
+from ordercycle.scheduler import run_dag
+
+INPUT_PHASES = {"fetch", "read_excel", "read_source"}
+TAB_GRID = (1000, 52)  # the live tabs are wider than a new sheet (timestamps go to AC2)
+
+
+def job_tabs(name):
+    """(spreadsheet id, tab title) pairs a job writes, read off its module constants."""
+    module = jobs.load(name)
+    tabs = []
+    for attr in ("SHEETS", "COMPANY_SHEETS", "SHEET_NAME", "TARGET_SHEET_NAME"):
+        value = getattr(module, attr, None)
+        if isinstance(value, dict):
+            value = list(value.values())
+        elif isinstance(value, str):
+            value = [value]
+        for item in value or []:
+            titles = [item] if isinstance(item, str) else [item[-1]] if attr == "COMPANY_SHEETS" else list(item)
+            sheet_id = getattr(module, "TARGET_SHEET_ID" if attr == "TARGET_SHEET_NAME" else "SHEET_ID")
+            tabs.extend((sheet_id, title) for title in titles)
+    return tabs
+
+
+def make_context(name, server, sheets, options, source_rows):
+    """Fresh JobContext on the mock servers, with the job's tabs and the slider source sheet seeded."""
+    from ordercycle.jobs.slider_wise import SOURCE_SHEET_ID, SOURCE_SHEET_NAME
+    store = FakeSheetsClient()
+    store.seed_slider_source(SOURCE_SHEET_ID, SOURCE_SHEET_NAME, source_rows)
+    for sheet_id, title in job_tabs(name):
+        store.open_by_key(sheet_id).worksheet(title).resize(*TAB_GRID)
+    if sheets is None:
+        gc = store
+    else:
+        sheets.store = store
+        sheets.reset()
+        gc = sheets_client(sheets)
+    odoo = OdooClient(url=server.url, db="bench", username="bench", password="bench")
+    return JobContext(options=options, odoo=odoo, gc=gc)
+
+
+def run_job(name, server, sheets, options, source_rows, verbose=False):
+    """One job in a fresh context; returns (status, wall seconds, input rows, requests, bytes, sheets stats)."""
+    ctx = make_context(name, server, sheets, options, source_rows)
+    tel = telemetry.configure(None)
+    before = server.snapshot()
+    out = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+    start = time.perf_counter()
+    with out:
+        [(_, status, _, error)] = run_dag([name], ctx)
+    wall = time.perf_counter() - start
+    after = server.snapshot()
+    if error is not None:
+        print(f"❌ {name}: {error!r}")
+    rows = sum(e["rows"] or 0 for e in tel.events if e["phase"] in INPUT_PHASES)
+    return (status, wall, rows, after.get("requests", 0) - before.get("requests", 0),
+            after.get("response_bytes", 0) - before.get("response_bytes", 0),
+            sheets.stats(name) if sheets is not None else {})
+
+
+def peak_memory(name, server, sheets, options, source_rows):
+    tracemalloc.start()
+    run_job(name, server, sheets, options, source_rows)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jobs", default="ALL", help="ALL or a comma-separated list of job names")
+    parser.add_argument("--records", type=int, default=5000, help="records per model and company")
+    parser.add_argument("--report_rows", type=int, default=5000, help="rows per XLSX report sheet")
+    parser.add_argument("--source_rows", type=int, default=20000, help="rows in the slider source sheet")
+    parser.add_argument("--latency_ms", type=float, default=0.0, help="mock latency per request")
+    parser.add_argument("--report_latency_ms", type=float, default=0.0, help="mock render time per report")
+    parser.add_argument("--invoice_lines", choices=["bulk", "nested"], default="bulk")
+    parser.add_argument("--fetch_engine", default="", help="search_read, export or JOB=ENGINE,... as in the CLI")
+    parser.add_argument("--sheets", choices=["http", "memory"], default="http",
+                        help="gspread against the fake Sheets server, or the in-memory stand-in")
+    parser.add_argument("--sheets_latency_ms", type=float, default=0.0, help="fake Sheets latency per request")
+    parser.add_argument("--read_quota", type=int, default=READ_QUOTA, help="Sheets reads per minute, 0 = unlimited")
+    parser.add_argument("--write_quota", type=int, default=WRITE_QUOTA, help="Sheets writes per minute, 0 = unlimited")
+    parser.add_argument("--no_memory", action="store_true", help="skip the traced pass")
+    parser.add_argument("--verbose", action="store_true", help="show the jobs' own output")
+    args = parser.parse_args()
+
+    try:
+        names = jobs.resolve(args.jobs)
+    except ValueError as e:
+        parser.error(str(e))
+    # The mock renders instantly unless --report_latency_ms says otherwise
+    reports.RENDER_WAIT = {}
+    options = {"paste_mode": "replace", "invoice_lines": args.invoice_lines,
+               "fetch_engine": jobs.fetch_engines(args.fetch_engine)}
+    warnings.simplefilter("ignore", DeprecationWarning)  # gspread's update() argument order
+
+    server = MockOdoo(records=args.records, report_rows=args.report_rows, latency_ms=args.latency_ms,
+                      report_latency_ms=args.report_latency_ms).start()
+    sheets = None
+    if args.sheets == "http":
+        sheets = FakeSheetsServer(latency_ms=args.sheets_latency_ms, read_quota=args.read_quota,
+                                  write_quota=args.write_quota).start()
+    print(f"mock Odoo {server.url}: {args.records} records/model, {args.report_rows} report rows, "
+          f"{args.latency_ms:g} ms latency, {args.report_latency_ms:g} ms render")
+    if sheets is not None:
+        print(f"fake Sheets {sheets.url}: {args.sheets_latency_ms:g} ms latency, "
+              f"quota {args.read_quota or '-'} reads / {args.write_quota or '-'} writes per minute")
+    print(f"{'job':<32} {'status':<7} {'wall s':>8} {'rows':>8} {'rows/s':>10} {'requests':>8} {'MiB in':>8} "
+          f"{'sheets':>6} {'cells':>9} {'MiB out':>8} {'429s':>5} {'peak MiB':>9}")
+    failed = 0
+    try:
+        for name in names:
+            status, wall, rows, requests, nbytes, sheet_stats = run_job(name, server, sheets, options,
+                                                                        args.source_rows, args.verbose)
+            peak = "" if args.no_memory else f"{peak_memory(name, server, sheets, options, args.source_rows) / 2**20:.1f}"
+            failed += status != "ok"
+            print(f"{name:<32} {status:<7} {wall:>8.2f} {rows:>8} {rows / wall:>10,.0f} {requests:>8} "
+                  f"{nbytes / 2**20:>8.2f} {sheet_stats.get('calls', ''):>6} {sheet_stats.get('cells_written', ''):>9} "
+                  f"{sheet_stats.get('bytes_in', 0) / 2**20:>8.2f} {sheet_stats.get('throttled', ''):>5} {peak:>9}")
+    finally:
+        server.shutdown()
+        if sheets is not None:
+            sheets.shutdown()
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
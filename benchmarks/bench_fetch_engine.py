@@ -0,0 +1,92 @@
+"""Fetch engine benchmark: web_search_read records vs export_data rows, at several row counts.
+
+For each job that supports ``--fetch_engine export`` (jobs.EXPORT_JOBS), fetches one
+company from the local mock Odoo server with the job's ``fetch_all_data`` (nested
+``web_search_read`` records, flattened) and its ``export_all_data`` (flat
+``export_data`` rows), builds both frames and checks they are identical. Reports
+wall time, client CPU (decode + flatten, on this thread only; the mock serves from
+other threads), requests and MiB received. Server side rendering cost is the mock's,
+not Odoo's: on a real server, compare with ``--telemetry`` runs of both engines.
+Run from the repo root:
+    python benchmarks/bench_fetch_engine.py --rows 1000,10000,50000
+"""
+import argparse
+import os
+import sys
+import time
+import warnings
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mock_odoo import MockOdoo
+from ordercycle import jobs
+from ordercycle.flatten import ColumnarFlattener
+from ordercycle.odoo import OdooClient
+
+FROM_DATE, TO_DATE = "2025-01-01 00:00:00", "2026-12-31 23:59:59"
+
+
+def fetchers(name):
+    """(search_read fetch, export fetch) of one job for company 1, both taking an OdooClient."""
+    module = jobs.load(name)
+    if name == "buyer_wise_pi_pending":
+        return lambda odoo: module.fetch_all_data(odoo, 1), lambda odoo: module.export_all_data(odoo, 1)
+    return (lambda odoo: module.fetch_all_data(odoo, FROM_DATE, TO_DATE, 1),
+            lambda odoo: module.export_all_data(odoo, FROM_DATE, TO_DATE, 1))
+
+
+def measure(server, fetch, flatten):
+    odoo = OdooClient(server.url, "bench", "bench", "bench")
+    odoo.login()
+    before = server.snapshot()
+    start, cpu = time.perf_counter(), time.thread_time()
+    df = flatten(fetch(odoo)).frame()
+    wall, cpu = time.perf_counter() - start, time.thread_time() - cpu
+    after = server.snapshot()
+    return df, wall, cpu, after["requests"] - before["requests"], after["response_bytes"] - before["response_bytes"]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", default="1000,10000,50000", help="records per model, comma separated")
+    parser.add_argument("--jobs", default=",".join(sorted(jobs.EXPORT_JOBS)))
+    parser.add_argument("--latency_ms", type=float, default=2.0, help="mock latency per request")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+    if not args.verbose:
+        sys.stdout = open(os.devnull, "w")
+    out = sys.__stdout__
+
+    ok = True
+    print(f"{'job':<30} {'rows':>7} {'engine':<12} {'wall s':>8} {'cpu s':>8} {'requests':>8} {'MiB in':>8}", file=out)
+    for rows in (int(n) for n in args.rows.split(",")):
+        server = MockOdoo(records=rows, latency_ms=args.latency_ms).start()
+        for name in (n.strip() for n in args.jobs.split(",")):
+            columns = jobs.load(name).FLAT_COLUMNS
+            search_read, export = fetchers(name)
+            runs = {
+                "search_read": measure(server, search_read, lambda r: ColumnarFlattener(columns).extend(r)),
+                "export": measure(server, export, lambda r: ColumnarFlattener(columns).extend_rows(r)),
+            }
+            for engine, (df, wall, cpu, requests, nbytes) in runs.items():
+                print(f"{name:<30} {rows:>7} {engine:<12} {wall:>8.2f} {cpu:>8.2f} {requests:>8} "
+                      f"{nbytes / 2**20:>8.2f}", file=out)
+            try:
+                pd.testing.assert_frame_equal(runs["search_read"][0], runs["export"][0])
+                same = "identical"
+            except AssertionError as e:
+                ok, same = False, f"DIFFER: {e}"
+            print(f"{'':<30} {'':>7} {'':<12} speedup {runs['search_read'][1] / runs['export'][1]:.2f}x wall, "
+                  f"{runs['search_read'][2] / runs['export'][2]:.2f}x cpu, "
+                  f"{runs['search_read'][4] / runs['export'][4]:.2f}x fewer bytes; frames {same}", file=out)
+        server.shutdown()
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+"""Governor benchmark: parallel runs against a saturated Odoo, with and without ordercycle.governor.
+
+Starts ``--processes`` worker processes (parallel job runs on one machine), each
+generating and downloading ``--reports`` reports and paging through a fetch, against
+the local mock Odoo server limited to ``--workers`` concurrent requests; requests
+queued longer than ``--queue_timeout_ms`` get a 504, like a saturated Odoo behind its
+proxy. Meanwhile a probe in this process reads a change marker every ``--probe_ms``
+(the cheap call the daemon and every job's first request make). Runs once with the
+governor off (GOVERNOR_DIR="") and once on, sharing a fresh slot directory, and
+reports the wall time, failed reports, 504s and the probe's latency.
+Run from the repo root:
+    python benchmarks/bench_governor.py --processes 8 --workers 3 --report_latency_ms 1500
+"""
+import argparse
+import contextlib
+import io
+import multiprocessing
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mock_odoo import MockOdoo
+from ordercycle.odoo import OdooClient
+
+MONTH = ("2025-06-01", "2025-06-30")
+
+
+def load(url, index, reports, verbose):
+    """One parallel run: ``reports`` report generations + downloads and a paged fetch each."""
+    if not verbose:
+        sys.stdout = open(os.devnull, "w")
+    odoo = OdooClient(url, "bench", "bench", "bench")
+    company_id = 1 if index % 2 else 3
+    failed = 0
+    start = time.perf_counter()
+    for _ in range(reports):
+        try:
+            wizard_id, report_info = odoo.prepare_report("invs", *MONTH, company_id)
+            odoo.download_report(wizard_id, report_info, *MONTH, company_id)
+            odoo.search_read_all("operation.details", [], {"qty": {}, "oa_id": {"fields": {"display_name": {}}}},
+                                 company_ids=[company_id], batch_size=200)
+        except Exception as e:
+            failed += 1
+            print(f"❌ {e!r}", file=sys.__stderr__ if verbose else sys.stdout)
+    return time.perf_counter() - start, failed
+
+
+def probe(odoo, stop, every, latencies, errors):
+    while not stop.wait(every):
+        start = time.perf_counter()
+        try:
+            odoo.change_marker("operation.details", 1)
+            latencies.append(time.perf_counter() - start)
+        except Exception:
+            errors.append(time.perf_counter() - start)
+
+
+def run(args, governor_dir):
+    os.environ["GOVERNOR_DIR"] = governor_dir  # read by the spawned workers' ordercycle.governor
+    server = MockOdoo(records=args.records, report_rows=args.report_rows, latency_ms=args.latency_ms,
+                      report_latency_ms=args.report_latency_ms, workers=args.workers,
+                      queue_timeout_ms=args.queue_timeout_ms).start()
+    odoo = OdooClient(server.url, "bench", "bench", "bench")
+    with contextlib.redirect_stdout(io.StringIO()):
+        odoo.login()
+    stop, latencies, errors = threading.Event(), [], []
+    prober = threading.Thread(target=probe, args=(odoo, stop, args.probe_ms / 1000, latencies, errors))
+    prober.start()
+    start = time.perf_counter()
+    with ProcessPoolExecutor(args.processes, mp_context=multiprocessing.get_context("spawn")) as pool:
+        results = list(pool.map(load, [server.url] * args.processes, range(args.processes),
+                                [args.reports] * args.processes, [args.verbose] * args.processes))
+    wall = time.perf_counter() - start
+    stop.set()
+    prober.join()
+    stats = server.snapshot()
+    server.shutdown()
+    return wall, sum(f for _, f in results), stats.get("gateway_timeout", 0), latencies, errors
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--processes", type=int, default=8, help="parallel runs")
+    parser.add_argument("--reports", type=int, default=3, help="reports per run")
+    parser.add_argument("--workers", type=int, default=3, help="Odoo requests served at a time")
+    parser.add_argument("--queue_timeout_ms", type=float, default=4000.0, help="504 after waiting this long")
+    parser.add_argument("--report_latency_ms", type=float, default=1500.0, help="render time per report")
+    parser.add_argument("--latency_ms", type=float, default=20.0, help="mock latency per request")
+    parser.add_argument("--records", type=int, default=1000, help="records paged through per report")
+    parser.add_argument("--report_rows", type=int, default=200)
+    parser.add_argument("--probe_ms", type=float, default=250.0)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    print(f"{args.processes} runs x {args.reports} reports, Odoo serving {args.workers} requests at a time, "
+          f"{args.report_latency_ms:.0f} ms render, 504 after {args.queue_timeout_ms:.0f} ms queued")
+    print(f"{'governor':<9} {'wall s':>8} {'failed':>7} {'504s':>6} {'probe p50':>10} {'probe p95':>10} "
+          f"{'probe max':>10} {'probe errs':>10}")
+    rows = {}
+    for label, governor_dir in (("off", ""), ("on", tempfile.mkdtemp(prefix="ordercycle-governor-"))):
+        wall, failed, timeouts, latencies, errors = rows[label] = run(args, governor_dir)
+        q = statistics.quantiles(latencies, n=20) if len(latencies) > 1 else [float("nan")] * 19
+        print(f"{label:<9} {wall:>8.2f} {failed:>7} {timeouts:>6} {statistics.median(latencies or [0]) * 1000:>8.0f}ms "
+              f"{q[18] * 1000:>8.0f}ms {max(latencies or [0]) * 1000:>8.0f}ms {len(errors):>10}")
+    return 0 if rows["on"][1] <= rows["off"][1] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""Benchmark: per-row apply TZP pipeline vs ordercycle.transforms (vectorized).
+
+Run from the repo root:
+    python benchmarks/bench_tzp_transform.py --rows 1000000
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ordercycle.transforms import STD_TZP_CODES, add_tzp_columns, aggregate_slider_wise
+
+
+def make_source(rows, seed=0):
+    """Synthetic 'Sheet1' rows, all strings as returned by get_all_values()."""
+    rng = np.random.default_rng(seed)
+    codes = STD_TZP_CODES + [f"TZP-{n}" for n in range(1000, 1200)]
+    sliders = np.array([f"#5 AL AUTO LOCK {c}" for c in codes] + ["#3 NYLON PIN LOCK", "", "#5 MT\xa0TZP-305\xa0"])
+    dates = pd.date_range("2024-03-01", "2025-06-30").strftime("%Y-%m-%d").to_numpy()
+    return pd.DataFrame({
+        "Release Date": rng.choice(dates, rows),
+        "Slider": rng.choice(sliders, rows),
+        "Quantity (PCS)": rng.integers(1, 5000, rows).astype(str),
+        "Unit Price": np.round(rng.uniform(0.01, 0.5, rows), 4).astype(str),
+        "Product": rng.choice(["Zipper", "Slider", "Puller"], rows),
+        "Category": rng.choice(["Metal", "Nylon", "Vislon", "Others"], rows),
+    })
+
+
+def legacy(df):
+    """The pipeline as it was written in slider_wise_order_realsed.py."""
+    df['Release Date'] = pd.to_datetime(df['Release Date'], errors='coerce')
+    df['Month'] = df['Release Date'].values.astype('datetime64[M]')
+    df['TZP_Code'] = df['Slider'].apply(
+        lambda x: re.search(r'TZP.*$', str(x)).group() if pd.notnull(x) and re.search(r'TZP.*$', str(x)) else "Others"
+    ).str.replace('\xa0', '', regex=False)
+    df['Quantity (PCS)'] = pd.to_numeric(df['Quantity (PCS)'], errors='coerce')
+    df['TZP_Type'] = df['TZP_Code'].apply(lambda x: "STD" if x in STD_TZP_CODES else "SPEC")
+    return df.groupby(
+        ["TZP_Type", "Product", "Category", "TZP_Code", "Month", "Release Date"], as_index=False
+    ).agg(
+        Quantity_PCS_sum=("Quantity (PCS)", "sum"),
+        Avg_Unit_Price=("Unit Price", lambda x: np.mean(pd.to_numeric(x, errors='coerce')))
+    )
+
+
+def vectorized(df):
+    return aggregate_slider_wise(add_tzp_columns(df))
+
+
+def timed(label, fn, df):
+    start = time.perf_counter()
+    out = fn(df.copy())
+    elapsed = time.perf_counter() - start
+    print(f"{label:<12} {elapsed:8.3f}s")
+    return out, elapsed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    source = make_source(args.rows)
+    print(f"Source: {args.rows} synthetic slider rows")
+    old, old_t = timed("legacy", legacy, source)
+    new, new_t = timed("vectorized", vectorized, source)
+    pd.testing.assert_frame_equal(old, new, check_dtype=False)
+    print(f"Identical output ({len(new)} groups), speedup {old_t / new_t:.1f}x")
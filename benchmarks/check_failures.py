@@ -0,0 +1,87 @@
+"""Failure check: a job whose company or tab failed must be reported failed.
+
+Runs the report jobs, PI_data and slider_wise_order_realsed through the scheduler
+against the local mock Odoo server and the in-memory Sheets stand-in, once
+healthy, once with every report download failing and once with one tab write
+failing per job. A failed job must keep its checkpoint, and its dependents
+(jobs.DEPENDS) must be skipped instead of reading output that was never updated.
+Runs on every push (.github/workflows/checks.yml). Run from the repo root (exit
+status 1 on regression):
+    python benchmarks/check_failures.py
+"""
+import contextlib
+import io
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_e2e import TAB_GRID, job_tabs, make_context
+from mock_odoo import MockOdoo
+from ordercycle import odoo, reports
+from ordercycle.jobs import order_released, pi_data
+from ordercycle.scheduler import run_dag
+
+JOBS = ["Order_realsed", "slider_wise_order_realsed", "Production_data_fetch", "production_dashboard", "PI_data"]
+FAILING_TABS = {"OA Value", "MT PI"}  # one tab of Order_realsed and of PI_data
+
+
+def failing_writes(write_frame):
+    def write(ws, df, *args, **kwargs):
+        if ws.title in FAILING_TABS:
+            raise RuntimeError(f"write to {ws.title} refused")
+        return write_frame(ws, df, *args, **kwargs)
+    return write
+
+
+def run(download_failures=0):
+    """run_dag over JOBS on a fresh mock and context; returns ({job: status}, jobs whose checkpoint was kept)."""
+    server = MockOdoo(records=200, report_rows=200, download_failures=download_failures).start()
+    try:
+        ctx = make_context(JOBS[0], server, None, {"paste_mode": "replace", "slider_source": "oa"}, 100)
+        for name in JOBS:
+            for sheet_id, title in job_tabs(name):
+                ctx.gc.open_by_key(sheet_id).worksheet(title).resize(*TAB_GRID)
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = run_dag(JOBS, ctx, workers=2)
+    finally:
+        server.shutdown()
+    return {name: status for name, status, *_ in results}, set(ctx._checkpoints)
+
+
+def check(label, statuses, kept, expected):
+    problems = [f"{name} {statuses[name]}, expected {status}" for name, status in expected.items()
+                if statuses[name] != status]
+    problems += [f"{name} dropped its checkpoint" for name, status in expected.items()
+                 if status == "failed" and name not in kept]
+    print(f"{'✅' if not problems else '❌'} {label}" + "".join(f"\n   {p}" for p in problems))
+    return not problems
+
+
+if __name__ == "__main__":
+    reports.RENDER_WAIT = {}
+    odoo.DOWNLOAD_ATTEMPTS = 1
+    ok = True
+
+    statuses, kept = run()
+    ok &= check("healthy run", statuses, kept, dict.fromkeys(JOBS, "ok"))
+
+    statuses, kept = run(download_failures=10**6)
+    ok &= check("report downloads failing", statuses, kept, {
+        "Order_realsed": "failed", "slider_wise_order_realsed": "skipped",
+        "Production_data_fetch": "failed", "production_dashboard": "failed", "PI_data": "ok"})
+
+    writes = order_released.write_frame, pi_data.write_frame
+    order_released.write_frame, pi_data.write_frame = map(failing_writes, writes)
+    try:
+        statuses, kept = run()
+    finally:
+        order_released.write_frame, pi_data.write_frame = writes
+    ok &= check(f"tab writes failing ({', '.join(sorted(FAILING_TABS))})", statuses, kept, {
+        "Order_realsed": "failed", "slider_wise_order_realsed": "skipped",
+        "Production_data_fetch": "ok", "production_dashboard": "ok", "PI_data": "failed"})
+
+    if not ok:
+        sys.exit(1)
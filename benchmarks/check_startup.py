@@ -0,0 +1,50 @@
+"""Startup budget check: cold start of every job must stay under a time budget.
+
+A cold start is a fresh interpreter importing the CLI and the job module (what
+`python -m ordercycle run --jobs X` does before the job begins). It also fails if
+a job imports gspread, google-auth or requests up front; those are deferred until
+the Sheets client or the Odoo session is first used.
+Runs on every push (.github/workflows/checks.yml). Run from the repo root (exit
+status 1 on regression):
+    python benchmarks/check_startup.py --budget_ms 1500
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from ordercycle.importprofile import importtime, job_import_code
+from ordercycle.jobs import JOBS
+
+DEFERRED = ["gspread", "google.oauth2", "requests"]
+
+
+def eager_imports(name):
+    code = f"import sys; {job_import_code(name)}; print(*[m for m in {DEFERRED!r} if m in sys.modules])"
+    proc = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return proc.stdout.split()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--budget_ms", type=float, default=float(os.getenv("STARTUP_BUDGET_MS", "1500")))
+    parser.add_argument("--runs", type=int, default=5, help="cold starts per job; the median is compared")
+    parser.add_argument("--jobs", default="ALL")
+    args = parser.parse_args()
+
+    names = list(JOBS) if args.jobs == "ALL" else args.jobs.split(",")
+    failures = []
+    print(f"Budget: {args.budget_ms:.0f} ms (median of {args.runs} cold starts)")
+    for name in names:
+        wall = statistics.median(importtime(job_import_code(name))[0] for _ in range(args.runs)) * 1000
+        eager = eager_imports(name)
+        ok = wall <= args.budget_ms and not eager
+        print(f"{'✅' if ok else '❌'} {name:<32} {wall:7.0f} ms" + (f"  imports {eager} eagerly" if eager else ""))
+        if not ok:
+            failures.append(name)
+    if failures:
+        print(f"Startup budget exceeded by: {', '.join(failures)}")
+        sys.exit(1)
@@ -0,0 +1,493 @@
+"""Offline stand-ins for Google Sheets.
+
+``FakeSheetsClient`` replaces ``ctx.gc`` with plain in-memory objects (no HTTP,
+no gspread). ``FakeSheetsServer`` serves the Sheets v4 / Drive v3 REST calls
+gspread makes from the same in-memory store, so the real ``gspread.Client``
+returned by ``sheets_client(server)`` can be pointed at it: its request
+building, JSON encoding and response handling are then part of what is timed.
+The server adds a per-request latency, enforces per-minute read / write quotas
+(429 RESOURCE_EXHAUSTED, as the API does) and records calls, cells written and
+payload bytes per job (the scheduler's current job is sent as a header).
+
+Standalone:
+    python benchmarks/fake_sheets.py --port 8070 --latency_ms 150 --write_quota 60
+"""
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from datetime import date, datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from mock_odoo import SLIDERS
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ordercycle import retry, sheets
+from ordercycle.telemetry import current_job
+
+_A1 = re.compile(r"^([A-Z]*)(\d*)$")
+JOB_HEADER = "X-Ordercycle-Job"
+# Default per-minute quotas of the Sheets API (per user per project)
+READ_QUOTA = 60
+WRITE_QUOTA = 60
+
+
+def col_index(letters: str) -> int:
+    n = 0
+    for ch in letters:
+        n = n * 26 + ord(ch) - 64
+    return n
+
+
+def col_letters(n: int) -> str:
+    letters = ""
+    while n:
+        n, rem = divmod(n - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def parse_range(a1: str):
+    """"'T'!A1:C5" / "A:C" / "2:2" / "AC2" / "'T'" -> (title or None, r1, c1, r2, c2); open ends are None."""
+    title = None
+    if "!" in a1:
+        title, a1 = a1.rsplit("!", 1)
+    start, _, end = a1.partition(":")
+    end = end or start
+    match_start, match_end = _A1.match(start.upper()), _A1.match(end.upper())
+    if title is None and (a1.startswith("'") or not (match_start and match_end)):
+        title, match_start, match_end = a1, _A1.match(""), _A1.match("")  # a bare sheet title
+    if title is not None:
+        title = title.strip("'").replace("''", "'")
+    (c1, r1), (c2, r2) = match_start.groups(), match_end.groups()
+    return (title,
+            int(r1) if r1 else None, col_index(c1) if c1 else None,
+            int(r2) if r2 else None, col_index(c2) if c2 else None)
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+# --------- In-memory store ---------
+class FakeWorksheet:
+    def __init__(self, title, rows=1000, cols=26, sheet_id=0, spreadsheet=None):
+        self.title = title
+        self.id = sheet_id
+        self.row_count = rows
+        self.col_count = cols
+        self.cells = []  # list of row lists, ragged
+        self.spreadsheet = spreadsheet
+        self._lock = threading.Lock()
+
+    def _touch(self):
+        if self.spreadsheet is not None:
+            self.spreadsheet.lastUpdateTime = _now()
+
+    # --------- reads ---------
+    def _slice(self, r1, c1, r2, c2):
+        r1, c1 = r1 or 1, c1 or 1
+        r2 = r2 or len(self.cells)
+        rows = []
+        for row in self.cells[r1 - 1:r2]:
+            rows.append(row[c1 - 1:c2] if c2 else row[c1 - 1:])
+        while rows and not any(v != "" for v in rows[-1]):
+            rows.pop()
+        return [self._trim(r) for r in rows]
+
+    @staticmethod
+    def _trim(row):
+        row = list(row)
+        while row and row[-1] == "":
+            row.pop()
+        return row
+
+    def get(self, range_name=None, **kwargs):
+        with self._lock:
+            if range_name is None:
+                return self._slice(1, 1, None, None)
+            _, r1, c1, r2, c2 = parse_range(range_name)
+            return self._slice(r1, c1, r2, c2)
+
+    def get_all_values(self):
+        return self.get()
+
+    # --------- writes ---------
+    def _put(self, r1, c1, values):
+        need_rows = r1 - 1 + len(values)
+        need_cols = c1 - 1 + max((len(r) for r in values), default=0)
+        if need_rows > self.row_count or need_cols > self.col_count:
+            raise ValueError(f"Range ('{self.title}'!R{r1}C{c1}) exceeds grid limits. "
+                             f"Max rows: {self.row_count}, max columns: {self.col_count}")
+        while len(self.cells) < need_rows:
+            self.cells.append([])
+        for i, vals in enumerate(values):
+            row = self.cells[r1 - 1 + i]
+            if len(row) < c1 - 1 + len(vals):
+                row.extend([""] * (c1 - 1 + len(vals) - len(row)))
+            row[c1 - 1:c1 - 1 + len(vals)] = vals
+        self._touch()
+
+    def update(self, *args, values=None, range_name=None, **kwargs):
+        # gspread 6 takes (values, range_name); the jobs also use the older (range_name, values)
+        for arg in args:
+            if isinstance(arg, str):
+                range_name = arg
+            else:
+                values = arg
+        _, r1, c1, _, _ = parse_range(range_name or "A1")
+        with self._lock:
+            self._put(r1 or 1, c1 or 1, values)
+        return {"updatedCells": sum(len(r) for r in values)}
+
+    def append(self, values):
+        with self._lock:
+            self._put(len(self.cells) + 1, 1, values)
+
+    def batch_update(self, data, **kwargs):
+        for item in data:
+            self.update(item["values"], item["range"])
+
+    def batch_clear(self, ranges):
+        with self._lock:
+            for a1 in ranges:
+                _, r1, c1, r2, c2 = parse_range(a1)
+                for row in self.cells[(r1 or 1) - 1:r2 or len(self.cells)]:
+                    stop = min(c2 or len(row), len(row))
+                    for c in range((c1 or 1) - 1, stop):
+                        row[c] = ""
+            self._touch()
+
+    def clear(self):
+        with self._lock:
+            self.cells = []
+            self._touch()
+
+    def resize(self, rows=None, cols=None):
+        self.row_count = rows or self.row_count
+        self.col_count = cols or self.col_count
+
+
+class FakeSpreadsheet:
+    def __init__(self, key):
+        self.id = key
+        self.lastUpdateTime = "2025-01-01T00:00:00.000Z"
+        self._sheets = {}
+        self._lock = threading.Lock()
+
+    def get_lastUpdateTime(self):
+        return self.lastUpdateTime
+
+    def worksheet(self, title):
+        with self._lock:
+            if title not in self._sheets:
+                self._sheets[title] = FakeWorksheet(title, sheet_id=len(self._sheets), spreadsheet=self)
+            return self._sheets[title]
+
+    def worksheets(self):
+        return list(self._sheets.values())
+
+    def values_get(self, range_name, params=None):
+        title = parse_range(range_name)[0]
+        return {"range": range_name, "values": self.worksheet(title).get(range_name.rsplit("!", 1)[-1])}
+
+    def values_batch_get(self, ranges, params=None):
+        columns = (params or {}).get("majorDimension") == "COLUMNS"
+        value_ranges = []
+        for range_name in ranges:
+            values = self.values_get(range_name)["values"]
+            if columns:
+                values = _transpose(values)
+            value_ranges.append({"range": range_name, "values": values})
+        return {"valueRanges": value_ranges}
+
+
+def _transpose(values):
+    width = max((len(r) for r in values), default=0)
+    return [FakeWorksheet._trim([r[c] if c < len(r) else "" for r in values]) for c in range(width)]
+
+
+class FakeSheetsClient:
+    """Drop-in for ``ctx.gc``; spreadsheets and worksheets are created on first access."""
+
+    def __init__(self):
+        self.spreadsheets = {}
+        self._lock = threading.Lock()
+
+    def open_by_key(self, key):
+        with self._lock:
+            if key not in self.spreadsheets:
+                self.spreadsheets[key] = FakeSpreadsheet(key)
+            return self.spreadsheets[key]
+
+    def seed_slider_source(self, sheet_id, title, rows, seed=0):
+        """Released-order rows in the source layout the slider-wise job reads (header on row 2)."""
+        rnd = random.Random(seed)
+        ws = self.open_by_key(sheet_id).worksheet(title)
+        ws.resize(rows + 2, 26)
+        header = ["Release Date", "OA", "Slider", "Quantity (PCS)", "Unit Price", "Product", "Category"]
+        data = [[""], header]
+        for _ in range(rows):
+            day = date(2024, 4, 1) + timedelta(days=rnd.randrange(540))
+            data.append([
+                day.isoformat(), f"OA/{rnd.randrange(1, 99999):06d}", f"#{rnd.randrange(3, 10)} {rnd.choice(SLIDERS)}",
+                str(rnd.randrange(1, 20_000)), f"{rnd.uniform(0.01, 2):.4f}",
+                rnd.choice(["Metal Zipper", "Nylon Zipper", "Vislon Zipper"]), rnd.choice(["Others", "Jeans", "Bag"]),
+            ])
+        ws.update(data, "A1")
+        return ws
+
+
+# --------- Sheets v4 / Drive v3 over HTTP ---------
+def _formatted(value):
+    """FORMATTED_VALUE rendering of a stored cell."""
+    if isinstance(value, bool):
+        return str(value).upper()
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _cells(values):
+    return sum(len(row) for row in values or [])
+
+
+class FakeSheetsServer(ThreadingHTTPServer):
+    """Sheets REST stand-in over a ``FakeSheetsClient`` store; see the module docstring."""
+
+    daemon_threads = True
+
+    def __init__(self, address=("127.0.0.1", 0), store=None, latency_ms=0.0, read_quota=READ_QUOTA,
+                 write_quota=WRITE_QUOTA, quota_window_s=60.0):
+        super().__init__(address, _SheetsHandler)
+        self.store = store or FakeSheetsClient()
+        self.latency = latency_ms / 1000
+        self.quotas = {"read": read_quota, "write": write_quota}  # 0 = unlimited
+        self.quota_window = quota_window_s
+        self._recent = {"read": deque(), "write": deque()}
+        self.lock = threading.Lock()
+        self.calls = defaultdict(lambda: defaultdict(int))  # job -> counter
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def admit(self, kind):
+        """Count one request against the ``kind`` quota; False once the window is full."""
+        limit = self.quotas[kind]
+        now = time.monotonic()
+        with self.lock:
+            recent = self._recent[kind]
+            while recent and now - recent[0] >= self.quota_window:
+                recent.popleft()
+            if limit and len(recent) >= limit:
+                return False
+            recent.append(now)
+            return True
+
+    def record(self, job, **counts):
+        with self.lock:
+            stats = self.calls[job or "-"]
+            for key, n in counts.items():
+                stats[key] += n
+
+    def stats(self, job=None):
+        """Counters of ``job`` (or summed over all jobs): calls, reads, writes, throttled, cells, bytes."""
+        with self.lock:
+            rows = [self.calls[job]] if job else list(self.calls.values())
+            total = defaultdict(int)
+            for stats in rows:
+                for key, n in stats.items():
+                    total[key] += n
+            return dict(total)
+
+    def reset(self):
+        with self.lock:
+            self.calls.clear()
+            for recent in self._recent.values():
+                recent.clear()
+
+
+class _SheetsHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, payload, status=200, kind=None, received=0, cells=0):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=UTF-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        counts = {"calls": 1, "bytes_in": received, "bytes_out": len(body)}
+        if status == 429:
+            counts["throttled"] = 1
+        elif kind:
+            counts[f"{kind}s"] = 1
+            counts["cells_written"] = cells
+        self.server.record(self.headers.get(JOB_HEADER), **counts)
+
+    def _error(self, status, message, reason, received=0):
+        self._reply({"error": {"code": status, "message": message, "status": reason}}, status, received=received)
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_PUT(self):
+        self._handle("PUT")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def _handle(self, method):
+        raw = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = json.loads(raw) if raw else {}
+        split = urlsplit(self.path)
+        query = parse_qs(split.query)
+        path = split.path
+        kind = "read" if method == "GET" else "write"
+        time.sleep(self.server.latency)
+        if not self.server.admit(kind):
+            return self._error(429, f"Quota exceeded for quota metric '{kind.title()} requests' "
+                                    f"and limit '{kind.title()} requests per minute per user'",
+                               "RESOURCE_EXHAUSTED", len(raw))
+        try:
+            if path.startswith("/drive/v3/files/"):
+                return self._drive_file(path.rsplit("/", 1)[1])
+            key, _, rest = path.removeprefix("/v4/spreadsheets/").partition("/")
+            key, _, action = key.partition(":")
+            sh = self.server.store.open_by_key(key)
+            if not rest:
+                if action == "batchUpdate":
+                    return self._batch_update(sh, body, len(raw))
+                return self._reply(self._metadata(sh), kind=kind)
+            rest = rest.removeprefix("values")
+            if rest.startswith(":"):
+                return self._values_batch(sh, rest[1:], query, body, len(raw))
+            range_name, _, action = rest.lstrip("/").partition(":")
+            return self._values(sh, method, unquote(range_name), action, query, body, len(raw))
+        except (ValueError, KeyError) as e:
+            self._error(400, str(e), "INVALID_ARGUMENT", len(raw))
+
+    # --------- spreadsheets ---------
+    def _metadata(self, sh):
+        return {
+            "spreadsheetId": sh.id,
+            "properties": {"title": sh.id, "locale": "en_US", "timeZone": "Asia/Dhaka"},
+            "sheets": [{"properties": {
+                "sheetId": ws.id, "title": ws.title, "index": ws.id, "sheetType": "GRID",
+                "gridProperties": {"rowCount": ws.row_count, "columnCount": ws.col_count},
+            }} for ws in sh.worksheets()],
+        }
+
+    def _drive_file(self, key):
+        sh = self.server.store.open_by_key(key)
+        self._reply({"id": key, "name": key, "createdTime": "2024-01-01T00:00:00.000Z",
+                     "modifiedTime": sh.lastUpdateTime}, kind="read")
+
+    def _batch_update(self, sh, body, received):
+        by_id = {ws.id: ws for ws in sh.worksheets()}
+        for request in body.get("requests", []):
+            props = request.get("updateSheetProperties", {}).get("properties")
+            if props:
+                grid = props.get("gridProperties", {})
+                by_id[props["sheetId"]].resize(grid.get("rowCount"), grid.get("columnCount"))
+        self._reply({"spreadsheetId": sh.id, "replies": [{} for _ in body.get("requests", [])]},
+                    kind="write", received=received)
+
+    # --------- values ---------
+    def _read(self, sh, range_name, query):
+        title, r1, c1, r2, c2 = parse_range(range_name)
+        values = sh.worksheet(title)._slice(r1, c1, r2, c2)
+        if query.get("valueRenderOption", ["FORMATTED_VALUE"])[0] != "UNFORMATTED_VALUE":
+            values = [[_formatted(v) for v in row] for row in values]
+        if query.get("majorDimension", ["ROWS"])[0] == "COLUMNS":
+            return {"range": range_name, "majorDimension": "COLUMNS", "values": _transpose(values)}
+        return {"range": range_name, "majorDimension": "ROWS", "values": values}
+
+    def _write(self, sh, range_name, values):
+        title, r1, c1, _, _ = parse_range(range_name)
+        ws = sh.worksheet(title)
+        ws.update(values, f"{col_letters(c1 or 1)}{r1 or 1}")
+        return {"spreadsheetId": sh.id, "updatedRange": range_name, "updatedRows": len(values),
+                "updatedColumns": max((len(r) for r in values), default=0), "updatedCells": _cells(values)}
+
+    def _values(self, sh, method, range_name, action, query, body, received):
+        if method == "GET":
+            return self._reply(self._read(sh, range_name, query), kind="read")
+        if action == "clear":
+            title = parse_range(range_name)[0]
+            sh.worksheet(title).batch_clear([range_name.rsplit("!", 1)[-1]] if "!" in range_name else ["A:ZZZ"])
+            return self._reply({"spreadsheetId": sh.id, "clearedRange": range_name}, kind="write", received=received)
+        values = body.get("values", [])
+        if action == "append":
+            ws = sh.worksheet(parse_range(range_name)[0])
+            ws.append(values)
+            return self._reply({"spreadsheetId": sh.id, "updates": {"updatedCells": _cells(values)}},
+                               kind="write", received=received, cells=_cells(values))
+        self._reply(self._write(sh, range_name, values), kind="write", received=received, cells=_cells(values))
+
+    def _values_batch(self, sh, action, query, body, received):
+        if action == "batchGet":
+            ranges = [self._read(sh, r, query) for r in query.get("ranges", [])]
+            return self._reply({"spreadsheetId": sh.id, "valueRanges": ranges}, kind="read")
+        if action == "batchClear":
+            for range_name in body.get("ranges", []):
+                title = parse_range(range_name)[0]
+                sh.worksheet(title).batch_clear([range_name.rsplit("!", 1)[-1]])
+            return self._reply({"spreadsheetId": sh.id, "clearedRanges": body.get("ranges", [])},
+                               kind="write", received=received)
+        if action == "batchUpdate":
+            responses = [self._write(sh, item["range"], item["values"]) for item in body.get("data", [])]
+            cells = sum(r["updatedCells"] for r in responses)
+            return self._reply({"spreadsheetId": sh.id, "totalUpdatedCells": cells, "responses": responses},
+                               kind="write", received=received, cells=cells)
+        raise ValueError(f"unsupported values action {action!r}")
+
+
+def sheets_client(server):
+    """A real ``gspread.Client`` whose Sheets and Drive calls go to ``server``."""
+    import gspread
+    import requests
+
+    class _LocalSession(requests.Session):
+        def request(self, method, url, *args, headers=None, **kwargs):
+            for prefix in ("https://sheets.googleapis.com", "https://www.googleapis.com"):
+                if url.startswith(prefix):
+                    url = server.url + url[len(prefix):]
+            headers = dict(headers or {})
+            job = current_job.get()
+            if job:
+                headers[JOB_HEADER] = job
+            return super().request(method, url, *args, headers=headers, **kwargs)
+
+    session = _LocalSession()
+    retry.mount(session, sheets.endpoint)  # as JobContext.gc does
+    return gspread.Client(None, session=session)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=8070)
+    parser.add_argument("--latency_ms", type=float, default=0.0, help="added to every request")
+    parser.add_argument("--read_quota", type=int, default=READ_QUOTA, help="read requests per minute, 0 = unlimited")
+    parser.add_argument("--write_quota", type=int, default=WRITE_QUOTA, help="write requests per minute, 0 = unlimited")
+    args = parser.parse_args()
+
+    server = FakeSheetsServer(("127.0.0.1", args.port), latency_ms=args.latency_ms,
+                              read_quota=args.read_quota, write_quota=args.write_quota)
+    print(f"Fake Sheets API on {server.url} (redirect gspread with benchmarks.fake_sheets.sheets_client)")
+    server.serve_forever()
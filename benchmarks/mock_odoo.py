@@ -0,0 +1,407 @@
+"""Local stand-in for the Odoo endpoints the jobs call, serving synthetic data.
+
+Implements /web/session/authenticate, /web (CSRF token), /web/dataset/call_kw/*
+(web_search_read, read, search, fields_get, export_data, create, web_save),
+/web/dataset/call_button and /report/download (mrp.report.custom XLSX). Records
+are generated from the request's ``specification``, so every job's model and
+field set is served without per-job fixtures; ``export_data`` rebuilds the
+specification from its field paths and serves the same records as export rows.
+With ``workers`` it serves that many POSTs at a time, like Odoo's worker processes,
+and answers 504 to requests queued longer than ``queue_timeout_ms``; the first
+``download_failures`` report downloads return 200 with an error body, and
+``expire_sessions()`` makes requests of earlier sessions fail as expired.
+GET /mock/stats returns request counters.
+
+Standalone:
+    python benchmarks/mock_odoo.py --port 8069 --records 20000 --latency_ms 20
+then point ODOO_URL at http://127.0.0.1:8069.
+"""
+import argparse
+import io
+import json
+import random
+import threading
+import time
+from collections import Counter
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+XLSX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+NUMERIC_HINTS = ("qty", "total", "price", "amount")
+DATE_FIELDS = {"pi_date", "invoice_date", "delivery_date"}          # fields.Date
+DATETIME_FIELDS = {"action_date", "date_order"}                     # fields.Datetime
+X2MANY_FIELDS = {"invoice_lines"}
+MANY2ONE_FIELDS = {"sale_order_line", "buyer_name", "brand", "group", "buying_house", "buyer_group"}  # besides *_id
+RELATIONS = {"order_id": "sale.order", "product_template_id": "product.template"}  # else "mock.<field>"
+SELECTIONS = {
+    "state": ["sale", "posted", "waiting", "partial"],
+    "invoice_status": ["invoiced", "to invoice", "no"],
+    "pi_type": ["regular"],
+    "fg_categ_type": ["Metal", "Nylon", "Vislon", "Plastic"],
+}
+SLIDERS = ["TZP-294", "TZP-305", "TZP-1862", "TZP-9001", "TZP-9020", "Auto Lock", "Pin Lock"]
+
+
+# -------- SYNTHETIC VALUES --------
+def _date(rnd, with_time=False):
+    day = date(2025, 1, 1) + timedelta(days=rnd.randrange(600))
+    return f"{day.isoformat()} {rnd.randrange(24):02d}:{rnd.randrange(60):02d}:00" if with_time else day.isoformat()
+
+
+def _scalar(field, rnd):
+    if field in DATETIME_FIELDS:
+        return _date(rnd, with_time=True)
+    if field in DATE_FIELDS or "date" in field:
+        return _date(rnd)
+    if any(hint in field for hint in NUMERIC_HINTS):
+        return round(rnd.uniform(1, 5000), 2)
+    if field in SELECTIONS:
+        return rnd.choice(SELECTIONS[field])
+    if field == "slidercodesfg":
+        return rnd.choice(SLIDERS)
+    if rnd.random() < 0.03:
+        return False  # empty char fields come back as False
+    return f"{field.replace('_', ' ').title()} {rnd.randrange(1, 300)}"
+
+
+def _relation_id(field, rnd):
+    return rnd.randrange(1, 5000)
+
+
+def _field_type(model, field):
+    """fields_get type of ``field``, guessed from its name like the values above."""
+    if field in X2MANY_FIELDS:
+        return "one2many"
+    if field.endswith("_id") or field in MANY2ONE_FIELDS or (model, field) == ("product.template", "fg_categ_type"):
+        return "many2one"
+    if field in SELECTIONS:
+        return "selection"
+    if field in DATETIME_FIELDS:
+        return "datetime"
+    if field in DATE_FIELDS or "date" in field:
+        return "date"
+    if any(hint in field for hint in NUMERIC_HINTS):
+        return "float"
+    return "char"
+
+
+def _label(value):
+    return value.title()
+
+
+def _record(spec, rnd, record_id=None):
+    """One web_search_read record shaped like ``specification``."""
+    rec = {"id": record_id if record_id is not None else _relation_id("id", rnd)}
+    for field, sub in sorted(spec.items()):
+        fields = (sub or {}).get("fields")
+        if field in X2MANY_FIELDS:
+            n = rnd.randrange(0, 3)
+            rec[field] = [_record(fields, rnd) for _ in range(n)] if fields else [_relation_id(field, rnd) for _ in range(n)]
+        elif fields is not None:
+            if rnd.random() < 0.03:
+                rec[field] = False
+            else:
+                sub_rec = _record({k: v for k, v in fields.items() if k != "display_name"}, rnd)
+                if "display_name" in fields:
+                    sub_rec["display_name"] = f"{field.removesuffix('_id').replace('_', ' ').title()} {rnd.randrange(1, 200)}"
+                rec[field] = sub_rec
+        elif field.endswith("_id") or field in MANY2ONE_FIELDS:
+            rec[field] = _relation_id(field, rnd) if rnd.random() > 0.03 else False
+        else:
+            rec[field] = _scalar(field, rnd)
+    return rec
+
+
+def _export_spec(model, paths):
+    """The web_search_read specification whose records hold every ``export_data`` path."""
+    tree = {}
+    for path in paths:
+        keys, node, current = path.split("/"), tree, model
+        for key in keys[:-1]:
+            node = node.setdefault(key, {})
+            current = RELATIONS.get(key, f"mock.{key}")
+        if keys[-1] == ".id":
+            continue
+        if _field_type(current, keys[-1]) == "many2one":
+            node.setdefault(keys[-1], {})["display_name"] = None
+        else:
+            node[keys[-1]] = None
+
+    def spec(node):
+        return {k: {"fields": spec(v)} if v else {} for k, v in node.items()}
+    return spec(tree)
+
+
+def _export_getter(model, path):
+    """``get(rec) -> export_data value`` of one field path."""
+    keys, current = path.split("/"), model
+    for key in keys[:-1]:
+        current = RELATIONS.get(key, f"mock.{key}")
+    parents, leaf = keys[:-1], keys[-1]
+    kind = "id" if leaf == ".id" else _field_type(current, leaf)
+
+    def get(rec):
+        for key in parents:
+            rec = rec.get(key) if rec else False
+        if not rec:
+            return ""
+        if kind == "id":
+            return str(rec["id"] if isinstance(rec, dict) else rec)
+        value = rec.get(leaf)
+        if kind == "many2one":
+            return value["display_name"] if isinstance(value, dict) else value or ""
+        if kind == "selection":
+            return _label(value) if value else ""
+        return "" if value is False else value
+    return get
+
+
+def _read_record(record_id, fields):
+    rnd = random.Random(record_id)
+    rec = {"id": record_id}
+    for field in fields:
+        if field in X2MANY_FIELDS:
+            rec[field] = [record_id * 10 + k for k in range(rnd.randrange(0, 3))]
+        elif field == "display_name":
+            rec[field] = f"INV/{record_id:07d}"
+        else:
+            rec[field] = _scalar(field, rnd)
+    return rec
+
+
+def report_xlsx(report_type, rows, date_from, date_to, seed=0):
+    """mrp.report.custom XLSX bytes; "r_invs" has the OA pcs and value sheets."""
+    import pandas as pd
+
+    rnd = random.Random(f"{report_type}{seed}")
+    start = pd.Timestamp(date_from)
+    span_days = max((pd.Timestamp(date_to) - start).days + 1, 1)
+    dates = [(start + pd.Timedelta(days=rnd.randrange(span_days))).date() for _ in range(rows)]
+    oa = [f"OA/{rnd.randrange(1, rows + 1):06d}" for _ in range(rows)]
+    qty = [rnd.randrange(1, 20_000) for _ in range(rows)]
+    buf = io.BytesIO()
+    with pd.ExcelWriter(buf, engine="openpyxl") as writer:
+        if report_type == "r_invs":
+            pd.DataFrame({
+                "Release Date": dates, "OA": oa,
+                "Customer": [f"Customer {rnd.randrange(1, 400)}" for _ in range(rows)],
+                "Slider": [f"#{rnd.randrange(3, 10)} {rnd.choice(SLIDERS)}" for _ in range(rows)],
+                "Product": [rnd.choice(["Metal Zipper", "Nylon Zipper", "Vislon Zipper"]) for _ in range(rows)],
+                "Category": [rnd.choice(["Others", "Jeans", "Jacket", "Bag"]) for _ in range(rows)],
+                "Quantity (PCS)": qty,
+                "Unit Price": [round(rnd.uniform(0.01, 2), 4) for _ in range(rows)],
+            }).to_excel(writer, index=False, sheet_name="OA pcs")
+            pd.DataFrame({"Release Date": dates, "OA": oa,
+                          "Value (USD)": [round(q * rnd.uniform(0.01, 2), 2) for q in qty]}
+                         ).to_excel(writer, index=False, sheet_name="OA usd")
+        else:
+            pd.DataFrame({
+                "Date": dates, "OA": oa,
+                "Process": [rnd.choice(["Dyeing", "Plating", "Assembly", "Packing"]) for _ in range(rows)],
+                "Quantity": qty,
+            }).to_excel(writer, index=False)
+    return buf.getvalue()
+
+
+# -------- HTTP --------
+class MockOdoo(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address=("127.0.0.1", 0), records=5000, report_rows=5000, latency_ms=0.0,
+                 report_latency_ms=0.0, seed=0, workers=0, queue_timeout_ms=0.0, download_failures=0):
+        super().__init__(address, _Handler)
+        self.records = records
+        self.report_rows = report_rows
+        self.latency = latency_ms / 1000
+        self.report_latency = report_latency_ms / 1000
+        self.seed = seed
+        # Odoo's worker processes: each POST holds one, waiting at most queue_timeout_ms before a 504
+        self.workers = threading.BoundedSemaphore(workers) if workers else None
+        self.queue_timeout = queue_timeout_ms / 1000 or None
+        # The first downloads fail the way a failed render does: 200 with an error body
+        self.download_failures = download_failures
+        self.session_generation = 0  # bumped by expire_sessions(); 0 = sessions never expire
+        self.stats = Counter()
+        self.lock = threading.Lock()
+        self.wizards = {}
+        self.reports = {}
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, key, nbytes):
+        with self.lock:
+            self.stats["requests"] += 1
+            self.stats[key] += 1
+            self.stats["response_bytes"] += nbytes
+
+    def snapshot(self):
+        with self.lock:
+            return dict(self.stats)
+
+    def expire_sessions(self):
+        """Invalidate every session, as Odoo does once a session times out."""
+        with self.lock:
+            self.session_generation += 1
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, key, body, content_type="application/json", status=200, headers=None):
+        if isinstance(body, (dict, list)):
+            body = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+        self.server.count(key, len(body))
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == "/mock/stats":
+            return self._send("stats", self.server.snapshot())
+        time.sleep(self.server.latency)
+        self._send("web", b'<script>var odoo = {\n    csrf_token: "mockcsrf0123456789",</script>', "text/html")
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        workers = self.server.workers
+        if workers is not None and not workers.acquire(timeout=self.server.queue_timeout):
+            return self._send("gateway_timeout", b"", "text/plain", status=504)
+        try:
+            self._post(body)
+        finally:
+            if workers is not None:
+                workers.release()
+
+    def _session_valid(self):
+        generation = self.server.session_generation
+        return not generation or f"session_id=mock{generation}" in self.headers.get("Cookie", "")
+
+    def _post(self, body):
+        time.sleep(self.server.latency)
+        path = urlsplit(self.path).path
+        if path != "/web/session/authenticate" and not self._session_valid():
+            if path == "/report/download":
+                return self._send("session_expired", b"", "text/html", status=303, headers={"Location": "/web/login"})
+            error = {"code": 100, "message": "Odoo Session Expired",
+                     "data": {"name": "odoo.http.SessionExpiredException", "message": "Session expired"}}
+            return self._send("session_expired", {"jsonrpc": "2.0", "error": error})
+        if path == "/report/download":
+            return self._download(parse_qs(body.decode()))
+        params = json.loads(body or b"{}").get("params", {})
+        if path == "/web/session/authenticate":
+            cookie = f"session_id=mock{self.server.session_generation}; Path=/"
+            return self._send("authenticate", {"jsonrpc": "2.0", "result": {"uid": 2, "db": params.get("db")}},
+                              headers={"Set-Cookie": cookie})
+        if path == "/web/dataset/call_button":
+            result = {"report_name": "taps_manufacturing.pi_xls_template", "type": "ir.actions.report"}
+            return self._send("call_button", {"jsonrpc": "2.0", "result": result})
+        if path.startswith("/web/dataset/call_kw/"):
+            return self._call_kw(params)
+        self.send_error(404)
+
+    def _call_kw(self, params):
+        model, method, kwargs = params["model"], params["method"], params.get("kwargs", {})
+        server = self.server
+        if method == "web_search_read":
+            offset, limit = kwargs.get("offset", 0), kwargs.get("limit") or server.records
+            company = kwargs.get("context", {}).get("current_company_id", 1)
+            records = [
+                _record(kwargs["specification"], random.Random(f"{server.seed}{model}{company}{i}"), record_id=i + 1)
+                for i in range(offset, min(offset + limit, server.records))
+            ]
+            result = {"length": server.records, "records": records}
+        elif method == "search":
+            result = list(range(1, server.records + 1))
+        elif method == "fields_get":
+            result = {}
+            for field in params["args"][0]:
+                kind = _field_type(model, field)
+                result[field] = {"type": kind}
+                if kind in ("many2one", "one2many"):
+                    result[field]["relation"] = RELATIONS.get(field, f"mock.{field}")
+                if kind == "selection":
+                    result[field]["selection"] = [[v, _label(v)] for v in SELECTIONS[field]]
+        elif method == "export_data":
+            ids, paths = params["args"]
+            company = kwargs.get("context", {}).get("current_company_id", 1)
+            spec = _export_spec(model, paths)
+            getters = [_export_getter(model, path) for path in paths]
+            datas = []
+            for record_id in ids:
+                rec = _record(spec, random.Random(f"{server.seed}{model}{company}{record_id - 1}"), record_id=record_id)
+                datas.append([get(rec) for get in getters])
+            result = {"datas": datas}
+        elif method == "read":
+            ids, fields = params["args"]
+            result = [_read_record(i, fields) for i in ids]
+        elif method == "create":
+            with server.lock:
+                result = len(server.wizards) + 1
+                server.wizards[result] = {}
+        elif method == "web_save":
+            with server.lock:
+                wizard_id = len(server.wizards) + 1
+                server.wizards[wizard_id] = params["args"][1]
+            result = [{"id": wizard_id, **params["args"][1]}]
+        else:
+            result = True
+        self._send(f"{model}.{method}", {"jsonrpc": "2.0", "id": 1, "result": result})
+
+    def _download(self, form):
+        time.sleep(self.server.report_latency)
+        with self.server.lock:
+            fail, self.server.download_failures = self.server.download_failures > 0, max(0, self.server.download_failures - 1)
+        if fail:
+            error = {"code": 200, "message": "Odoo Server Error",
+                     "data": {"name": "builtins.MemoryError", "message": "Report rendering failed"}}
+            return self._send("report_error", json.dumps(error).encode(), "text/html")
+        report_path = json.loads(form["data"][0])[0]
+        query = parse_qs(urlsplit(report_path).query)
+        options = json.loads(query["options"][0])
+        context = json.loads(query["context"][0])
+        wizard = self.server.wizards.get(context.get("active_id"), {})
+        report_type = wizard.get("report_type", "invs")
+        key = (report_type, options["date_from"], options["date_to"], options.get("company_id"))
+        with self.server.lock:
+            content = self.server.reports.get(key)
+        if content is None:
+            content = report_xlsx(report_type, self.server.report_rows, options["date_from"], options["date_to"],
+                                  seed=options.get("company_id", 0))
+            with self.server.lock:
+                self.server.reports[key] = content
+        self._send("report_download", content, XLSX_CONTENT_TYPE)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=8069)
+    parser.add_argument("--records", type=int, default=5000, help="records per model and company")
+    parser.add_argument("--report_rows", type=int, default=5000, help="rows per XLSX report sheet")
+    parser.add_argument("--latency_ms", type=float, default=0.0, help="added to every request")
+    parser.add_argument("--report_latency_ms", type=float, default=0.0, help="extra render time per report download")
+    parser.add_argument("--workers", type=int, default=0, help="concurrent requests served, 0 = unlimited")
+    parser.add_argument("--queue_timeout_ms", type=float, default=0.0, help="504 after waiting this long for a worker")
+    parser.add_argument("--download_failures", type=int, default=0, help="first report downloads that fail to render")
+    args = parser.parse_args()
+
+    server = MockOdoo(("127.0.0.1", args.port), args.records, args.report_rows, args.latency_ms, args.report_latency_ms,
+                      workers=args.workers, queue_timeout_ms=args.queue_timeout_ms,
+                      download_failures=args.download_failures)
+    print(f"Mock Odoo on {server.url} ({args.records} records/model, {args.report_rows} report rows)")
+    server.serve_forever()
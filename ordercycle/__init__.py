@@ -0,0 +1 @@
+"""Shared helpers for the Odoo -> Google Sheets order cycle jobs."""
@@ -0,0 +1,5 @@
+import sys
+
+from ordercycle.cli import main
+
+sys.exit(main())
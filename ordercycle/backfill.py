@@ -0,0 +1,133 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from ordercycle import jobs
+from ordercycle.checkpoint import Checkpoint
+from ordercycle.dates import month_partitions
+from ordercycle.telemetry import current_job, span
+
+BACKFILL_PROCESSES = int(os.getenv("BACKFILL_PROCESSES", "0")) or os.cpu_count() or 1
+
+# --------- Worker processes ---------
+_odoo = None   # one Odoo login per worker process
+_slots = None  # report generations in flight across all workers
+
+
+def _init_worker(slots):
+    global _slots
+    _slots = slots
+
+
+def fetch_partition(report_type, company_id, date_from, date_to, sheets):
+    """Generate, download and parse one company's report for one month, in a worker process."""
+    global _odoo
+    import pandas as pd
+
+    from ordercycle.odoo import OdooClient
+    from ordercycle.reports import COMPANIES, download_report
+
+    if _odoo is None:
+        _odoo = OdooClient()
+    with _slots:
+        wizard_id, report_info = _odoo.prepare_report(report_type, date_from, date_to, company_id)
+        filename = download_report(_odoo, wizard_id, report_info, report_type,
+                                   date_from, date_to, company_id, COMPANIES[company_id])
+    frames = pd.read_excel(filename, sheet_name=list(range(sheets)))
+    return [frames[i] for i in range(sheets)]
+
+
+# --------- Backfill ---------
+def _sheet_count(module, company_id):
+    titles = module.SHEETS[company_id]
+    return len(titles) if isinstance(titles, tuple) else 1
+
+
+def backfill(names, ctx, from_date, to_date, processes=BACKFILL_PROCESSES, odoo_slots=2):
+    """Rebuild the sheets of report jobs over a long range, one month per partition.
+
+    Every (job, company, month) partition is generated, downloaded and parsed in a
+    pool of ``processes`` worker processes, at most ``odoo_slots`` of them talking to
+    Odoo at a time. Each company's frames are then concatenated in month order and
+    pasted once with the job's ``paste``. Parsed partitions are kept in the job's
+    checkpoint (``backfill_<job>``), so with the ``resume`` option a failed backfill
+    only fetches what is missing. Returns [(name, status, seconds, error)] like run_dag.
+    """
+    import pandas as pd
+
+    from ordercycle.reports import COMPANIES
+
+    months = month_partitions(from_date, to_date)
+    modules = {name: jobs.load(name) for name in names}
+    for name, module in modules.items():
+        if not hasattr(module, "REPORT_TYPE") or not hasattr(module, "paste"):
+            raise ValueError(f"{name} can't be backfilled, only mrp.report.custom report jobs can")
+    print(f"🧱 Backfilling {', '.join(names)} from {from_date} to {to_date}: {len(months)} month(s) x "
+          f"{len(COMPANIES)} companies, {processes} processes, {odoo_slots} Odoo report slot(s)")
+
+    start = time.perf_counter()
+    checkpoints = {name: Checkpoint(f"backfill_{name}", resume=bool(ctx.option("resume", False))) for name in names}
+    parts, errors = {}, {}  # (job, company, month index) -> frames; job -> first error
+    todo = []
+    for name, module in modules.items():
+        for company_id in COMPANIES:
+            for index, (first, last) in enumerate(months):
+                saved = checkpoints[name].pages((module.REPORT_TYPE, company_id, first, last))
+                if saved:
+                    parts[name, company_id, index] = saved[0]
+                else:
+                    todo.append((name, company_id, index))
+    if parts:
+        print(f"⏭️ {len(parts)} partition(s) resumed from checkpoints")
+
+    slots = multiprocessing.get_context("spawn").BoundedSemaphore(max(1, odoo_slots))
+    with ProcessPoolExecutor(max_workers=max(1, min(processes, len(todo) or 1)),
+                             mp_context=multiprocessing.get_context("spawn"),
+                             initializer=_init_worker, initargs=(slots,)) as pool:
+        futures = {}
+        for name, company_id, index in todo:
+            module = modules[name]
+            first, last = months[index]
+            future = pool.submit(fetch_partition, module.REPORT_TYPE, company_id, first, last,
+                                 _sheet_count(module, company_id))
+            futures[future] = (name, company_id, index)
+        for future in as_completed(futures):
+            name, company_id, index = key = futures[future]
+            first, last = months[index]
+            try:
+                parts[key] = future.result()
+            except Exception as e:
+                print(f"❌ {name} {COMPANIES[company_id]} {first} to {last}: {e!r}")
+                errors.setdefault(name, e)
+                continue
+            checkpoints[name].save_page((modules[name].REPORT_TYPE, company_id, first, last), 0, parts[key])
+            print(f"✅ {name} {COMPANIES[company_id]} {first} to {last}: {len(parts[key][0])} rows")
+    fetched = time.perf_counter() - start
+
+    results = []
+    for name, module in modules.items():
+        job_start = time.perf_counter()
+        token = current_job.set(name)
+        try:
+            for company_id, cname in COMPANIES.items():
+                keys = [(name, company_id, index) for index in range(len(months))]
+                if any(key not in parts for key in keys):
+                    print(f"🚨 {name}: {cname} not pasted, partitions are missing")
+                    continue
+                with span("merge", company=company_id) as s:
+                    frames = [pd.concat([parts[key][i] for key in keys], ignore_index=True)
+                              for i in range(_sheet_count(module, company_id))]
+                    s.rows = sum(len(f) for f in frames)
+                failures = module.paste(ctx, company_id, frames)
+                if failures:
+                    errors.setdefault(name, next(iter(failures.values())))
+        except Exception as e:
+            errors.setdefault(name, e)
+        finally:
+            current_job.reset(token)
+        if name not in errors:
+            checkpoints[name].drop_pages()
+        elapsed = fetched + time.perf_counter() - job_start
+        results.append((name, "failed" if name in errors else "ok", elapsed, errors.get(name)))
+    return results
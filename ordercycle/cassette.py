@@ -0,0 +1,176 @@
+import gzip
+import hashlib
+import json
+import pickle
+import threading
+import time
+from collections import defaultdict, deque
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import parse_qsl, urlsplit
+
+from requests import Response
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+CASSETTE_VERSION = 1
+# Left out of request matching: they change between runs or are credentials (replay runs without any)
+VOLATILE_FIELDS = {"id", "csrf_token", "token", "db", "login", "password"}
+KEPT_HEADERS = ("content-type", "content-disposition")
+SHEETS_PATH = "/v4/spreadsheets/"  # Sheets writes match on the range only (bodies carry timestamps)
+
+
+class CassetteError(Exception):
+    """Replay found no recorded response for a request."""
+
+
+def _normalized(value):
+    if isinstance(value, dict):
+        return {k: _normalized(v) for k, v in sorted(value.items()) if k not in VOLATILE_FIELDS}
+    if isinstance(value, list):
+        return [_normalized(v) for v in value]
+    return value
+
+
+def request_key(method, url, body=b"", content_type=""):
+    """Stable hash of a request, ignoring ids, tokens and passwords (and Sheets write bodies)."""
+    parts = urlsplit(url)
+    body = body or b""
+    if isinstance(body, str):
+        body = body.encode()
+    if method != "GET" and parts.path.startswith(SHEETS_PATH):
+        payload = None
+    elif "json" in content_type:
+        payload = _normalized(json.loads(body))
+    elif body:
+        payload = _normalized(dict(parse_qsl(body.decode())))
+    else:
+        payload = None
+    query = sorted(parse_qsl(parts.query))
+    raw = json.dumps([method, parts.netloc, parts.path, query, payload], sort_keys=True, default=str)
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+class Cassette:
+    """Odoo RPC / report and Sheets HTTP exchanges of one run, kept as a gzipped pickle.
+
+    ``attach(session)`` mounts an adapter on a requests session: in "record" mode it
+    passes requests through and keeps each response with its latency, in "replay" mode
+    it answers from the cassette (sleeping the recorded latency times ``latency_scale``)
+    and never touches the network. Identical requests are answered in recorded order, the
+    last response repeating once they run out (concurrent jobs may interleave differently
+    than when recording; ``--workers 1`` replays a sequential recording exactly).
+    """
+
+    def __init__(self, path, mode, latency_scale=1.0):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"unknown cassette mode {mode!r}")
+        self.path = Path(path)
+        self.mode = mode
+        self.latency_scale = latency_scale
+        self.meta = {}
+        self._lock = threading.Lock()
+        self._entries = defaultdict(deque)  # request key -> recorded responses, in order
+        if mode == "replay":
+            with gzip.open(self.path, "rb") as f:
+                data = pickle.load(f)
+            if data.get("version") != CASSETTE_VERSION:
+                raise CassetteError(f"{self.path}: unsupported cassette version {data.get('version')}")
+            self.meta = data["meta"]
+            for key, entry in data["entries"]:
+                self._entries[key].append(entry)
+
+    @property
+    def replaying(self):
+        return self.mode == "replay"
+
+    def __len__(self):
+        return sum(len(q) for q in self._entries.values())
+
+    def attach(self, session):
+        """Route ``session`` through the cassette; under a RetryingAdapter it becomes its transport."""
+        adapter = _ReplayAdapter(self) if self.replaying else _RecordingAdapter(self)
+        for prefix in ("http://", "https://"):
+            mounted = session.adapters.get(prefix)
+            if hasattr(mounted, "transport"):
+                mounted.transport = adapter  # retries stay outside, each attempt is recorded
+            else:
+                session.mount(prefix, adapter)
+        return session
+
+    def record(self, key, response, elapsed):
+        entry = {
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": {h: response.headers[h] for h in KEPT_HEADERS if h in response.headers},
+            "content": response.content,
+            "elapsed": elapsed,
+        }
+        with self._lock:
+            self._entries[key].append(entry)
+
+    def play(self, key, request):
+        with self._lock:
+            queue = self._entries.get(key)
+            entry = (queue.popleft() if len(queue) > 1 else queue[0]) if queue else None
+        if entry is None:
+            raise CassetteError(
+                f"no recorded response for {request.method} {urlsplit(request.url).path} in {self.path} "
+                f"(recorded {self.meta.get('recorded')} with dates {self.meta.get('from_date')!r} to "
+                f"{self.meta.get('to_date')!r}; replay with the same --from_date/--to_date)")
+        return entry
+
+    def save(self):
+        """Write the recorded exchanges (record mode); returns the number of responses."""
+        if self.replaying:
+            return 0
+        with self._lock:
+            entries = [(key, entry) for key, queue in self._entries.items() for entry in queue]
+        meta = {"recorded": datetime.now().isoformat(timespec="seconds"), **self.meta}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with gzip.open(tmp, "wb", compresslevel=6) as f:
+            pickle.dump({"version": CASSETTE_VERSION, "meta": meta, "entries": entries}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        tmp.replace(self.path)
+        return len(entries)
+
+
+def _key(request):
+    return request_key(request.method, request.url, request.body, request.headers.get("Content-Type", ""))
+
+
+class _RecordingAdapter(HTTPAdapter):
+    def __init__(self, cassette):
+        super().__init__()
+        self.cassette = cassette
+
+    def send(self, request, **kwargs):
+        start = time.perf_counter()
+        response = super().send(request, **kwargs)
+        self.cassette.record(_key(request), response, time.perf_counter() - start)
+        return response
+
+
+class _ReplayAdapter(BaseAdapter):
+    def __init__(self, cassette):
+        super().__init__()
+        self.cassette = cassette
+
+    def send(self, request, **kwargs):
+        entry = self.cassette.play(_key(request), request)
+        if self.cassette.latency_scale:
+            time.sleep(entry["elapsed"] * self.cassette.latency_scale)
+        response = Response()
+        response.status_code = entry["status"]
+        response.reason = entry["reason"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = entry["content"]
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
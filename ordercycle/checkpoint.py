@@ -0,0 +1,72 @@
+import hashlib
+import json
+import os
+import pickle
+import shutil
+from pathlib import Path
+
+CHECKPOINT_DIR = os.getenv("CHECKPOINT_DIR", "./cache/checkpoints")  # set to "" to disable checkpoints
+
+
+def _tag(key) -> str:
+    return hashlib.sha1(json.dumps(key, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+
+class Checkpoint:
+    """Fetched pages and finished units of one job, kept under CHECKPOINT_DIR/<job>.
+
+    Pages are the ``web_search_read`` batches of a fetch, keyed by everything that
+    shapes it (model, domain, specification, companies, batch size); units are
+    whatever a job finishes in one piece, e.g. one company's report for one date
+    range. A run without ``resume`` starts from an empty checkpoint; with ``resume``
+    the pages and units left by an earlier run are reused. Pages are dropped once
+    the job succeeds; units stay until the next run without ``resume``.
+    """
+
+    def __init__(self, job, root=CHECKPOINT_DIR, resume=False):
+        self.job = job
+        self.dir = Path(root) / job if root else None
+        if self.dir is not None and not resume and self.dir.exists():
+            shutil.rmtree(self.dir)
+
+    @property
+    def enabled(self):
+        return self.dir is not None
+
+    def _write(self, path, obj):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp.replace(path)
+
+    # --------- Paginated fetches ---------
+    def pages(self, key) -> list:
+        """Record batches saved for the fetch ``key``, in offset order."""
+        if not self.enabled:
+            return []
+        folder = self.dir / "pages" / _tag(key)
+        batches = []
+        for path in sorted(folder.glob("*.pkl")):
+            with open(path, "rb") as f:
+                batches.append(pickle.load(f))
+        return batches
+
+    def save_page(self, key, index, records):
+        if self.enabled:
+            self._write(self.dir / "pages" / _tag(key) / f"{index:06d}.pkl", records)
+
+    def drop_pages(self):
+        if self.enabled:
+            shutil.rmtree(self.dir / "pages", ignore_errors=True)
+
+    # --------- Finished units ---------
+    def done(self, *unit) -> bool:
+        return self.enabled and (self.dir / "units" / f"{_tag(unit)}.done").exists()
+
+    def mark_done(self, *unit):
+        if not self.enabled:
+            return
+        path = self.dir / "units" / f"{_tag(unit)}.done"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(unit, default=str))
@@ -0,0 +1,212 @@
+import argparse
+import logging
+import os
+import sys
+import time
+
+from dotenv import load_dotenv
+
+from ordercycle import jobs, telemetry
+from ordercycle.context import RESOURCE_LIMITS, JobContext
+from ordercycle.backfill import BACKFILL_PROCESSES
+from ordercycle.daemon import MAX_AGE as DAEMON_MAX_AGE
+from ordercycle.daemon import POLL_SECONDS as DAEMON_POLL
+from ordercycle.daemon import REFRESH_INTERVAL as DAEMON_INTERVAL
+from ordercycle.scheduler import run_dag
+
+
+def add_job_options(parser):
+    """Options shared by ``run`` and ``daemon``: which jobs, how they fetch and write, concurrency."""
+    parser.add_argument("--jobs", default="ALL", help="ALL or comma separated job names, e.g. LC_recv,PI_data")
+    parser.add_argument("--paste_mode", choices=["replace", "upsert"], default=os.getenv("PASTE_MODE", "replace") or "replace",
+                        help="LC_recv / Fg_delivery. replace: clear and re-upload; "
+                             "upsert: rewrite only the rows that changed, matched by UPSERT_KEY")
+    parser.add_argument("--invoice_lines", choices=["bulk", "nested"], default="bulk",
+                        help="Fg_delivery. bulk: fetch sale_order_line ids and resolve distinct invoice lines with "
+                             "bulk reads; nested: expand invoice lines inside every operation.details row")
+    parser.add_argument("--slider_source", choices=["sheet", "oa"], default=os.getenv("SLIDER_SOURCE", "sheet") or "sheet",
+                        help="slider_wise_order_realsed. sheet: read the released orders sheet; oa: use the OA Data "
+                             "frame handed over by Order_realsed (this run or ./cache/handoff), sheet as fallback")
+    parser.add_argument("--fetch_engine", default=os.getenv("FETCH_ENGINE", ""),
+                        help="search_read, export, or per job as JOB=ENGINE,... (env FETCH_ENGINE). export pulls "
+                             "flat rows with Odoo's export_data instead of nested web_search_read records "
+                             f"({', '.join(sorted(jobs.EXPORT_JOBS))})")
+    parser.add_argument("--telemetry", default=telemetry.TELEMETRY_FILE,
+                        help="append per-phase timings as JSON lines to this file (env TELEMETRY_FILE)")
+    parser.add_argument("--workers", type=int, default=int(os.getenv("JOB_WORKERS", "4")),
+                        help="jobs run concurrently; dependent jobs wait for jobs.DEPENDS")
+    parser.add_argument("--odoo_reports", type=int, default=RESOURCE_LIMITS["odoo_report"],
+                        help="max concurrent Odoo report generations (env ODOO_REPORT_SLOTS)")
+    parser.add_argument("--sheets_writers", type=int, default=RESOURCE_LIMITS["sheets_write"],
+                        help="max concurrent Google Sheets uploads (env SHEETS_WRITERS)")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m ordercycle",
+                                     description="Odoo -> Google Sheets order cycle jobs")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="run jobs in one process sharing the Odoo session and Sheets client")
+    add_job_options(run)
+    run.add_argument("--from_date", type=str, default=None)
+    run.add_argument("--to_date", type=str, default=None)
+    run.add_argument("--import_profile", "--import-profile", action="store_true",
+                     help="don't run; report a python -X importtime breakdown of each job's cold start")
+    run.add_argument("--resume", action="store_true",
+                     help="continue from the checkpoints of the last run: finished (company, date range) units "
+                          "are skipped and paginated fetches continue after the last saved page (CHECKPOINT_DIR)")
+    cassette = run.add_mutually_exclusive_group()
+    cassette.add_argument("--record", metavar="CASSETTE",
+                          help="save every Odoo / Sheets response of this run to a gzipped cassette file, "
+                               "e.g. cassettes/2025-06-30.pkl.gz")
+    cassette.add_argument("--replay", metavar="CASSETTE",
+                          help="serve Odoo / Sheets responses from a recorded cassette, with no network; "
+                               "dates default to the recorded ones")
+    run.add_argument("--latency_scale", type=float, default=1.0,
+                     help="--replay: wait this multiple of each recorded response time (0 = no waiting)")
+
+    daemon = sub.add_parser("daemon", help="stay running and refresh jobs whose Odoo data changed")
+    add_job_options(daemon)
+    daemon.add_argument("--poll", type=int, default=DAEMON_POLL,
+                        help="seconds between checks of record counts / latest write_date (env DAEMON_POLL)")
+    daemon.add_argument("--interval", type=int, default=DAEMON_INTERVAL,
+                        help="least seconds between two refreshes of a job, unless jobs.REFRESH_INTERVALS "
+                             "says otherwise (env DAEMON_INTERVAL)")
+    daemon.add_argument("--max_age", type=int, default=DAEMON_MAX_AGE,
+                        help="refresh a job after this many seconds even without changes, 0 = never "
+                             "(env DAEMON_MAX_AGE)")
+    daemon.add_argument("--max_ticks", type=int, default=0, help="stop after this many polls, 0 = run until stopped")
+
+    backfill = sub.add_parser("backfill", help="rebuild report sheets over a long range, one month per partition "
+                                               "in a process pool, pasted once")
+    backfill.add_argument("--jobs", required=True,
+                          help="comma separated report jobs, e.g. Production_data_fetch,Order_realsed")
+    backfill.add_argument("--from_date", required=True, help="YYYY-MM-DD")
+    backfill.add_argument("--to_date", required=True, help="YYYY-MM-DD")
+    backfill.add_argument("--processes", type=int, default=BACKFILL_PROCESSES,
+                          help="worker processes downloading and parsing partitions (env BACKFILL_PROCESSES, "
+                               "default: CPU count)")
+    backfill.add_argument("--odoo_reports", type=int, default=RESOURCE_LIMITS["odoo_report"],
+                          help="max report generations in flight across all processes (env ODOO_REPORT_SLOTS)")
+    backfill.add_argument("--sheets_writers", type=int, default=RESOURCE_LIMITS["sheets_write"],
+                          help="max concurrent Google Sheets uploads (env SHEETS_WRITERS)")
+    backfill.add_argument("--resume", action="store_true",
+                          help="reuse the partitions a failed backfill already fetched (CHECKPOINT_DIR)")
+
+    sub.add_parser("list", help="list the available jobs")
+    return parser
+
+
+STATUS_ICONS = {"ok": "✅", "failed": "❌", "skipped": "⏭️"}
+
+
+def print_summary(results, wall):
+    width = max(len(name) for name, *_ in results)
+    print("\n📋 Run summary")
+    for name, status, elapsed, error in results:
+        line = f"{STATUS_ICONS[status]} {name:<{width}} {elapsed:8.1f}s"
+        print(f"{line}  {error!r}" if error else line)
+    failed = sum(status != "ok" for _, status, *_ in results)
+    print(f"Wall time: {wall:.1f}s (job time {sum(r[2] for r in results):.1f}s), {failed} failed or skipped")
+
+
+def main(argv=None):
+    load_dotenv()
+    logging.basicConfig(stream=sys.stdout, level=logging.INFO)
+    args = build_parser().parse_args(argv)
+
+    if args.command == "list":
+        print("\n".join(jobs.JOBS))
+        return 0
+
+    try:
+        names = jobs.resolve(args.jobs)
+        if args.command != "backfill":
+            args.fetch_engine = jobs.fetch_engines(args.fetch_engine)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 2
+    if args.command == "daemon":
+        return serve(names, args)
+    if args.command == "backfill":
+        return rebuild(names, args)
+    if args.import_profile:
+        from ordercycle.importprofile import profile_jobs
+        profile_jobs(names)
+        return 0
+
+    # The workflow passes empty strings when no dates were given
+    from_date, to_date = (args.from_date or "").strip(), (args.to_date or "").strip()
+    cassette = None
+    if args.record or args.replay:
+        from ordercycle.cassette import Cassette
+        cassette = Cassette(args.record or args.replay, "record" if args.record else "replay", args.latency_scale)
+        if cassette.replaying:
+            from_date = from_date or cassette.meta.get("from_date") or ""
+            to_date = to_date or cassette.meta.get("to_date") or ""
+            print(f"📼 Replaying {len(cassette)} responses from {args.replay} (recorded {cassette.meta.get('recorded')})")
+        else:
+            cassette.meta.update(odoo_url=os.getenv("ODOO_URL"), from_date=from_date, to_date=to_date, jobs=names)
+
+    own_range = [name for name in names if name in jobs.OWN_RANGE] if len(names) > 1 else []
+    if own_range and (from_date or to_date):
+        print(f"ℹ️ {', '.join(own_range)} keep their default range, --from_date/--to_date apply to the other jobs")
+    ctx = JobContext(
+        from_date=from_date,
+        to_date=to_date,
+        options={"paste_mode": args.paste_mode, "invoice_lines": args.invoice_lines,
+                 "slider_source": args.slider_source, "fetch_engine": args.fetch_engine, "resume": args.resume,
+                 "own_range": own_range},
+        limits={"odoo_report": args.odoo_reports, "sheets_write": args.sheets_writers},
+        cassette=cassette,
+    )
+    spans = telemetry.configure(args.telemetry or None)
+    start = time.perf_counter()
+    try:
+        results = run_dag(names, ctx, workers=args.workers)
+    finally:
+        if cassette is not None and not cassette.replaying:
+            print(f"📼 Recorded {cassette.save()} responses to {args.record}")
+    spans.print_summary()
+    print_summary(results, time.perf_counter() - start)
+    return 0 if all(status == "ok" for _, status, *_ in results) else 1
+
+
+def serve(names, args):
+    """``daemon``: one warm JobContext, refreshing jobs as their Odoo data changes until interrupted."""
+    from ordercycle.daemon import Daemon
+
+    def on_tick(spans, results, wall):
+        spans.print_summary()
+        print_summary(results, wall)
+
+    ctx = JobContext(
+        options={"paste_mode": args.paste_mode, "invoice_lines": args.invoice_lines,
+                 "slider_source": args.slider_source, "fetch_engine": args.fetch_engine},
+        limits={"odoo_report": args.odoo_reports, "sheets_write": args.sheets_writers},
+    )
+    daemon = Daemon(names, ctx, workers=args.workers, poll=args.poll, interval=args.interval,
+                    max_age=args.max_age, telemetry_file=args.telemetry or None, on_tick=on_tick)
+    try:
+        daemon.serve(max_ticks=args.max_ticks)
+    except KeyboardInterrupt:
+        print("\n🛑 Daemon stopped")
+    return 0
+
+
+def rebuild(names, args):
+    """``backfill``: partitioned rebuild of report jobs over --from_date..--to_date."""
+    from ordercycle.backfill import backfill
+
+    ctx = JobContext(options={"resume": args.resume}, limits={"sheets_write": args.sheets_writers})
+    spans = telemetry.configure()
+    start = time.perf_counter()
+    try:
+        results = backfill(names, ctx, args.from_date.strip(), args.to_date.strip(),
+                           processes=args.processes, odoo_slots=args.odoo_reports)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 2
+    spans.print_summary()
+    print_summary(results, time.perf_counter() - start)
+    return 0 if all(status == "ok" for _, status, *_ in results) else 1
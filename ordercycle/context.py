@@ -0,0 +1,114 @@
+import os
+import threading
+
+SERVICE_ACCOUNT_FILE = os.getenv("GOOGLE_CREDS_FILE", "gcreds.json")
+SCOPES = ["https://www.googleapis.com/auth/spreadsheets", "https://www.googleapis.com/auth/drive"]
+# Concurrency caps shared by all jobs of a run (see JobContext.resource)
+RESOURCE_LIMITS = {
+    "odoo_report": int(os.getenv("ODOO_REPORT_SLOTS", "2")),  # mrp.report.custom generations in flight
+    "sheets_write": int(os.getenv("SHEETS_WRITERS", "4")),    # concurrent worksheet uploads
+}
+
+
+class JobContext:
+    """State shared by every job of one run: date range, options, Odoo session and Sheets client.
+
+    The Odoo login and the Google credentials are only set up when a job first asks
+    for them (importing requests / gspread / google-auth only then), so a run of
+    Sheets-only jobs never logs into Odoo and an early exit skips both. Jobs may run on
+    several threads at once; ``resource(name)`` caps how many of them use a shared
+    backend concurrently. Both clients send every request through ordercycle.retry
+    (per-endpoint timeouts, backoff, circuit breakers). With a ``cassette`` (see
+    ordercycle.cassette) their HTTP traffic is recorded, or replayed without
+    credentials or network.
+    """
+
+    def __init__(self, from_date=None, to_date=None, options=None, odoo=None, gc=None, limits=None,
+                 cassette=None):
+        self.from_date = from_date or None
+        self.to_date = to_date or None
+        self.options = options or {}
+        self._odoo = odoo
+        self._gc = gc
+        self.cassette = cassette
+        self.artifacts = {}  # frames handed from one job to the next (see ordercycle.handoff)
+        self._checkpoints = {}
+        self._lock = threading.Lock()
+        limits = {**RESOURCE_LIMITS, **(limits or {})}
+        self._resources = {name: threading.BoundedSemaphore(max(1, n)) for name, n in limits.items()}
+
+    @property
+    def odoo(self):
+        with self._lock:
+            if self._odoo is None:
+                from ordercycle.odoo import OdooClient
+                if self.cassette is not None and self.cassette.replaying:
+                    self._odoo = OdooClient(url=self.cassette.meta.get("odoo_url"))
+                else:
+                    self._odoo = OdooClient()
+                if self.cassette is not None:
+                    self.cassette.attach(self._odoo.session)
+            return self._odoo
+
+    @property
+    def gc(self):
+        with self._lock:
+            if self._gc is None:
+                import gspread
+                from ordercycle import retry, sheets
+                if self.cassette is not None and self.cassette.replaying:
+                    import requests
+                    self._gc = gspread.Client(None, session=requests.Session())
+                else:
+                    from google.oauth2 import service_account
+                    creds = service_account.Credentials.from_service_account_file(SERVICE_ACCOUNT_FILE, scopes=SCOPES)
+                    self._gc = gspread.authorize(creds)
+                retry.mount(self._gc.http_client.session, sheets.endpoint)
+                if self.cassette is not None:
+                    self.cassette.attach(self._gc.http_client.session)
+            return self._gc
+
+    def resource(self, name):
+        """Context manager holding one slot of ``name`` (e.g. "odoo_report", "sheets_write")."""
+        return self._resources[name]
+
+    def limited(self, name, fn):
+        """``fn`` wrapped to run while holding one slot of ``name``."""
+        def call(*args, **kwargs):
+            with self.resource(name):
+                return fn(*args, **kwargs)
+        return call
+
+    def checkpoint(self):
+        """Checkpoint of the running job (see ordercycle.checkpoint); continues the last one with --resume."""
+        from ordercycle.checkpoint import Checkpoint
+        from ordercycle.telemetry import current_job
+
+        job = current_job.get() or "-"
+        with self._lock:
+            if job not in self._checkpoints:
+                self._checkpoints[job] = Checkpoint(job, resume=bool(self.option("resume", False)))
+            return self._checkpoints[job]
+
+    def fetch_engine(self):
+        """Fetch engine of the running job: "search_read" (default) or "export" (see --fetch_engine)."""
+        from ordercycle.telemetry import current_job
+
+        engines = self.option("fetch_engine", {})
+        return engines.get(current_job.get()) or engines.get("*") or "search_read"
+
+    def finish_checkpoint(self, job):
+        """The job succeeded: its saved pages are no longer needed."""
+        with self._lock:
+            checkpoint = self._checkpoints.pop(job, None)
+        if checkpoint is not None:
+            checkpoint.drop_pages()
+
+    def new_run(self):
+        """Start another run in the same process (daemon mode): jobs get fresh checkpoints."""
+        with self._lock:
+            self._checkpoints.clear()
+
+    def option(self, name, default=None):
+        value = self.options.get(name)
+        return default if value is None else value
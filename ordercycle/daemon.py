@@ -0,0 +1,102 @@
+import os
+import time
+
+from ordercycle import jobs, telemetry
+from ordercycle.scheduler import run_dag
+
+POLL_SECONDS = int(os.getenv("DAEMON_POLL", "60"))           # how often change indicators are checked
+REFRESH_INTERVAL = int(os.getenv("DAEMON_INTERVAL", "300"))  # least seconds between two refreshes of a job
+MAX_AGE = int(os.getenv("DAEMON_MAX_AGE", "3600"))           # refresh anyway after this long, 0 = only on changes
+
+
+class Daemon:
+    """Keeps one JobContext (Odoo session, Sheets client) warm and refreshes jobs whose sources changed.
+
+    Every ``poll`` seconds the change markers of the models in jobs.WATCH are read, one
+    ``web_search_read`` of a single record per model and company (record count and
+    latest ``write_date``), and shared by all jobs watching the model. A job is refreshed
+    when its markers differ from those of its last successful run, at most once per its
+    interval (jobs.REFRESH_INTERVALS, else ``interval``), and in any case after
+    ``max_age``. Jobs without watched models follow their DEPENDS, or ``max_age``.
+    """
+
+    def __init__(self, names, ctx, workers=1, poll=POLL_SECONDS, interval=REFRESH_INTERVAL, max_age=MAX_AGE,
+                 telemetry_file=None, on_tick=None):
+        self.names = names
+        self.ctx = ctx
+        self.workers = workers
+        self.poll = poll
+        self.interval = interval
+        self.max_age = max_age
+        self.telemetry_file = telemetry_file
+        self.on_tick = on_tick
+        self.last_run = {}  # job -> monotonic start of its last refresh attempt
+        self.seen = {}      # job -> markers its last successful refresh started from
+
+    def markers(self, cache, model):
+        """{company: (record count, latest write_date)} of ``model``, read once per tick."""
+        from ordercycle.reports import COMPANIES
+
+        if model not in cache:
+            cache[model] = {company_id: self.ctx.odoo.change_marker(model, company_id) for company_id in COMPANIES}
+        return cache[model]
+
+    def due(self, now, cache):
+        """Jobs to refresh now -> markers they start from (None for jobs without watched models)."""
+        due = {}
+        for name in self.names:
+            last = self.last_run.get(name)
+            if last is not None and now - last < jobs.REFRESH_INTERVALS.get(name, self.interval):
+                continue
+            stale = last is None or (self.max_age and now - last >= self.max_age)
+            watch = jobs.WATCH.get(name)
+            if not watch:
+                if stale:
+                    due[name] = None
+                continue
+            try:
+                current = {model: self.markers(cache, model) for model in watch}
+            except Exception as e:
+                print(f"⚠️ Could not check {', '.join(watch)} for {name}: {e!r}")
+                continue
+            if stale or current != self.seen.get(name):
+                due[name] = current
+        # a job reading another job's output follows it
+        for name in self.names:
+            last = self.last_run.get(name)
+            if name not in due and any(d in due for d in jobs.DEPENDS.get(name, [])) and (
+                    last is None or now - last >= jobs.REFRESH_INTERVALS.get(name, self.interval)):
+                due[name] = None
+        return due
+
+    def tick(self):
+        """Refresh the due jobs once; returns run_dag's results (empty when nothing changed)."""
+        now = time.monotonic()
+        due = self.due(now, {})
+        if not due:
+            return []
+        names = [n for n in self.names if n in due]
+        print(f"🔄 Refreshing {', '.join(names)}")
+        spans = telemetry.configure(self.telemetry_file)
+        self.ctx.new_run()
+        start = time.perf_counter()
+        results = run_dag(names, self.ctx, workers=self.workers)
+        for name, status, *_ in results:
+            self.last_run[name] = now
+            if status == "ok" and due[name] is not None:
+                self.seen[name] = due[name]
+        if self.on_tick is not None:
+            self.on_tick(spans, results, time.perf_counter() - start)
+        return results
+
+    def serve(self, max_ticks=0):
+        """Tick every ``poll`` seconds until interrupted (or ``max_ticks`` ticks)."""
+        ticks = 0
+        print(f"🛰️ Watching {len(self.names)} job(s), polling every {self.poll}s")
+        while True:
+            start = time.monotonic()
+            self.tick()
+            ticks += 1
+            if max_ticks and ticks >= max_ticks:
+                return
+            time.sleep(max(0.0, self.poll - (time.monotonic() - start)))
@@ -0,0 +1,48 @@
+import os
+from datetime import date, timedelta
+
+
+# --------- Default ranges ---------
+def month_to_date(today=None, previous_on_first=True):
+    """(first day, today) of the current month; the whole previous month on day 1."""
+    today = today or date.today()
+    first_day = today.replace(day=1)
+    if previous_on_first and today.day == 1:
+        last_day_prev_month = first_day - timedelta(days=1)
+        return last_day_prev_month.replace(day=1), last_day_prev_month
+    return first_day, today
+
+
+def yesterday(today=None):
+    day = (today or date.today()) - timedelta(days=1)
+    return day, day
+
+
+def month_partitions(from_date, to_date):
+    """Split an inclusive YYYY-MM-DD range into calendar months: [(first, last), ...] as YYYY-MM-DD."""
+    start, end = date.fromisoformat(from_date), date.fromisoformat(to_date)
+    parts = []
+    while start <= end:
+        next_month = (start.replace(day=1) + timedelta(days=32)).replace(day=1)
+        last = min(end, next_month - timedelta(days=1))
+        parts.append((start.isoformat(), last.isoformat()))
+        start = next_month
+    return parts
+
+
+# --------- Resolve --from_date / --to_date ---------
+def report_range(from_date, to_date, default):
+    """XLSX report jobs: each bound is Args > Env (FROM_DATE / TO_DATE) > default, as YYYY-MM-DD."""
+    default_from, default_to = default
+    from_date = from_date or os.getenv("FROM_DATE", "").strip() or default_from.isoformat()
+    to_date = to_date or os.getenv("TO_DATE", "").strip() or default_to.isoformat()
+    return from_date, to_date
+
+
+def datetime_range(from_date, to_date, default):
+    """JSON-RPC jobs: both args or the default range, as 'YYYY-MM-DD HH:MM:SS' bounds."""
+    if from_date and to_date:
+        print("Using provided dates from arguments")
+        return from_date, to_date
+    default_from, default_to = default
+    return default_from.strftime("%Y-%m-%d 00:00:00"), default_to.strftime("%Y-%m-%d 23:59:59")
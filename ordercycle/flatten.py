@@ -0,0 +1,160 @@
+import hashlib
+import linecache
+from typing import Callable, NamedTuple
+
+import numpy as np
+import pandas as pd
+
+
+class Column(NamedTuple):
+    """One output column of a web_search_read result.
+
+    ``path`` is a dotted field path such as ``order_id.buyer_name.brand.display_name``.
+    An empty many2one (``False``) anywhere along the path yields ``""``; the
+    leaf value is kept as Odoo returned it. When the path crosses an x2many
+    list, the remaining path is resolved per element and the values are
+    joined with ``join``. ``convert`` post-processes the resolved value.
+
+    ``dtype`` pins the column type when the frame is built: ``"category"``,
+    ``"string"``, ``"date"`` (``period[D]``), ``"datetime"`` or a pandas
+    numeric dtype such as ``"Float64"``/``"Int32"``. Empty values (``""``, and
+    ``False`` in numeric columns) become missing instead of mixing into the
+    column. Text and date columns keep an empty field's ``False`` as ``"FALSE"``,
+    the cell an untyped column uploads; a date column holding one is left as
+    objects.
+    """
+    title: str
+    path: str
+    join: str = " / "
+    convert: Callable | None = None
+    dtype: str | None = None
+
+
+_EMPTY = {}
+
+
+def _resolve(value, keys):
+    for i, key in enumerate(keys):
+        if isinstance(value, list):
+            return [_resolve(v, keys[i:]) for v in value]
+        if not value:
+            return ""
+        value = value.get(key, "")
+    return value
+
+
+def _resolve_joined(rec, keys, join):
+    value = _resolve(rec, keys)
+    return join.join(map(str, value)) if isinstance(value, list) else value
+
+
+def _compile_row(columns: list):
+    """Build ``row(rec) -> tuple`` for the column paths.
+
+    Each shared relation prefix (``order_id``, ``order_id.partner_id``...) is
+    looked up once per record and no per-record dict is built. A record with
+    an x2many list on a path makes the fast function fail on ``list.get``;
+    it is then resolved by the generic walker instead.
+    """
+    prefixes, lines, items = {(): "rec"}, [], []
+    for column in columns:
+        keys = column.path.split(".")
+        for depth in range(1, len(keys)):
+            prefix = tuple(keys[:depth])
+            if prefix not in prefixes:
+                prefixes[prefix] = name = f"v{len(prefixes)}"
+                lines.append(f"    {name} = {prefixes[prefix[:-1]]}.get({keys[depth - 1]!r}) or _EMPTY")
+        items.append(f"{prefixes[tuple(keys[:-1])]}.get({keys[-1]!r}, '')")
+    source = "def fast_row(rec):\n" + "\n".join(lines) + f"\n    return ({', '.join(items)},)\n"
+    # Straight-line code: about 3x faster than walking the prefixes in a loop or
+    # comprehension (bench_flatten). Registered with linecache so tracebacks and pdb
+    # show the generated lines; the source is also kept on row.source.
+    filename = f"<flatten row {hashlib.sha1(source.encode()).hexdigest()[:8]}>"
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    namespace = {"_EMPTY": _EMPTY}
+    exec(compile(source, filename, "exec"), namespace)
+    fast_row = namespace["fast_row"]
+    paths = [(c.path.split("."), c.join) for c in columns]
+
+    def row(rec):
+        try:
+            return fast_row(rec)
+        except AttributeError:
+            return tuple(_resolve_joined(rec, keys, join) for keys, join in paths)
+    row.source = source
+    return row
+
+
+def _typed(values: np.ndarray, dtype: str):
+    if dtype in ("category", "string"):
+        # Char fields come back as False when empty; kept as "FALSE" text, which uploads
+        # (USER_ENTERED) to the same FALSE cell an untyped column gives
+        empty_char = np.fromiter((v is False for v in values), dtype=bool, count=len(values))
+        values = np.where(empty_char, "FALSE", values)
+        values = np.where((values == "") | pd.isna(values), None, values)
+        return pd.Categorical(values) if dtype == "category" else pd.array(values, dtype="string")
+    if dtype in ("date", "datetime"):
+        empty_date = np.fromiter((v is False for v in values), dtype=bool, count=len(values))
+        parsed = pd.Series(pd.to_datetime(np.where(empty_date, None, values), errors="coerce", format="ISO8601"))
+        typed = parsed.dt.to_period("D").array if dtype == "date" else parsed.array
+        if empty_date.any():
+            # Empty date fields come back as False as well; a period/datetime array can't hold
+            # their FALSE cells, so the column falls back to objects
+            return np.where(empty_date, "FALSE", typed.astype(object))
+        return typed
+    return pd.Series(pd.to_numeric(values, errors="coerce")).astype(dtype).array
+
+
+class ColumnarFlattener:
+    """Accumulate web_search_read records into column-addressable object blocks.
+
+    Each ``extend`` turns a page of records into one (rows x columns) object
+    array holding references to the values Odoo returned, so the page's
+    record dicts can be freed; ``extend_rows`` takes rows already resolved in
+    column order. ``frame`` builds the DataFrame column by column.
+    """
+
+    def __init__(self, columns: list):
+        self.columns = [c if isinstance(c, Column) else Column(*c) for c in columns]
+        self._row = _compile_row(self.columns)
+        self._blocks = []
+
+    def extend(self, records: list):
+        return self.extend_rows(list(map(self._row, records)))
+
+    def extend_rows(self, rows: list):
+        """Add rows already resolved in column order, e.g. from OdooClient.export_all."""
+        if not rows:
+            return self
+        block = np.array(rows, dtype=object)
+        if block.shape != (len(rows), len(self.columns)):
+            # A leaf value that is itself a sequence: fill cell by cell instead
+            block = np.empty((len(rows), len(self.columns)), dtype=object)
+            for i, values in enumerate(zip(*rows)):
+                block[:, i] = list(values)
+        for i, column in enumerate(self.columns):
+            if column.convert is not None:
+                block[:, i] = list(map(column.convert, block[:, i]))
+        self._blocks.append(block)
+        return self
+
+    def __len__(self):
+        return sum(len(b) for b in self._blocks)
+
+    def frame(self) -> pd.DataFrame:
+        if not len(self):
+            return pd.DataFrame()
+        data = self._blocks[0] if len(self._blocks) == 1 else np.concatenate(self._blocks)
+        untyped = [c.title for c in self.columns if c.dtype is None]
+        df = pd.DataFrame({
+            c.title: data[:, i] if c.dtype is None else _typed(data[:, i], c.dtype)
+            for i, c in enumerate(self.columns)
+        })
+        if untyped:
+            df[untyped] = df[untyped].infer_objects()
+        return df
+
+
+def flatten_records(records: list, columns: list) -> pd.DataFrame:
+    """Build a DataFrame from ``records`` according to the ``columns`` mapping."""
+    return ColumnarFlattener(columns).extend(records).frame()
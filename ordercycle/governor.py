@@ -0,0 +1,119 @@
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from ordercycle.telemetry import span
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, the governor stays off
+    fcntl = None
+
+GOVERNOR_DIR = os.getenv("GOVERNOR_DIR", "./cache/governor")  # set to "" to disable the governor
+# resource -> (starting limit, most slots the limit may grow to), per Odoo instance
+LIMITS = {
+    "report": (int(os.getenv("GOVERNOR_REPORTS", "2")), int(os.getenv("GOVERNOR_REPORTS_MAX", "4"))),
+    "fetch": (int(os.getenv("GOVERNOR_FETCHES", "4")), int(os.getenv("GOVERNOR_FETCHES_MAX", "8"))),
+}
+SLOW = float(os.getenv("GOVERNOR_SLOW", "2.0"))  # slower than this multiple of the baseline is a congestion signal
+DECREASE = 0.7  # the limit shrinks to this fraction on congestion
+POLL = 0.05     # seconds between attempts to take a slot
+
+
+class Governor:
+    """Slots for heavy Odoo work shared by every process talking to one Odoo instance.
+
+    ``slot(resource, kind)`` holds one of the resource's slots around a report
+    generation or a page of a paginated fetch. Slots are lock files under
+    GOVERNOR_DIR/<instance> held with flock, so parallel runs, the daemon and backfill
+    workers on the machine share them, and a crashed process frees its slots. The
+    number of open slots adapts to latency (AIMD): an operation slower than SLOW x the
+    baseline of its kind, or failing on the network, cuts the limit to DECREASE of
+    itself; otherwise it grows by about one slot per ``limit`` operations, up to the
+    resource's maximum.
+    The baseline follows the fastest recent time of each kind and creeps up towards
+    slower ones, so a bigger dataset stops counting as congestion after a while.
+    """
+
+    def __init__(self, instance, root=GOVERNOR_DIR, limits=None):
+        self.limits = {**LIMITS, **(limits or {})}
+        self.dir = Path(root) / hashlib.sha1(instance.encode()).hexdigest()[:12] if root and fcntl else None
+
+    @property
+    def enabled(self):
+        return self.dir is not None
+
+    # --------- Adaptive limit ---------
+    def _state(self, resource):
+        try:
+            with open(self.dir / f"{resource}.json", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {"limit": float(self.limits[resource][0]), "baselines": {}}
+
+    def limit(self, resource):
+        """Slots of ``resource`` currently open."""
+        if not self.enabled:
+            return self.limits[resource][1]
+        return max(1, int(self._state(resource)["limit"]))
+
+    def _observe(self, resource, kind, elapsed, ok):
+        maximum = self.limits[resource][1]
+        with open(self.dir / f"{resource}.json.lock", "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            state = self._state(resource)
+            baseline = state["baselines"].get(kind)
+            congested = not ok or (baseline is not None and elapsed > SLOW * baseline)
+            state["baselines"][kind] = elapsed if baseline is None else min(
+                elapsed, baseline + 0.05 * (elapsed - baseline))
+            before = state["limit"]
+            if congested:
+                state["limit"] = max(1.0, before * DECREASE)
+            else:
+                state["limit"] = min(float(maximum), before + 1 / max(before, 1.0))
+            tmp = self.dir / f"{resource}.json.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp, self.dir / f"{resource}.json")
+        if int(state["limit"]) != int(before):
+            reason = "failed" if not ok else f"took {elapsed:.1f}s"
+            print(f"🚦 Odoo {resource} slots {int(before)} -> {int(state['limit'])} ({kind} {reason})")
+
+    # --------- Slots ---------
+    def _try_acquire(self, resource):
+        for i in range(self.limit(resource)):
+            handle = open(self.dir / f"{resource}.{i}.lock", "a")
+            try:
+                fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return handle
+            except BlockingIOError:
+                handle.close()
+        return None
+
+    @contextmanager
+    def slot(self, resource, kind=""):
+        """Hold one ``resource`` slot ("report" or "fetch"); ``kind`` groups comparable operations."""
+        if not self.enabled:
+            yield
+            return
+        self.dir.mkdir(parents=True, exist_ok=True)
+        handle = self._try_acquire(resource)
+        if handle is None:
+            with span("governor_wait", resource=resource):
+                while handle is None:
+                    time.sleep(POLL)
+                    handle = self._try_acquire(resource)
+        start = time.perf_counter()
+        ok = True
+        try:
+            yield
+        except OSError:  # timeouts, refused connections, HTTP errors (requests' exceptions are OSErrors)
+            ok = False
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            handle.close()  # releases the flock
+            self._observe(resource, kind, elapsed, ok)
@@ -0,0 +1,31 @@
+import os
+import pickle
+from datetime import datetime
+from pathlib import Path
+
+HANDOFF_DIR = os.getenv("HANDOFF_DIR", "./cache/handoff")  # set to "" to keep hand-offs in memory only
+
+
+def publish(ctx, name, df, **meta):
+    """Hand ``df`` to later jobs of this run and, when HANDOFF_DIR is set, of later runs."""
+    artifact = {"frame": df, "written": datetime.now(), **meta}
+    ctx.artifacts[name] = artifact
+    if HANDOFF_DIR:
+        path = Path(HANDOFF_DIR) / f"{name}.pkl"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(artifact, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp.replace(path)
+    return artifact
+
+
+def receive(ctx, name):
+    """The artifact published as ``name`` in this run, else the last one on disk, else None."""
+    if name in ctx.artifacts:
+        return ctx.artifacts[name]
+    path = Path(HANDOFF_DIR) / f"{name}.pkl" if HANDOFF_DIR else None
+    if path is None or not path.exists():
+        return None
+    with open(path, "rb") as f:
+        return pickle.load(f)
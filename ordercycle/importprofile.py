@@ -0,0 +1,53 @@
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def job_import_code(name):
+    """What a cold start of ``name`` imports before the job starts running."""
+    return f"import ordercycle.cli, ordercycle.jobs; ordercycle.jobs.load({name!r})"
+
+
+def importtime(code):
+    """Run ``code`` in a fresh interpreter under ``-X importtime``.
+
+    Returns (wall seconds, [(module, self_us, cumulative_us)]).
+    """
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          cwd=ROOT, capture_output=True, text=True)
+    wall = time.perf_counter() - start
+    if proc.returncode:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        rows.append((module.strip(), int(self_us), int(cumulative_us)))
+    return wall, rows
+
+
+def by_package(rows):
+    """Self import time summed per top-level package, largest first."""
+    totals = {}
+    for module, self_us, _ in rows:
+        package = module.split(".")[0]
+        totals[package] = totals.get(package, 0) + self_us
+    return sorted(totals.items(), key=lambda kv: kv[1], reverse=True)
+
+
+def print_profile(label, wall, rows, top=12):
+    total = sum(r[1] for r in rows)
+    print(f"\n⏱️ {label}: {wall * 1000:.0f} ms cold start, {total / 1000:.0f} ms importing {len(rows)} modules")
+    for package, self_us in by_package(rows)[:top]:
+        print(f"  {package:<28} {self_us / 1000:8.1f} ms  {self_us / total:6.1%}")
+
+
+def profile_jobs(names, top=12):
+    for name in names:
+        wall, rows = importtime(job_import_code(name))
+        print_profile(name, wall, rows, top)
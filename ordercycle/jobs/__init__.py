@@ -0,0 +1,93 @@
+"""Registry of the order cycle jobs, in the order an ALL run executes them.
+
+Each job module exposes ``run(ctx)`` taking an ``ordercycle.context.JobContext``.
+"""
+import importlib
+
+JOBS = {
+    "Order_realsed": "ordercycle.jobs.order_released",
+    "Production_data_fetch": "ordercycle.jobs.production_data",
+    "Fg_delivery": "ordercycle.jobs.fg_delivery",
+    "PI_data": "ordercycle.jobs.pi_data",
+    "LC_recv": "ordercycle.jobs.lc_recv",
+    "production_dashboard": "ordercycle.jobs.production_dashboard",
+    "slider_wise_order_realsed": "ordercycle.jobs.slider_wise",
+    "buyer_wise_production_pending": "ordercycle.jobs.buyer_wise_production_pending",
+    "buyer_wise_pi_pending": "ordercycle.jobs.buyer_wise_pi_pending",
+}
+# job -> jobs whose output it reads; only enforced when both are part of the run
+DEPENDS = {
+    "slider_wise_order_realsed": ["Order_realsed"],
+}
+# job -> Odoo models whose changes trigger a refresh in daemon mode (see ordercycle.daemon)
+WATCH = {
+    "Order_realsed": ["sale.order"],
+    "Production_data_fetch": ["operation.details"],
+    "Fg_delivery": ["operation.details"],
+    "PI_data": ["sale.order"],
+    "LC_recv": ["combine.invoice"],
+    "production_dashboard": ["operation.details"],
+    "buyer_wise_production_pending": ["operation.details"],
+    "buyer_wise_pi_pending": ["sale.order.line", "sale.order"],
+}
+# job -> least seconds between daemon refreshes, where the default does not fit
+REFRESH_INTERVALS = {
+    "production_dashboard": 3600,  # reports yesterday, changes are late corrections
+}
+
+# jobs that keep their default range in a run of several jobs: --from_date / --to_date (the
+# workflow's dispatch dates for ALL) are for the others, and only apply when the job runs alone
+OWN_RANGE = {"production_dashboard"}  # yesterday's daily report
+
+# jobs that can fetch through OdooClient.export_all instead of web_search_read (--fetch_engine)
+FETCH_ENGINES = ("search_read", "export")
+EXPORT_JOBS = {"PI_data", "buyer_wise_production_pending", "buyer_wise_pi_pending"}
+
+
+class JobFailed(RuntimeError):
+    """Some companies or tabs of a job failed while the others were written.
+
+    Jobs raise it once every company was attempted, so the scheduler marks the job
+    failed (skipping its dependents and keeping its checkpoint). ``failures`` maps
+    each failed company or tab to its exception.
+    """
+
+    def __init__(self, failures: dict):
+        self.failures = failures
+        super().__init__("; ".join(f"{label}: {e!r}" for label, e in failures.items()))
+
+
+def resolve(spec: str) -> list:
+    """Job names from "ALL" or a comma separated list (script names with .py are accepted)."""
+    if not spec or spec.strip().upper() == "ALL":
+        return list(JOBS)
+    names = []
+    for name in spec.split(","):
+        name = name.strip().removesuffix(".py")
+        if name not in JOBS:
+            raise ValueError(f"Unknown job {name!r}, expected ALL or one of: {', '.join(JOBS)}")
+        if name not in names:
+            names.append(name)
+    return names
+
+
+def fetch_engines(spec: str) -> dict:
+    """{job or "*": engine} from "search_read", "export" or "JOB=ENGINE,..." (--fetch_engine)."""
+    engines = {}
+    for item in (spec or "").split(","):
+        name, _, engine = item.strip().rpartition("=")
+        if not engine:
+            continue
+        name = name.strip().removesuffix(".py") or "*"
+        if engine not in FETCH_ENGINES:
+            raise ValueError(f"Unknown fetch engine {engine!r}, expected one of: {', '.join(FETCH_ENGINES)}")
+        if name != "*" and name not in JOBS:
+            raise ValueError(f"Unknown job {name!r} in --fetch_engine")
+        if name != "*" and engine == "export" and name not in EXPORT_JOBS:
+            raise ValueError(f"{name} can't use the export engine, only: {', '.join(sorted(EXPORT_JOBS))}")
+        engines[name] = engine
+    return engines
+
+
+def load(name: str):
+    return importlib.import_module(JOBS[name])
@@ -0,0 +1,112 @@
+"""Sale order lines of PIs without an OA yet -> "pi_pending_data_buyer"."""
+from datetime import datetime
+
+from ordercycle.flatten import Column, ColumnarFlattener
+from ordercycle.reports import LOCAL_TZ
+from ordercycle.sheets import write_frame
+from ordercycle.telemetry import span
+
+SHEET_ID = "1acV7UrmC8ogC54byMrKRTaD9i1b1Cf9QZ-H1qHU5ZZc"
+SHEET_NAME = "pi_pending_data_buyer"
+COMPANIES = [(1, "Zipper"), (3, "MetalTrim")]
+
+
+DOMAIN = [
+    "&", ["order_id.sales_type", "=", "sale"],
+    "&", "|", ["order_id.oa_count", "=", False], ["order_id.oa_count", "=", 0],
+    "&", ["order_id.is_active", "=", True],
+    "&", ["order_id.pi_type", "=", "regular"],
+    ["order_id.state", "!=", "cancel"]
+]
+
+
+# --------- Fetch all data (sale.order.line level) ---------
+def fetch_all_data(odoo, company_id, batch_size=1000, checkpoint=None):
+    specification = {
+        "order_id": {
+            "fields": {
+                "name": {},
+                "buyer_name": {"fields": {"display_name": {}, "brand": {"fields": {"display_name": {}}}}},
+                "buying_house": {"fields": {"display_name": {}}},
+                "company_id": {"fields": {"display_name": {}}},
+                "partner_id": {"fields": {"display_name": {}, "group": {"fields": {"display_name": {}}}}},
+                "pi_date": {},
+                "team_id": {"fields": {"display_name": {}}},
+                "user_id": {"fields": {"display_name": {}}},
+                "lc_number": {},
+                "payment_term_id": {"fields": {"display_name": {}}},
+                "state": {},
+                "pi_type": {}
+            }
+        },
+        "product_template_id": {"fields": {"fg_categ_type": {"fields": {"display_name": {}}}}},
+        "product_uom_qty": {},
+        "price_total": {},
+        "slidercodesfg": {},
+        "company_id": {"fields": {"display_name": {}}}
+    }
+    return odoo.search_read_all("sale.order.line", DOMAIN, specification, company_ids=[company_id],
+                                batch_size=batch_size, checkpoint=checkpoint)
+
+
+def export_all_data(odoo, company_id, batch_size=5000, checkpoint=None):
+    """FLAT_COLUMNS rows through export_data (--fetch_engine export)."""
+    return odoo.export_all("sale.order.line", DOMAIN, [c.path for c in FLAT_COLUMNS], company_ids=[company_id],
+                           batch_size=batch_size, checkpoint=checkpoint)
+
+# --------- Flatten records (column title -> field path, dtype) ---------
+FLAT_COLUMNS = [
+    Column("Order Reference", "order_id.name", dtype="string"),
+    Column("Buyer", "order_id.buyer_name.display_name", dtype="category"),
+    Column("Brand Group", "order_id.buyer_name.brand.display_name", dtype="category"),
+    Column("Buying House", "order_id.buying_house.display_name", dtype="category"),
+    Column("Company", "order_id.company_id.display_name", dtype="category"),
+    Column("Customer", "order_id.partner_id.display_name", dtype="category"),
+    Column("Customer Group", "order_id.partner_id.group.display_name", dtype="category"),
+    Column("PI Date", "order_id.pi_date", dtype="date"),
+    Column("Sales Team", "order_id.team_id.display_name", dtype="category"),
+    Column("Salesperson", "order_id.user_id.display_name", dtype="category"),
+    Column("FG Category", "product_template_id.fg_categ_type.display_name", dtype="category"),
+    Column("Quantity", "product_uom_qty", dtype="Float64"),
+    Column("Total", "price_total", dtype="Float64"),
+    Column("Slider Code", "slidercodesfg", dtype="category"),
+    Column("LC Number", "order_id.lc_number", dtype="string"),
+    Column("Payment Terms", "order_id.payment_term_id.display_name", dtype="category"),
+    Column("Status", "order_id.state", dtype="category"),
+    Column("Type", "order_id.pi_type", dtype="category"),
+    Column("Line Company", "company_id.display_name", dtype="category"),
+]
+
+# --------- Paste to Google Sheet ---------
+def paste_to_gsheet(gc, df, sheet_name):
+    worksheet = gc.open_by_key(SHEET_ID).worksheet(sheet_name)
+    if df.empty:
+        print(f"Skip: {sheet_name} DataFrame is empty, not pasting.")
+        return
+    worksheet.batch_clear(["A:V"])
+    write_frame(worksheet, df)
+    print(f"✅ Data pasted to Google Sheet ({sheet_name}).")
+
+    local_time = datetime.now(LOCAL_TZ).strftime("%Y-%m-%d %H:%M:%S")
+    worksheet.update(values=[[f"{local_time}"]], range_name="W2")
+    print(f"Timestamp written to W2: {local_time}")
+
+# --------- Main ---------
+def run(ctx):
+    flattener = ColumnarFlattener(FLAT_COLUMNS)
+    export = ctx.fetch_engine() == "export"
+    for company_id, company_name in COMPANIES:
+        if export:
+            records = export_all_data(ctx.odoo, company_id, checkpoint=ctx.checkpoint())
+            with span("flatten", company=company_id, rows=len(records)):
+                flattener.extend_rows(records)
+        else:
+            records = fetch_all_data(ctx.odoo, company_id, checkpoint=ctx.checkpoint())
+            with span("flatten", company=company_id, rows=len(records)):
+                flattener.extend(records)
+        print(f"✅ {company_name}: {len(records)} records collected")
+
+    with span("frame", rows=len(flattener)):
+        df = flattener.frame()
+    with ctx.resource("sheets_write"):
+        paste_to_gsheet(ctx.gc, df, SHEET_NAME)
@@ -0,0 +1,97 @@
+"""FG packing pending operation.details by buyer -> "buyer_wise_production"."""
+from datetime import datetime
+
+from ordercycle.dates import datetime_range, month_to_date
+from ordercycle.flatten import Column, ColumnarFlattener
+from ordercycle.reports import LOCAL_TZ
+from ordercycle.sheets import write_frame
+from ordercycle.telemetry import span
+
+SHEET_ID = "1acV7UrmC8ogC54byMrKRTaD9i1b1Cf9QZ-H1qHU5ZZc"
+SHEET_NAME = "buyer_wise_production"
+COMPANIES = [(1, "Zipper"), (3, "MetalTrim")]
+
+
+# --------- Fetch all data ---------
+def domain(from_date, to_date):
+    return [
+        "&", ["next_operation", "=", "FG Packing"],
+        "&", "&", ["next_operation", "=", "FG Packing"], ["state", "!=", "done"], ["state", "!=", "closed"],
+        "&", ["action_date", ">=", from_date], ["action_date", "<=", to_date]
+    ]
+
+
+def fetch_all_data(odoo, from_date, to_date, company_id, batch_size=1000, checkpoint=None):
+    specification = {
+        "action_date": {},
+        "qty": {},
+        "final_price": {},
+        "partner_id": {"fields": {"display_name": {}}},
+        "fg_categ_type": {},
+        "oa_id": {"fields": {"display_name": {}}},
+        "product_template_id": {"fields": {"display_name": {}}},
+        "slidercodesfg": {},
+        "buyer_name": {},
+        "buyer_group": {"fields": {"display_name": {}}},
+        "company_id": {"fields": {"display_name": {}}},
+    }
+    return odoo.search_read_all("operation.details", domain(from_date, to_date), specification,
+                                company_ids=[company_id], batch_size=batch_size, checkpoint=checkpoint)
+
+
+def export_all_data(odoo, from_date, to_date, company_id, batch_size=5000, checkpoint=None):
+    """FLAT_COLUMNS rows through export_data (--fetch_engine export)."""
+    return odoo.export_all("operation.details", domain(from_date, to_date), [c.path for c in FLAT_COLUMNS],
+                           company_ids=[company_id], batch_size=batch_size, checkpoint=checkpoint)
+
+# --------- Flatten records (column title -> field path, dtype) ---------
+FLAT_COLUMNS = [
+    Column("Action Date", "action_date", convert=lambda d: d[:10] if d else "", dtype="date"),
+    Column("Qty", "qty", dtype="Float64"),
+    Column("Final Price", "final_price", dtype="Float64"),
+    Column("Customer", "partner_id.display_name", dtype="category"),
+    Column("Item", "fg_categ_type", dtype="category"),
+    Column("OA", "oa_id.display_name", dtype="string"),
+    Column("Product", "product_template_id.display_name", dtype="category"),
+    Column("Slider Code", "slidercodesfg", dtype="category"),
+    Column("Buyer", "buyer_name", dtype="category"),
+    Column("Buyer Group", "buyer_group.display_name", dtype="category"),
+    Column("Company", "company_id.display_name", dtype="category"),
+]
+
+# --------- Paste to Google Sheet ---------
+def paste_to_gsheet(gc, df, sheet_name):
+    worksheet = gc.open_by_key(SHEET_ID).worksheet(sheet_name)
+    if df.empty:
+        print(f"Skip: {sheet_name} DataFrame is empty, not pasting.")
+        return
+    worksheet.batch_clear(["A:K"])
+    write_frame(worksheet, df)
+    print(f"✅ Data pasted to Google Sheet ({sheet_name}).")
+
+    local_time = datetime.now(LOCAL_TZ).strftime("%Y-%m-%d %H:%M:%S")
+    worksheet.update(values=[[f"{local_time}"]], range_name="L2")
+    print(f"Timestamp written to L2: {local_time}")
+
+# --------- Main ---------
+def run(ctx):
+    # Current month only, also on day 1
+    from_date, to_date = datetime_range(ctx.from_date, ctx.to_date, month_to_date(previous_on_first=False))
+    print(f"📅 Fetching data from {from_date} to {to_date}")
+    flattener = ColumnarFlattener(FLAT_COLUMNS)
+    export = ctx.fetch_engine() == "export"
+    for company_id, company_name in COMPANIES:
+        if export:
+            records = export_all_data(ctx.odoo, from_date, to_date, company_id, checkpoint=ctx.checkpoint())
+            with span("flatten", company=company_id, rows=len(records)):
+                flattener.extend_rows(records)
+        else:
+            records = fetch_all_data(ctx.odoo, from_date, to_date, company_id, checkpoint=ctx.checkpoint())
+            with span("flatten", company=company_id, rows=len(records)):
+                flattener.extend(records)
+        print(f"✅ {company_name}: {len(records)} records collected")
+
+    with span("frame", rows=len(flattener)):
+        df = flattener.frame()
+    with ctx.resource("sheets_write"):
+        paste_to_gsheet(ctx.gc, df, SHEET_NAME)
@@ -0,0 +1,145 @@
+"""FG packed, delivery pending operation.details -> "Zip Fg pack" / "MT Fg pack"."""
+from datetime import datetime
+
+import pandas as pd
+
+from ordercycle.dates import datetime_range, month_to_date
+from ordercycle.flatten import Column, flatten_records
+from ordercycle.reports import LOCAL_TZ
+from ordercycle.sheets import write_frame, upsert_frame
+from ordercycle.telemetry import span
+
+SHEET_ID = "1acV7UrmC8ogC54byMrKRTaD9i1b1Cf9QZ-H1qHU5ZZc"
+COMPANY_SHEETS = [
+    (1, "Zipper", "Zip Fg pack"),
+    (3, "MetalTrim", "MT Fg pack"),
+]
+UPSERT_KEY = ["OA", "Action Date"]  # natural key used by --paste_mode upsert
+
+
+# --------- Fetch all data ---------
+def fetch_all_data(odoo, from_date, to_date, company_id, batch_size=1000, nested_invoice_lines=True,
+                   checkpoint=None):
+    domain = [
+        "&", ["next_operation", "=", "Delivery"],
+        "&", "&", ["next_operation", "=", "Delivery"], ["state", "!=", "done"], ["state", "!=", "closed"],
+        "&", ["action_date", ">=", from_date], ["action_date", "<=", to_date]
+    ]
+    specification = {
+        "action_date": {},
+        "qty": {},
+        "final_price": {},
+        "partner_id": {"fields": {"display_name": {}}},
+        "fg_categ_type": {},
+        "oa_id": {"fields": {"display_name": {}}},
+        "product_template_id": {"fields": {"display_name": {}}},
+        "slidercodesfg": {},
+        "sale_order_line": {"fields": {
+            "invoice_lines": {"fields": {"display_name": {}, "invoice_date": {}}},
+            "invoice_status": {}
+        }}
+    }
+    if not nested_invoice_lines:
+        specification["sale_order_line"] = {}  # id only, resolved by resolve_invoice_lines()
+    return odoo.search_read_all("operation.details", domain, specification, company_ids=[company_id],
+                                batch_size=batch_size, checkpoint=checkpoint)
+
+# --------- Bulk read ---------
+def read_records(odoo, model, ids, fields, company_id, batch_size=5000):
+    if not ids:
+        return pd.DataFrame(columns=["id"] + fields)
+    rows = odoo.read(model, ids, fields, company_ids=[company_id], batch_size=batch_size)
+    print(f"[Company {company_id}] Read {len(rows)} distinct {model} records")
+    return pd.DataFrame(rows, columns=["id"] + fields)
+
+# --------- Resolve invoice lines once per distinct sale order line ---------
+INVOICE_LINE_COLUMNS = {
+    "Sale Order Line/Invoice Lines": "display_name",
+    "Sale Order Line/Invoice Lines/Invoice/Bill Date": "invoice_date",
+}
+
+def resolve_invoice_lines(odoo, df, company_id):
+    """Fill the sale order line columns of ``df`` from its "_sol_id" column."""
+    sol_ids = df.pop("_sol_id")
+    # Empty relations come back as False
+    sol_ids = pd.to_numeric(sol_ids.where(sol_ids.map(type) != bool), errors="coerce")
+    distinct = [int(i) for i in sol_ids.dropna().unique()]
+
+    sols = read_records(odoo, "sale.order.line", distinct, ["invoice_lines", "invoice_status"], company_id)
+    line_ids = sols[["id", "invoice_lines"]].explode("invoice_lines").dropna()
+    lines = read_records(odoo, "account.move.line", [int(i) for i in line_ids["invoice_lines"].unique()],
+                         list(INVOICE_LINE_COLUMNS.values()), company_id)
+
+    # sale order line -> " / "-joined invoice line values, in invoice_lines order
+    joined = line_ids.merge(lines, left_on="invoice_lines", right_on="id", how="left", suffixes=("", "_line"))
+    per_sol = sols[["id", "invoice_status"]].set_index("id")
+    for title, field in INVOICE_LINE_COLUMNS.items():
+        per_sol[title] = joined[field].astype(str).groupby(joined["id"], sort=False).agg(" / ".join)
+    per_sol = per_sol.fillna("").rename(columns={"invoice_status": "Sale Order Line/Invoice Status"})
+
+    resolved = per_sol.reindex(sol_ids.to_numpy()).fillna("")
+    for title in resolved.columns:
+        df[title] = resolved[title].to_numpy()
+    return df[[c.title for c in FLAT_COLUMNS]]
+
+# --------- Flatten records (column title -> field path) ---------
+FLAT_COLUMNS = [
+    Column("Action Date", "action_date"),
+    Column("Qty", "qty"),
+    Column("Final Price", "final_price"),
+    Column("Customer", "partner_id.display_name"),
+    Column("Item", "fg_categ_type"),
+    Column("OA", "oa_id.display_name"),
+    Column("Product", "product_template_id.display_name"),
+    Column("Slider Code", "slidercodesfg"),
+    Column("Sale Order Line/Invoice Lines", "sale_order_line.invoice_lines.display_name"),
+    Column("Sale Order Line/Invoice Status", "sale_order_line.invoice_status"),
+    Column("Sale Order Line/Invoice Lines/Invoice/Bill Date", "sale_order_line.invoice_lines.invoice_date"),
+]
+# --invoice_lines bulk: sale_order_line arrives as a bare id
+BULK_COLUMNS = [c for c in FLAT_COLUMNS if not c.path.startswith("sale_order_line.")] + [Column("_sol_id", "sale_order_line")]
+
+# --------- Paste to Google Sheet ---------
+def paste_to_gsheet(gc, df, sheet_name, paste_mode="replace"):
+    worksheet = gc.open_by_key(SHEET_ID).worksheet(sheet_name)
+    if df.empty:
+        print(f"Skip: {sheet_name} DataFrame is empty, not pasting.")
+        return
+    if paste_mode == "upsert":
+        stats = upsert_frame(worksheet, df, UPSERT_KEY)
+        print(f"✅ Data upserted to Google Sheet ({sheet_name}): {stats}")
+    else:
+        worksheet.batch_clear(["A:AC"])
+        write_frame(worksheet, df)
+        print(f"✅ Data pasted to Google Sheet ({sheet_name}).")
+
+    local_time = datetime.now(LOCAL_TZ).strftime("%Y-%m-%d %H:%M:%S")
+    worksheet.update(values=[[f"{local_time}"]], range_name="AC2")
+    print(f"Timestamp written to AC2: {local_time}")
+
+# --------- Main ---------
+def run(ctx):
+    from_date, to_date = datetime_range(ctx.from_date, ctx.to_date, month_to_date())
+    print(f"📅 Fetching data from {from_date} to {to_date}")
+    bulk = ctx.option("invoice_lines", "bulk") == "bulk"
+    checkpoint = ctx.checkpoint()
+    for company_id, company_name, sheet_name in COMPANY_SHEETS:
+        unit = (company_id, from_date, to_date)
+        if checkpoint.done(*unit):
+            print(f"⏭️ {sheet_name} already pasted for {from_date} to {to_date}, resuming past it")
+            continue
+        if bulk:
+            records = fetch_all_data(ctx.odoo, from_date, to_date, company_id, nested_invoice_lines=False,
+                                     checkpoint=checkpoint)
+            with span("flatten", company=company_id, rows=len(records)):
+                df = flatten_records(records, BULK_COLUMNS)
+            if not df.empty:
+                with span("resolve_invoice_lines", company=company_id, rows=len(df)):
+                    df = resolve_invoice_lines(ctx.odoo, df, company_id)
+        else:
+            records = fetch_all_data(ctx.odoo, from_date, to_date, company_id, checkpoint=checkpoint)
+            with span("flatten", company=company_id, rows=len(records)):
+                df = flatten_records(records, FLAT_COLUMNS)
+        with ctx.resource("sheets_write"):
+            paste_to_gsheet(ctx.gc, df, sheet_name, ctx.option("paste_mode", "replace"))
+        checkpoint.mark_done(*unit)
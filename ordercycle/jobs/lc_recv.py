@@ -0,0 +1,85 @@
+"""Posted combine.invoice records -> "Lc recv"."""
+from datetime import datetime
+
+from ordercycle.dates import datetime_range, month_to_date
+from ordercycle.flatten import Column, flatten_records
+from ordercycle.reports import LOCAL_TZ
+from ordercycle.sheets import write_frame, upsert_frame
+from ordercycle.telemetry import span
+
+SHEET_ID = "1acV7UrmC8ogC54byMrKRTaD9i1b1Cf9QZ-H1qHU5ZZc"
+SHEET_NAME = "Lc recv"
+UPSERT_KEY = ["Number"]  # natural key used by --paste_mode upsert
+
+
+# --------- Fetch all combine.invoice data ---------
+def fetch_all_data(odoo, from_date, to_date, batch_size=1000, checkpoint=None):
+    domain = [
+        "&", ["state","=","posted"],
+        "&", ["invoice_date", ">=", from_date],
+             ["invoice_date", "<=", to_date]
+    ]
+
+    specification = {
+        "delivery_date": {},
+        "invoice_incoterm_id": {"fields":{"display_name":{}}},
+        "invoice_date": {},
+        "m_total": {},
+        "m_total_q": {},
+        "name": {},
+        "partner_id": {"fields":{"display_name":{}}},
+        "invoice_payment_term_id": {"fields":{"display_name":{}}},
+        "qty_total": {},
+        "state": {},
+        "amount_total": {},
+        "z_total": {},
+        "z_total_q": {}
+    }
+    return odoo.search_read_all("combine.invoice", domain, specification, company_ids=[1, 3],
+                                current_company_id=1, batch_size=batch_size, label="LC recv",
+                                checkpoint=checkpoint)
+
+# --------- Flatten records (column title -> field path) ---------
+FLAT_COLUMNS = [
+    Column("Delivery Date", "delivery_date"),
+    Column("Incoterm", "invoice_incoterm_id.display_name"),
+    Column("Invoice/Bill Date", "invoice_date"),
+    Column("Metal Total", "m_total"),
+    Column("Metal Total Qty", "m_total_q"),
+    Column("Number", "name"),
+    Column("Partner", "partner_id.display_name"),
+    Column("Payment Terms", "invoice_payment_term_id.display_name"),
+    Column("Qty Total", "qty_total"),
+    Column("Status", "state"),
+    Column("Total Value", "amount_total"),
+    Column("Zipper Total", "z_total"),
+    Column("Zipper Total Qty", "z_total_q"),
+]
+
+# --------- Paste to Google Sheet ---------
+def paste_to_gsheet(gc, df, paste_mode="replace"):
+    worksheet = gc.open_by_key(SHEET_ID).worksheet(SHEET_NAME)
+    if df.empty:
+        print("Skip: DataFrame is empty, not pasting to sheet.")
+        return
+    if paste_mode == "upsert":
+        stats = upsert_frame(worksheet, df, UPSERT_KEY)
+        print(f"✅ Data upserted to Google Sheet ({SHEET_NAME}): {stats}")
+    else:
+        worksheet.batch_clear(['A:AC'])
+        write_frame(worksheet, df)
+        print(f"✅ Data pasted to Google Sheet ({SHEET_NAME}).")
+
+    local_time = datetime.now(LOCAL_TZ).strftime("%Y-%m-%d %H:%M:%S")
+    worksheet.update(values=[[f"{local_time}"]], range_name="AC2")
+    print(f"Timestamp written to AC2: {local_time}")
+
+# --------- Main ---------
+def run(ctx):
+    from_date, to_date = datetime_range(ctx.from_date, ctx.to_date, month_to_date())
+    print(f"📅 Fetching data from {from_date} to {to_date}")
+    records = fetch_all_data(ctx.odoo, from_date, to_date, checkpoint=ctx.checkpoint())
+    with span("flatten", rows=len(records)):
+        df = flatten_records(records, FLAT_COLUMNS)
+    with ctx.resource("sheets_write"):
+        paste_to_gsheet(ctx.gc, df, ctx.option("paste_mode", "replace"))
@@ -0,0 +1,85 @@
+"""Released orders (mrp.report.custom "r_invs") -> OA Data / OA Value sheets."""
+import logging
+from datetime import datetime
+
+from ordercycle.dates import month_to_date, report_range
+from ordercycle.handoff import publish
+from ordercycle.jobs import JobFailed
+from ordercycle.reports import COMPANIES, LOCAL_TZ, prepare, report_frames
+from ordercycle.sheets import write_frame, write_concurrently
+
+log = logging.getLogger(__name__)
+
+REPORT_TYPE = "r_invs"
+SHEET_ID = "1uUcLk27P-wAtgGYrSy7rVFFnw3JpEiJKGAgZICbBd-k"
+SHEETS = {
+    1: ("OA Data", "OA Value"),        # Zipper
+    3: ("MT OA Data", "MT OA Value"),  # Metal Trims
+}
+HANDOFF_COMPANY = 1  # Zipper OA Data feeds the slider-wise report (--slider_source oa)
+
+
+def paste_released(ws, df, label, clear_range=None):
+    if df.empty:
+        print(f"Skip: {label} DataFrame is empty, not pasting to sheet.")
+        return
+    if clear_range:
+        ws.batch_clear([clear_range])
+    else:
+        ws.clear()
+    write_frame(ws, df)
+    local_time = datetime.now(LOCAL_TZ).strftime("%Y-%m-%d %H:%M:%S")
+    ws.update("AC2", [[local_time]])
+    print(f"✅ {label} pasted to {ws.title}, timestamp {local_time}")
+
+
+def paste(ctx, company_id, frames):
+    """Paste OA Data (pcs) and OA Value (usd) of one company side by side; returns the failed tabs.
+
+    Also used by ordercycle.backfill.
+    """
+    sh = ctx.gc.open_by_key(SHEET_ID)
+    pcs_title, usd_title = SHEETS[company_id]
+    sheet_pcs, sheet_usd = sh.worksheet(pcs_title), sh.worksheet(usd_title)
+    df_pcs, df_usd = frames
+    return write_concurrently({
+        sheet_pcs.title: ctx.limited("sheets_write", lambda: paste_released(sheet_pcs, df_pcs, "OA Data (pcs)")),
+        sheet_usd.title: ctx.limited("sheets_write", lambda: paste_released(sheet_usd, df_usd, "OA Value (usd)", "A:AC")),
+    })
+
+
+def run(ctx):
+    from_date, to_date = report_range(ctx.from_date, ctx.to_date, month_to_date())
+    log.info(f"Using FROM_DATE={from_date}, TO_DATE={to_date}")
+
+    checkpoint = ctx.checkpoint()
+    failures = {}
+    for company_id, cname in COMPANIES.items():
+        print(f"\n🔹 Processing company: {cname} (ID={company_id})")
+        if checkpoint.done(REPORT_TYPE, company_id, from_date, to_date):
+            print(f"⏭️ {cname} report already pasted for {from_date} to {to_date}, resuming past it")
+            continue
+        pending = prepare(ctx, REPORT_TYPE, from_date, to_date, company_id, cname)
+
+        try:
+            df_released_pcs, df_released_usd = report_frames(ctx, pending, sheets=2)
+        except Exception as e:
+            print(f"❌ Exception during download/paste for {cname}: {e}")
+            failures[cname] = e
+            continue
+
+        try:
+            print("File loaded into DataFrame.")
+            if company_id == HANDOFF_COMPANY:
+                publish(ctx, "oa_released", df_released_pcs, from_date=from_date, to_date=to_date)
+
+            tab_failures = paste(ctx, company_id, [df_released_pcs, df_released_usd])
+            if tab_failures:
+                failures.update(tab_failures)
+            else:
+                checkpoint.mark_done(REPORT_TYPE, company_id, from_date, to_date)
+        except Exception as e:
+            print(f"❌ Exception during OA Data/Value paste for {cname}: {e}")
+            failures[cname] = e
+    if failures:
+        raise JobFailed(failures)
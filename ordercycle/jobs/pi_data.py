@@ -0,0 +1,106 @@
+"""Regular sale.order PIs -> "Zip Pi" / "MT PI"."""
+from datetime import datetime
+from functools import partial
+
+from ordercycle.flatten import Column, ColumnarFlattener, flatten_records
+from ordercycle.jobs import JobFailed
+from ordercycle.reports import LOCAL_TZ
+from ordercycle.sheets import write_frame, write_concurrently
+from ordercycle.telemetry import span
+
+SHEET_ID = "1acV7UrmC8ogC54byMrKRTaD9i1b1Cf9QZ-H1qHU5ZZc"
+COMPANY_SHEETS = [
+    (1, "Zipper", "Zip Pi"),
+    (3, "MetalTrim", "MT PI"),
+]
+PI_FROM_DATE = "2025-06-01"  # the sheets keep every PI since this date
+
+
+# --------- Fetch all sale.order data ---------
+def domain(from_date, to_date):
+    return [
+        "&", ["sales_type","=","sale"],
+        "&", ["state","=","sale"],
+        "&", ["pi_date",">=",from_date], ["pi_date","<=",to_date],
+        ["pi_type","=","regular"]
+    ]
+
+
+def fetch_all_data(odoo, from_date, to_date, company_id, batch_size=1000, checkpoint=None):
+    specification = {
+        "amount_invoiced": {},
+        "buyer_name": {},
+        "partner_id": {"fields": {"display_name": {}}},
+        "name": {},
+        "order_ref": {},
+        "user_id": {"fields": {"display_name": {}}},
+        "pi_date": {},
+        "date_order": {},
+        "amount_total": {},
+        "total_product_qty": {}
+    }
+    return odoo.search_read_all("sale.order", domain(from_date, to_date), specification, company_ids=[company_id],
+                                batch_size=batch_size, checkpoint=checkpoint)
+
+
+def export_all_data(odoo, from_date, to_date, company_id, batch_size=5000, checkpoint=None):
+    """FLAT_COLUMNS rows through export_data (--fetch_engine export)."""
+    return odoo.export_all("sale.order", domain(from_date, to_date), [c.path for c in FLAT_COLUMNS],
+                           company_ids=[company_id], batch_size=batch_size, checkpoint=checkpoint)
+
+# --------- Flatten records (column title -> field path) ---------
+FLAT_COLUMNS = [
+    Column("Already invoiced", "amount_invoiced"),
+    Column("Buyer", "buyer_name"),
+    Column("Customer", "partner_id.display_name"),
+    Column("Order Reference", "name"),
+    Column("Sales Order Ref.", "order_ref"),
+    Column("Salesperson", "user_id.display_name"),
+    Column("PI Date", "pi_date"),
+    Column("Order Date", "date_order"),
+    Column("Total", "amount_total"),
+    Column("Total PI Quantity", "total_product_qty"),
+]
+
+# --------- Paste to Google Sheet ---------
+def paste_to_gsheet(gc, df, sheet_name):
+    worksheet = gc.open_by_key(SHEET_ID).worksheet(sheet_name)
+    if df.empty:
+        print(f"Skip: {sheet_name} DataFrame is empty, not pasting.")
+        return
+    worksheet.batch_clear(["A:AC"])
+    write_frame(worksheet, df)
+    print(f"✅ Data pasted to Google Sheet ({sheet_name}).")
+
+    # Add timestamp
+    local_time = datetime.now(LOCAL_TZ).strftime("%Y-%m-%d %H:%M:%S")
+    worksheet.update("AC2", [[f"{local_time}"]])
+    print(f"Timestamp written to AC2: {local_time}")
+
+# --------- Main ---------
+def run(ctx):
+    to_date = ctx.to_date or datetime.today().strftime("%Y-%m-%d 23:59:59")
+    print(f"📅 Fetching data from {PI_FROM_DATE} to {to_date}")
+    writes = {}
+    checkpoint = ctx.checkpoint()
+    export = ctx.fetch_engine() == "export"
+    for company_id, company_name, sheet_name in COMPANY_SHEETS:
+        if checkpoint.done(company_id, PI_FROM_DATE, to_date):
+            print(f"⏭️ {sheet_name} already pasted up to {to_date}, resuming past it")
+            continue
+        if export:
+            rows = export_all_data(ctx.odoo, PI_FROM_DATE, to_date, company_id, checkpoint=checkpoint)
+            with span("flatten", company=company_id, rows=len(rows)):
+                df = ColumnarFlattener(FLAT_COLUMNS).extend_rows(rows).frame()
+        else:
+            records = fetch_all_data(ctx.odoo, PI_FROM_DATE, to_date, company_id, checkpoint=checkpoint)
+            with span("flatten", company=company_id, rows=len(records)):
+                df = flatten_records(records, FLAT_COLUMNS)
+        writes[sheet_name] = ctx.limited("sheets_write", partial(paste_to_gsheet, ctx.gc, df, sheet_name))
+    # "Zip Pi" and "MT PI" are independent tabs, upload them concurrently
+    failures = write_concurrently(writes)
+    for company_id, company_name, sheet_name in COMPANY_SHEETS:
+        if sheet_name in writes and sheet_name not in failures:
+            checkpoint.mark_done(company_id, PI_FROM_DATE, to_date)
+    if failures:
+        raise JobFailed(failures)
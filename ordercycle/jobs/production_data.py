@@ -0,0 +1,46 @@
+"""Production data (mrp.report.custom "invs") -> Production Data / MT_Production_QTY."""
+import logging
+
+from ordercycle.dates import month_to_date, report_range
+from ordercycle.jobs import JobFailed
+from ordercycle.reports import COMPANIES, paste_report, prepare, report_frames
+
+log = logging.getLogger(__name__)
+
+REPORT_TYPE = "invs"
+SHEET_ID = "1acV7UrmC8ogC54byMrKRTaD9i1b1Cf9QZ-H1qHU5ZZc"
+SHEETS = {
+    1: "Production Data",    # Zipper
+    3: "MT_Production_QTY",  # Metal Trims
+}
+
+
+def paste(ctx, company_id, frames):
+    """Paste one company's report frame to its sheet (also used by ordercycle.backfill)."""
+    with ctx.resource("sheets_write"):
+        paste_report(ctx.gc.open_by_key(SHEET_ID).worksheet(SHEETS[company_id]), frames[0])
+
+
+def run(ctx):
+    from_date, to_date = report_range(ctx.from_date, ctx.to_date, month_to_date())
+    log.info(f"Using FROM_DATE={from_date}, TO_DATE={to_date}")
+
+    checkpoint = ctx.checkpoint()
+    failures = {}
+    for company_id, cname in COMPANIES.items():
+        print(f"\n🔹 Processing company: {cname} (ID={company_id})")
+        if checkpoint.done(REPORT_TYPE, company_id, from_date, to_date):
+            print(f"⏭️ {cname} report already pasted for {from_date} to {to_date}, resuming past it")
+            continue
+        pending = prepare(ctx, REPORT_TYPE, from_date, to_date, company_id, cname)
+
+        try:
+            paste(ctx, company_id, report_frames(ctx, pending))
+            checkpoint.mark_done(REPORT_TYPE, company_id, from_date, to_date)
+        except Exception as e:
+            # transient Odoo / Sheets failures were already retried by ordercycle.retry
+            print(f"❌ Exception during download/paste for {cname}: {e}")
+            print(f"🚨 Skipped {cname}")
+            failures[cname] = e
+    if failures:
+        raise JobFailed(failures)
@@ -0,0 +1,198 @@
+"""Released order quantities by slider TZP code -> "SLD_DF"."""
+import hashlib
+import os
+import pickle
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+from ordercycle.handoff import receive
+from ordercycle.reports import LOCAL_TZ
+from ordercycle.rollups import MonthlyRollupStore
+from ordercycle.sheets import write_frame
+from ordercycle.telemetry import span
+from ordercycle.transforms import add_tzp_columns, aggregate_slider_wise, normalize_std_category
+
+if TYPE_CHECKING:
+    import gspread  # imported lazily with the Sheets client
+
+# -------- CONFIG --------
+SOURCE_SHEET_ID = "1Rz5ctnSMSh_UGmhYkE_jX6zYGCabz28BEHaNnfbRn0I"
+SOURCE_SHEET_NAME = "Sheet1"          # Sheet to fetch data from
+TARGET_SHEET_ID = "1acV7UrmC8ogC54byMrKRTaD9i1b1Cf9QZ-H1qHU5ZZc"
+TARGET_SHEET_NAME = "SLD_DF"          # Sheet to paste grouped data
+BATCH_CLEAR_RANGE = "A:H"
+TIMESTAMP_CELL = "I1"
+SOURCE_COLUMNS = ["Release Date", "Slider", "Quantity (PCS)", "Unit Price", "Product", "Category"]
+SOURCE_CACHE_DIR = os.getenv("SOURCE_CACHE_DIR", "./cache")  # set to "" to disable the source cache
+ROLLUP_STORE = os.getenv("SLIDER_ROLLUP_STORE", "./cache/slider_rollups.pkl")  # set to "" to always regroup everything
+TEXT_COLUMNS = ["Slider", "Product", "Category"]
+
+
+# -------- CUSTOM READER CLASS --------
+class GoogleSheetReader:
+    def __init__(self, gc: "gspread.Client", sheet_id: str, cache_dir: str | None = None):
+        self.gc = gc
+        self.sheet_id = sheet_id
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+
+    def read_sheet(self, sheet_name: str, skip_header: bool = False, columns: list | None = None) -> pd.DataFrame:
+        sh = self.gc.open_by_key(self.sheet_id)
+
+        # Serve from cache while the spreadsheet has not been modified. modifiedTime is taken
+        # before the values, so an edit landing during the read is re-read next time.
+        cache_file = modified = None
+        if self.cache_dir:
+            modified = sh.get_lastUpdateTime()
+            tag = hashlib.sha1(repr((sheet_name, skip_header, columns)).encode()).hexdigest()[:12]
+            cache_file = self.cache_dir / f"{self.sheet_id}_{tag}.pkl"
+            if cache_file.exists():
+                with open(cache_file, "rb") as f:
+                    cached = pickle.load(f)
+                if cached["modified"] == modified:
+                    print(f"✅ {sheet_name} unchanged since {cached['modified']}, using cache")
+                    return cached["frame"]
+
+        if columns and not skip_header:
+            df = self._read_columns(sh, sheet_name, columns)
+        else:
+            all_data = sh.worksheet(sheet_name).get_all_values()
+            if not all_data:
+                df = pd.DataFrame()
+            elif skip_header:
+                df = pd.DataFrame(all_data[1:])
+            else:
+                df = pd.DataFrame(all_data[2:], columns=all_data[1])
+
+        if cache_file is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, "wb") as f:
+                pickle.dump({"modified": modified, "frame": df}, f)
+        return df
+
+    def _read_columns(self, sh, sheet_name: str, columns: list) -> pd.DataFrame:
+        """Fetch only ``columns`` (header on row 2) with one batchGet."""
+        from gspread.utils import rowcol_to_a1
+
+        title = sheet_name.replace("'", "''")
+        header = sh.values_get(f"'{title}'!2:2").get("values", [[]])
+        header = header[0] if header else []
+        if not header:
+            return pd.DataFrame()
+        missing = [c for c in columns if c not in header]
+        if missing:
+            raise KeyError(f"Columns not found in {sheet_name}: {missing}")
+
+        letters = [rowcol_to_a1(1, header.index(c) + 1)[:-1] for c in columns]
+        resp = sh.values_batch_get(
+            [f"'{title}'!{col}3:{col}" for col in letters],
+            params={"majorDimension": "COLUMNS"},
+        )
+        data = [(vr.get("values") or [[]])[0] for vr in resp.get("valueRanges", [])]
+        n_rows = max((len(col) for col in data), default=0)
+        # The API trims trailing blanks per column; pad back to equal length
+        return pd.DataFrame({
+            name: col + [""] * (n_rows - len(col)) for name, col in zip(columns, data)
+        })
+
+
+# -------- FUNCTIONS --------
+def paste_to_gsheet(gc, df, sheet_id, sheet_name):
+    worksheet = gc.open_by_key(sheet_id).worksheet(sheet_name)
+    if df.empty:
+        print(f"Skip: {sheet_name} DataFrame is empty, not pasting.")
+        return
+    worksheet.batch_clear([BATCH_CLEAR_RANGE])
+    write_frame(worksheet, df)
+    print(f"✅ Data pasted to {sheet_name} ({BATCH_CLEAR_RANGE})")
+
+    # Add timestamp
+    local_time = datetime.now(LOCAL_TZ).strftime("%Y-%m-%d %H:%M:%S")
+    worksheet.update(TIMESTAMP_CELL, [[local_time]])
+    print(f"Timestamp written to {TIMESTAMP_CELL}: {local_time}")
+
+
+# -------- OA HAND-OFF --------
+def covered_months(from_date, to_date) -> list:
+    """Months wholly inside [from_date, to_date]; the open month counts when the range reaches today."""
+    start, end = pd.Timestamp(from_date).normalize(), pd.Timestamp(to_date).normalize()
+    today = pd.Timestamp.today().normalize()
+    first = start if start.day == 1 else start + pd.offsets.MonthBegin(1)
+    return [m for m in pd.date_range(first, end, freq="MS") if end >= min(m + pd.offsets.MonthEnd(0), today)]
+
+
+def read_handoff(ctx):
+    """Released rows from the Order_realsed hand-off and the whole months they cover, or (None, None)."""
+    artifact = receive(ctx, "oa_released")
+    if artifact is None:
+        print("No OA hand-off from Order_realsed, reading the source sheet")
+        return None, None
+    if not ROLLUP_STORE or not os.path.exists(ROLLUP_STORE) or not MonthlyRollupStore(ROLLUP_STORE).fingerprints:
+        # Missing, or dropped because the transforms changed
+        print("OA hand-off needs the rollup store for the months outside its window, reading the source sheet")
+        return None, None
+    df = artifact["frame"]
+    missing = [c for c in SOURCE_COLUMNS if c not in df.columns]
+    months = covered_months(artifact["from_date"], artifact["to_date"])
+    if missing or not months:
+        print(f"OA hand-off unusable (missing columns {missing}, months {months}), reading the source sheet")
+        return None, None
+
+    # Same shape as the sheet read: blank text cells are "" rather than NaN
+    df = df[SOURCE_COLUMNS].copy()
+    for col in TEXT_COLUMNS:
+        df[col] = df[col].fillna("").astype(str)
+    print(f"✅ Using OA hand-off ({len(df)} rows) for {[m.strftime('%Y-%m') for m in months]}")
+    return df, months
+
+
+# -------- MAIN WORKFLOW --------
+def run(ctx):
+    # 1. Read source: the OA frame handed over by Order_realsed, else the source sheet
+    df, window = read_handoff(ctx) if ctx.option("slider_source", "sheet") == "oa" else (None, None)
+    if df is None:
+        reader = GoogleSheetReader(ctx.gc, SOURCE_SHEET_ID, cache_dir=SOURCE_CACHE_DIR or None)
+        with span("read_source") as s:
+            df = reader.read_sheet(SOURCE_SHEET_NAME, columns=SOURCE_COLUMNS)
+            s.rows = len(df)
+
+    if df.empty:
+        print("No data found in source sheet. Exiting.")
+        return
+
+    # 2. Clean & transform
+    with span("transform", rows=len(df)):
+        df = add_tzp_columns(df)
+
+    # 3. Filter July 1 to today
+    today = pd.Timestamp.today().normalize()
+    start_date = pd.Timestamp("2024-04-01")
+    df = df[(df['Release Date'] >= start_date) & (df['Release Date'] <= today)]
+    if window is not None:
+        df = df[df["Month"].isin(window)]
+
+    # 4. Group & aggregate (only new/changed/open months when the rollup store is enabled;
+    #    a hand-off only replaces the months it covers)
+    with span("aggregate", rows=len(df)):
+        if ROLLUP_STORE:
+            store = MonthlyRollupStore(ROLLUP_STORE)
+            months = store.update(df, months=window)
+            store.save()
+            print(f"Recomputed {len(months)} month(s): {[m.strftime('%Y-%m') for m in months]}")
+            grouped, category_map = store.merged()
+        else:
+            grouped = aggregate_slider_wise(df)
+            category_map = None  # computed from the grouped rows
+
+    # Normalizing the Category: "Others" in STD rows -> most frequent category of the TZP code
+    grouped = normalize_std_category(grouped, category_map)
+
+    # 5. Sort
+    grouped["TZP_Type"] = pd.Categorical(grouped["TZP_Type"], categories=["STD","SPEC"], ordered=True)
+    grouped = grouped.sort_values(by=["TZP_Type", "Quantity_PCS_sum"], ascending=[True, False])
+
+    # 6. Paste to target sheet
+    with ctx.resource("sheets_write"):
+        paste_to_gsheet(ctx.gc, grouped, TARGET_SHEET_ID, TARGET_SHEET_NAME)
@@ -0,0 +1,397 @@
+import json
+import os
+import re
+import threading
+import time
+
+import requests
+
+from ordercycle import retry
+from ordercycle.governor import Governor
+from ordercycle.telemetry import add_bytes, span
+
+XLSX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+REPORT_MODEL = "mrp.report.custom"
+REPORT_BUTTON_METHOD = "action_generate_xlsx_report"
+# call_kw methods that only read, so a timed-out or 5xx call can simply be sent again
+READ_METHODS = {"web_search_read", "search_read", "search_count", "read", "web_read", "read_group",
+                "web_read_group", "fields_get", "name_search", "search", "export_data"}
+RPC_TIMEOUT = float(os.getenv("ODOO_RPC_TIMEOUT", "120"))           # seconds, per call_kw
+REPORT_TIMEOUT = float(os.getenv("ODOO_REPORT_TIMEOUT", "600"))     # generating a report (call_button)
+DOWNLOAD_TIMEOUT = float(os.getenv("ODOO_DOWNLOAD_TIMEOUT", "60"))  # fetching the rendered XLSX
+# A failed render comes back as 200 with an error body, which the transport does not retry
+DOWNLOAD_ATTEMPTS = int(os.getenv("ODOO_DOWNLOAD_ATTEMPTS", "3"))
+DOWNLOAD_BACKOFF = 2.5  # seconds, base of the jittered delay between download attempts
+EXPORT_TEXT_TYPES = {"char", "text", "html", "date", "datetime"}    # False when empty in web_search_read
+
+
+class OdooError(Exception):
+    """An Odoo JSON-RPC call returned an error or an unexpected response."""
+
+
+def endpoint(method, path):
+    """Timeout, idempotency and circuit breakers of an Odoo web request (see ordercycle.retry).
+
+    Everything shares the "odoo" breaker; report generation and download also trip
+    "odoo_report", so an overloaded report engine stops taking new reports while
+    plain reads keep going.
+    """
+    if path.startswith("/web/dataset/call_kw/"):
+        model, _, rpc_method = path[len("/web/dataset/call_kw/"):].partition("/")
+        breakers = ("odoo", "odoo_report") if model == REPORT_MODEL else ("odoo",)
+        return retry.Endpoint(f"odoo {rpc_method}", RPC_TIMEOUT, rpc_method in READ_METHODS, breakers)
+    if path == "/web/dataset/call_button":
+        return retry.Endpoint("odoo report generate", REPORT_TIMEOUT, False, ("odoo", "odoo_report"))
+    if path == "/report/download":
+        return retry.Endpoint("odoo report download", DOWNLOAD_TIMEOUT, True, ("odoo", "odoo_report"))
+    return retry.Endpoint(f"odoo {path}", RPC_TIMEOUT, method == "GET" or path.startswith("/web/session/"),
+                          ("odoo",))
+
+
+class OdooClient:
+    """One logged-in Odoo web session shared by every job in the process."""
+
+    def __init__(self, url=None, db=None, username=None, password=None):
+        self.url = url or os.getenv("ODOO_URL")
+        self.db = db or os.getenv("ODOO_DB")
+        self.username = username or os.getenv("ODOO_USERNAME")
+        self.password = password or os.getenv("ODOO_PASSWORD")
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"})
+        retry.mount(self.session, endpoint)
+        self.governor = Governor(f"{self.url}/{self.db}")  # report / fetch slots shared across processes
+        self._uid = None
+        self._login_lock = threading.Lock()
+        self._logins = 0  # bumped by every login, so concurrent expiries log in once
+        self._export_plans = {}
+
+    # --------- Session ---------
+    @property
+    def uid(self):
+        with self._login_lock:
+            if self._uid is None:
+                self.login()
+            return self._uid
+
+    def login(self):
+        with span("login"):
+            resp = self.session.post(f"{self.url}/web/session/authenticate", json={
+                "jsonrpc": "2.0",
+                "method": "call",
+                "params": {"db": self.db, "login": self.username, "password": self.password},
+                "id": 1
+            })
+            resp.raise_for_status()
+        result = resp.json().get("result") or {}
+        if not result.get("uid"):
+            raise OdooError(f"Login failed for {self.username}")
+        self._uid = result["uid"]
+        self._logins += 1
+        print(f"✅ Logged in! UID: {self._uid}")
+        return self._uid
+
+    def relogin(self, seen):
+        """Log in again after the session expired, unless another thread already did since ``seen``."""
+        with self._login_lock:
+            if self._logins == seen:
+                print("🔑 Odoo session expired, logging in again")
+                self.session.cookies.clear()
+                self.login()
+
+    def refresh_csrf(self):
+        resp = self.session.get(f"{self.url}/web")
+        match = re.search(r'var odoo = {\s*csrf_token: "([A-Za-z0-9]+)"', resp.text)
+        return match.group(1) if match else None
+
+    def context(self, company_ids, **extra):
+        return {"lang": "en_US", "tz": "Asia/Dhaka", "uid": self.uid, "allowed_company_ids": list(company_ids), **extra}
+
+    # --------- JSON-RPC ---------
+    def _post_rpc(self, url, params, rpc_id=1, relogin=True):
+        logins = self._logins
+        resp = self.session.post(url, json={"jsonrpc": "2.0", "method": "call", "params": params, "id": rpc_id})
+        resp.raise_for_status()
+        add_bytes(len(resp.content))
+        data = resp.json()
+        if "error" in data:
+            error = data["error"]
+            if relogin and _session_expired(error):
+                # Long-running processes (the daemon) outlive the session: log in again once and resend
+                self.relogin(logins)
+                return self._post_rpc(url, params, rpc_id, relogin=False)
+            raise OdooError(error.get("data", {}).get("message") or error.get("message") or str(error))
+        return data.get("result")
+
+    def call_kw(self, model, method, args=None, kwargs=None, rpc_id=1):
+        return self._post_rpc(
+            f"{self.url}/web/dataset/call_kw/{model}/{method}",
+            {"model": model, "method": method, "args": args or [], "kwargs": kwargs or {}},
+            rpc_id,
+        )
+
+    def call_button(self, model, method, ids, context):
+        return self._post_rpc(
+            f"{self.url}/web/dataset/call_button",
+            {"model": model, "method": method, "args": [ids], "kwargs": {"context": context}},
+        )
+
+    def search_read_all(self, model, domain, specification, company_ids, current_company_id=None,
+                        batch_size=1000, label=None, checkpoint=None):
+        """Page through ``web_search_read`` and return every record.
+
+        With a ``checkpoint`` (ordercycle.checkpoint) every page is saved as it arrives,
+        and pages saved by an interrupted earlier run are reused instead of refetched.
+        """
+        all_records = []
+        offset = 0
+        company_ids = list(company_ids)
+        current_company_id = current_company_id or company_ids[0]
+        label = label or f"Company {current_company_id}"
+        key = (model, domain, specification, company_ids, current_company_id, batch_size)
+        saved = checkpoint.pages(key) if checkpoint is not None else []
+        for records in saved:
+            all_records.extend(records)
+        if saved:
+            offset = len(saved) * batch_size
+            print(f"[{label}] Resumed {len(all_records)} records from {len(saved)} checkpointed page(s)")
+        with span("fetch", company=current_company_id, model=model) as s:
+            while not saved or len(saved[-1]) == batch_size:
+                with self.governor.slot("fetch", model):
+                    result = self.call_kw(model, "web_search_read", kwargs={
+                        "domain": domain,
+                        "specification": specification,
+                        "offset": offset,
+                        "limit": batch_size,
+                        "order": "",
+                        "context": self.context(company_ids, bin_size=True, current_company_id=current_company_id),
+                        "count_limit": 10001
+                    }, rpc_id=2)
+                records = result["records"]
+                all_records.extend(records)
+                if checkpoint is not None:
+                    checkpoint.save_page(key, offset // batch_size, records)
+                print(f"[{label}] Fetched {len(records)} records, total so far: {len(all_records)}")
+                if len(records) < batch_size:
+                    break
+                offset += batch_size
+            s.rows = len(all_records)
+        print(f"✅ {label} total records fetched: {len(all_records)}")
+        return all_records
+
+    # --------- export_data ---------
+    def _describe(self, model, paths, prefix=()):
+        """{field path tuple: fields_get entry} of every field along ``paths``, one fields_get per relation."""
+        names = sorted({keys[0] for keys in paths})
+        meta = self.call_kw(model, "fields_get", [names], {"attributes": ["type", "relation", "selection"]})
+        described = {}
+        for name in names:
+            if name not in meta:
+                raise ValueError(f"{model} has no field {name!r}")
+            described[prefix + (name,)] = meta[name]
+            rest = [keys[1:] for keys in paths if keys[0] == name and len(keys) > 1]
+            if not rest:
+                continue
+            if meta[name]["type"] != "many2one":
+                raise ValueError(f"{'.'.join(prefix + (name,))}: export_all only follows many2one fields, "
+                                 f"not {meta[name]['type']}")
+            rest = [keys for keys in rest if keys != ["display_name"]]
+            if rest:
+                described.update(self._describe(meta[name]["relation"], rest, prefix + (name,)))
+        return described
+
+    def _export_plan(self, model, paths):
+        """(export field names, [(field index, kind, selection labels, guard indexes)]) for dotted ``paths``.
+
+        ``a.b.display_name`` exports ``a/b``, a many2one leaf exports its ``/.id``. Each
+        leaf below a many2one also exports the ``/.id`` of the relations above it (its
+        guards), so a leaf under an empty relation can be told from an empty leaf.
+        """
+        if (model, paths) in self._export_plans:
+            return self._export_plans[model, paths]
+        types = self._describe(model, [path.split(".") for path in paths])
+        fields, index, plan = [], {}, []
+
+        def field(keys):
+            name = "/".join(keys)
+            if name not in index:
+                index[name] = len(fields)
+                fields.append(name)
+            return index[name]
+
+        for path in paths:
+            keys = path.split(".")
+            if keys[-1] == "display_name" and len(keys) > 1:
+                plan.append((field(keys[:-1]), "display", None, ()))
+                continue
+            meta = types[tuple(keys)]
+            guards = tuple(field(keys[:depth] + [".id"]) for depth in range(1, len(keys)))
+            if meta["type"] in ("one2many", "many2many"):
+                raise ValueError(f"{path}: export_all can't flatten {meta['type']} fields")
+            if meta["type"] == "many2one":
+                plan.append((field(keys + [".id"]), "id", None, guards))
+            elif meta["type"] == "selection":
+                labels = {label: value for value, label in meta["selection"]}
+                plan.append((field(keys), "selection", labels, guards))
+            else:
+                plan.append((field(keys), "text" if meta["type"] in EXPORT_TEXT_TYPES else "value", None, guards))
+        self._export_plans[model, paths] = fields, plan
+        return fields, plan
+
+    def export_all(self, model, domain, paths, company_ids, current_company_id=None,
+                   batch_size=5000, label=None, checkpoint=None):
+        """Fetch the dotted field ``paths`` of every record with ``export_data``; returns rows in ``paths`` order.
+
+        Odoo's export machinery renders flat rows server side instead of nested
+        ``web_search_read`` records. The rows hold what search_read_all + ordercycle.flatten
+        would give for the same paths: many2one ids, selection keys, ``False`` for empty
+        char/date fields, ``""`` below an empty many2one, UTC datetimes. Paths may only
+        cross many2one fields. ``checkpoint`` works as in search_read_all.
+        """
+        paths = tuple(paths)
+        fields, plan = self._export_plan(model, paths)
+        company_ids = list(company_ids)
+        current_company_id = current_company_id or company_ids[0]
+        label = label or f"Company {current_company_id}"
+        context = self.context(company_ids, current_company_id=current_company_id, tz="UTC")
+        key = ("export", model, domain, paths, company_ids, current_company_id, batch_size)
+        saved = checkpoint.pages(key) if checkpoint is not None else []
+        rows = [row for page in saved for row in page]
+        if saved:
+            print(f"[{label}] Resumed {len(rows)} records from {len(saved)} checkpointed page(s)")
+        with span("fetch", company=current_company_id, model=model) as s:
+            ids = self.call_kw(model, "search", [domain], {"context": context}, rpc_id=2)
+            for start in range(len(saved) * batch_size, len(ids), batch_size):
+                with self.governor.slot("fetch", f"{model} export"):
+                    datas = self.call_kw(model, "export_data", [ids[start:start + batch_size], list(fields)],
+                                         {"context": context}, rpc_id=2)["datas"]
+                page = _export_rows(plan, datas)
+                rows.extend(page)
+                if checkpoint is not None:
+                    checkpoint.save_page(key, start // batch_size, page)
+                print(f"[{label}] Exported {len(page)} records, total so far: {len(rows)}")
+            s.rows = len(rows)
+        print(f"✅ {label} total records exported: {len(rows)}")
+        return rows
+
+    def change_marker(self, model, company_id):
+        """(record count, latest write_date) of ``model`` in one company, a cheap change indicator."""
+        result = self.call_kw(model, "web_search_read", kwargs={
+            "domain": [],
+            "specification": {"write_date": {}},
+            "offset": 0,
+            "limit": 1,
+            "order": "write_date desc",
+            "context": self.context([company_id], current_company_id=company_id),
+        }, rpc_id=3)
+        records = result["records"]
+        return result["length"], records[0]["write_date"] if records else None
+
+    def read(self, model, ids, fields, company_ids, batch_size=5000):
+        """Bulk ``read`` of ``ids`` in batches."""
+        rows = []
+        with span("read", company=company_ids[0], model=model) as s:
+            for start in range(0, len(ids), batch_size):
+                with self.governor.slot("fetch", model):
+                    rows.extend(self.call_kw(model, "read", [ids[start:start + batch_size], fields], {
+                        "context": self.context(company_ids, bin_size=True)
+                    }, rpc_id=4))
+            s.rows = len(rows)
+        return rows
+
+    # --------- mrp.report.custom XLSX reports ---------
+    def prepare_report(self, report_type, date_from, date_to, company_id):
+        """Create and save the report wizard, press the button; returns (wizard_id, report_info)."""
+        uid = self.uid
+        with span("wizard_create", company=company_id, report_type=report_type):
+            wizard_id = self.call_kw(REPORT_MODEL, "create", [{}], {"context": {"uid": uid}})
+        print("✅ Wizard created, ID =", wizard_id)
+
+        with span("wizard_save", company=company_id, report_type=report_type):
+            saved = self.call_kw(REPORT_MODEL, "web_save",
+                                 [[], {"report_type": report_type, "date_from": date_from, "date_to": date_to}], {
+                                     "context": self.context([company_id]),
+                                     "specification": {"report_type": {}, "date_from": {}, "date_to": {}}
+                                 })
+        wizard_id = (saved or [{}])[0].get("id")
+        print("✅ Wizard saved, ID =", wizard_id)
+
+        slot = self.governor.slot("report", f"{report_type} {company_id}")
+        with slot, span("generate_report", company=company_id, report_type=report_type):
+            report_info = self.call_button(REPORT_MODEL, REPORT_BUTTON_METHOD, [wizard_id], self.context([company_id]))
+        return wizard_id, report_info or {}
+
+    def download_report(self, wizard_id, report_info, date_from, date_to, company_id, wait=0, timeout=None):
+        """Download the rendered XLSX of a prepared report wizard; returns the file bytes.
+
+        A response that is not an XLSX (an error status, or Odoo's 200 with an error
+        body when rendering failed) is tried again up to DOWNLOAD_ATTEMPTS times.
+        """
+        if wait:
+            time.sleep(wait)
+        options = {"date_from": date_from, "date_to": date_to, "company_id": company_id}
+        context = self.context([company_id], active_model=REPORT_MODEL, active_id=wizard_id, active_ids=[wizard_id])
+        template = report_info.get("report_name") or "taps_manufacturing.pi_xls_template"
+        report_path = f"/report/xlsx/{template}?options={json.dumps(options)}&context={json.dumps(context)}"
+        attempts = max(1, DOWNLOAD_ATTEMPTS)
+        for attempt in range(1, attempts + 1):
+            logins = self._logins
+            csrf_token = self.refresh_csrf()
+            slot = self.governor.slot("report", f"download {company_id}")
+            with slot, span("report_download", company=company_id) as s:
+                resp = self.session.post(f"{self.url}/report/download", data={
+                    "data": json.dumps([report_path, "xlsx"]),
+                    "context": json.dumps(context),
+                    "token": "dummy-because-api-expects-one",
+                    "csrf_token": csrf_token
+                }, headers={"X-CSRF-Token": csrf_token, "Referer": f"{self.url}/web"}, timeout=timeout)
+                s.add_bytes(len(resp.content))
+            if resp.status_code == 200 and XLSX_CONTENT_TYPE in resp.headers.get("content-type", ""):
+                return resp.content
+            if "/web/login" in resp.url:  # redirected to the login page: the session expired
+                self.relogin(logins)
+                problem = "session expired, redirected to login"
+            else:
+                problem = _download_error(resp)
+            if attempt == attempts:
+                raise OdooError(f"report download failed after {attempts} attempt(s): {problem}")
+            delay = retry.backoff(attempt, base=DOWNLOAD_BACKOFF)
+            print(f"🔁 Report download for company {company_id} failed ({problem}), "
+                  f"retry {attempt}/{attempts - 1} in {delay:.1f}s")
+            time.sleep(delay)
+
+
+def _session_expired(error):
+    """True for the JSON-RPC error Odoo returns once the web session is gone."""
+    return error.get("code") == 100 or "SessionExpired" in (error.get("data") or {}).get("name", "")
+
+
+def _download_error(resp):
+    """Status and Odoo's error message (if the body carries one) of a failed report download."""
+    try:
+        error = resp.json()
+        message = (error.get("data") or {}).get("message") or error.get("message")
+    except (ValueError, AttributeError):
+        message = resp.text[:200].strip()
+    return f"status={resp.status_code}, {message or 'not an XLSX'}"
+
+
+def _export_rows(plan, datas):
+    """Convert ``export_data`` rows to web_search_read values, column by column (see OdooClient._export_plan)."""
+    if not datas:
+        return []
+    exported = list(zip(*datas))
+    columns = []
+    for i, kind, labels, guards in plan:
+        values = exported[i]
+        if kind == "id":
+            values = [int(v) if v else False for v in values]
+        elif kind == "selection":
+            values = [labels.get(v, v) if v != "" else False for v in values]
+        elif kind == "text":
+            values = [False if v == "" else v for v in values]
+        if guards:
+            empty = [any(row) for row in zip(*([v == "" for v in exported[g]] for g in guards))]
+            if any(empty):
+                values = ["" if e else v for v, e in zip(values, empty)]
+        columns.append(values)
+    return list(zip(*columns))
@@ -0,0 +1,73 @@
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import NamedTuple
+from zoneinfo import ZoneInfo
+
+from ordercycle.sheets import write_frame
+from ordercycle.telemetry import span
+
+COMPANIES = {
+    1: "Zipper",
+    3: "Metal Trims",
+}
+DOWNLOAD_DIR = os.getenv("DOWNLOAD_DIR", "./downloads")
+LOCAL_TZ = ZoneInfo("Asia/Dhaka")
+# Zipper reports take noticeably longer to render server side
+RENDER_WAIT = {1: float(os.getenv("ZIPPER_RENDER_WAIT", "10"))}
+
+
+def download_report(odoo, wizard_id, report_info, report_type, date_from, date_to, company_id, cname):
+    """Download a prepared mrp.report.custom report to DOWNLOAD_DIR; returns the file path."""
+    content = odoo.download_report(wizard_id, report_info, date_from, date_to, company_id,
+                                   wait=RENDER_WAIT.get(company_id, 0))
+    os.makedirs(DOWNLOAD_DIR, exist_ok=True)
+    filename = Path(DOWNLOAD_DIR) / f"{cname.replace(' ', '_')}_{report_type}_{date_from}_to_{date_to}.xlsx"
+    with open(filename, "wb") as f:
+        f.write(content)
+    print(f"✅ Report downloaded for {cname}: {filename}")
+    return filename
+
+
+# --------- Report frames ---------
+class PendingReport(NamedTuple):
+    report_type: str
+    date_from: str
+    date_to: str
+    company_id: int
+    cname: str
+    wizard_id: int
+    report_info: dict
+
+
+def prepare(ctx, report_type, date_from, date_to, company_id, cname):
+    """Have Odoo generate one company's report."""
+    with ctx.resource("odoo_report"):
+        wizard_id, report_info = ctx.odoo.prepare_report(report_type, date_from, date_to, company_id)
+    print("✅ Report info received for", cname)
+    return PendingReport(report_type, date_from, date_to, company_id, cname, wizard_id, report_info)
+
+
+def report_frames(ctx, pending, sheets=1):
+    """Download a prepared report and parse its first ``sheets`` sheets as DataFrames."""
+    import pandas as pd
+
+    with ctx.resource("odoo_report"):
+        filename = download_report(ctx.odoo, pending.wizard_id, pending.report_info, pending.report_type,
+                                   pending.date_from, pending.date_to, pending.company_id, pending.cname)
+    with span("read_excel", company=pending.company_id) as s:
+        parsed = pd.read_excel(filename, sheet_name=list(range(sheets)))
+        frames = [parsed[i] for i in range(sheets)]
+        s.rows = sum(len(f) for f in frames)
+    return frames
+
+
+def paste_report(ws, df, clear_range="A:AB", timestamp_cell="AC2"):
+    if df.empty:
+        print("Skip: DataFrame empty, not pasting to sheet.")
+        return
+    ws.batch_clear([clear_range])
+    write_frame(ws, df)
+    timestamp = datetime.now(LOCAL_TZ).strftime("%Y-%m-%d %H:%M:%S")
+    ws.update(timestamp_cell, [[timestamp]])
+    print(f"Data pasted to {ws.title} with timestamp {timestamp}")
@@ -0,0 +1,166 @@
+import os
+import random
+import threading
+import time
+from typing import Callable, NamedTuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+
+RETRY_ATTEMPTS = int(os.getenv("RETRY_ATTEMPTS", "4"))  # tries per call, including the first
+BACKOFF_BASE = 1.0    # seconds; delay before retry n is uniform(0, min(cap, base * 2**n))
+BACKOFF_CAP = 30.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+BREAKER_FAILURES = 5  # consecutive transient failures that open a circuit
+BREAKER_RESET = 60.0  # seconds an open circuit rejects calls before letting one through
+
+
+class Endpoint(NamedTuple):
+    """How calls to one kind of endpoint are timed out, retried and guarded."""
+    name: str
+    timeout: float
+    idempotent: bool      # safe to send again after a timeout or 5xx
+    breakers: tuple = ("default",)
+
+
+class CircuitOpenError(RuntimeError):
+    """A circuit breaker is open: the backend kept failing, calls fail fast until it resets."""
+
+
+class CircuitBreaker:
+    """Opens after BREAKER_FAILURES consecutive failures; lets one trial call through after BREAKER_RESET."""
+
+    def __init__(self, name, failures=BREAKER_FAILURES, reset_after=BREAKER_RESET):
+        self.name = name
+        self.threshold = failures
+        self.reset_after = reset_after
+        self.failures = 0
+        self.opened_at = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    def check(self):
+        """Raise CircuitOpenError while open; True when this call is the half-open trial."""
+        with self._lock:
+            if self.opened_at is None:
+                return False
+            if time.monotonic() - self.opened_at < self.reset_after or self._trial:
+                raise CircuitOpenError(f"{self.name} circuit open after {self.failures} consecutive failures, "
+                                       f"failing fast for up to {self.reset_after:.0f}s")
+            self._trial = True  # half-open: this call decides
+            return True
+
+    def release(self):
+        """End a trial that neither succeeded nor failed (e.g. it raised), so another call can try."""
+        with self._lock:
+            self._trial = False
+
+    def success(self):
+        with self._lock:
+            self.failures, self.opened_at, self._trial = 0, None, False
+
+    def failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._trial or self.failures >= self.threshold:
+                if self.opened_at is None or self._trial:
+                    print(f"⛔ {self.name} circuit opened after {self.failures} consecutive failures")
+                self.opened_at, self._trial = time.monotonic(), False
+
+
+def backoff(attempt, base=BACKOFF_BASE, cap=BACKOFF_CAP):
+    """Full-jitter exponential delay before retry ``attempt`` (1-based)."""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+def _not_sent(exc):
+    """True when the request never reached the server, so even a non-idempotent call may be resent."""
+    if isinstance(exc, requests.exceptions.ConnectTimeout):
+        return True
+    reason = getattr(exc.args[0], "reason", None) if exc.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+class RetryingAdapter(BaseAdapter):
+    """Transport adapter adding per-endpoint timeouts, retries and circuit breakers to a session.
+
+    ``classify(method, path)`` returns the call's Endpoint. Transient failures (connection
+    errors, timeouts, 429 and 5xx) are retried with jittered exponential backoff, honouring
+    Retry-After; calls that are not idempotent are only resent when they were provably not
+    processed (connection never established, or 429). Every failed attempt counts against
+    the endpoint's breakers; an open breaker rejects calls at once with CircuitOpenError.
+    The actual I/O is done by ``transport``.
+    """
+
+    def __init__(self, classify: Callable[[str, str], Endpoint], attempts=RETRY_ATTEMPTS, breakers=None):
+        super().__init__()
+        self.classify = classify
+        self.attempts = max(1, attempts)
+        self.transport = HTTPAdapter()
+        self.breakers = breakers if breakers is not None else {}
+        self._lock = threading.Lock()
+
+    def breaker(self, name):
+        with self._lock:
+            if name not in self.breakers:
+                self.breakers[name] = CircuitBreaker(name)
+            return self.breakers[name]
+
+    def send(self, request, timeout=None, **kwargs):
+        path = urlsplit(request.url).path
+        endpoint = self.classify(request.method, path)
+        breakers = [self.breaker(name) for name in endpoint.breakers]
+        timeout = timeout if timeout is not None else endpoint.timeout
+        for attempt in range(1, self.attempts + 1):
+            error, response, trials = None, None, []
+            try:
+                for breaker in breakers:
+                    if breaker.check():
+                        trials.append(breaker)
+                try:
+                    response = self.transport.send(request, timeout=timeout, **kwargs)
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    error = e
+                ok = error is None and response.status_code not in RETRY_STATUSES
+                for breaker in breakers:
+                    if ok:
+                        breaker.success()
+                    else:
+                        breaker.failure()
+                trials = []
+            finally:
+                # Another breaker rejected the call, or the transport raised something else
+                for breaker in trials:
+                    breaker.release()
+            if ok:
+                return response
+
+            retryable = endpoint.idempotent or (
+                _not_sent(error) if error is not None else response.status_code == 429)
+            if attempt == self.attempts or not retryable:
+                if error is not None:
+                    raise error
+                return response
+            delay = backoff(attempt)
+            if response is not None:
+                retry_after = response.headers.get("Retry-After", "")
+                if retry_after.isdigit():
+                    delay = min(max(delay, float(retry_after)), BACKOFF_CAP)
+                response.close()
+            cause = type(error).__name__ if error is not None else response.status_code
+            print(f"🔁 {endpoint.name}: {request.method} {path} failed ({cause}), "
+                  f"retry {attempt}/{self.attempts - 1} in {delay:.1f}s")
+            time.sleep(delay)
+
+    def close(self):
+        self.transport.close()
+
+
+def mount(session, classify, **kwargs):
+    """Route all of ``session``'s requests through a RetryingAdapter; returns the adapter."""
+    adapter = RetryingAdapter(classify, **kwargs)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return adapter
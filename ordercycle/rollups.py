@@ -0,0 +1,116 @@
+import hashlib
+import inspect
+import pickle
+from pathlib import Path
+
+import pandas as pd
+
+from ordercycle.transforms import SLIDER_GROUP_KEYS, STD_TZP_CODES, add_tzp_columns, most_frequent
+
+FINGERPRINT_COLUMNS = ["Release Date", "Slider", "Quantity (PCS)", "Unit Price", "Product", "Category"]
+CATEGORY_KEYS = ["TZP_Code", "Category"]
+
+
+# -------- PER-MONTH PARTIALS --------
+def month_fingerprints(df: pd.DataFrame) -> dict:
+    """Order-independent (row count, hash sum) of the source rows of each month."""
+    hashes = pd.util.hash_pandas_object(df[FINGERPRINT_COLUMNS], index=False)
+    stats = hashes.groupby(df["Month"]).agg(["count", "sum"])
+    return {month: (int(row["count"]), int(row["sum"])) for month, row in stats.iterrows()}
+
+
+def monthly_partials(df: pd.DataFrame):
+    """Mergeable slider-wise aggregates (sums and counts) plus STD category counts."""
+    groups = df.groupby(SLIDER_GROUP_KEYS, as_index=False).agg(
+        Quantity_PCS_sum=("Quantity (PCS)", "sum"),
+        Unit_Price_sum=("Unit Price", "sum"),
+        Unit_Price_count=("Unit Price", "count"),
+    )
+    # Category votes are counted per aggregated row, as the report does
+    std = groups[(groups["Category"] != "Others") & (groups["TZP_Type"] == "STD")]
+    categories = std.groupby(["Month"] + CATEGORY_KEYS, as_index=False).size()
+    return groups, categories.rename(columns={"size": "rows"})
+
+
+def transform_version() -> str:
+    """Hash of the config and code that stored partials depend on (TZP parsing, grouping, votes)."""
+    parts = [repr((STD_TZP_CODES, SLIDER_GROUP_KEYS, CATEGORY_KEYS, FINGERPRINT_COLUMNS))]
+    for fn in (add_tzp_columns, month_fingerprints, monthly_partials):
+        try:
+            parts.append(inspect.getsource(fn))
+        except OSError:  # no source shipped
+            parts.append(fn.__code__.co_code.hex())
+    return hashlib.sha1("\n".join(parts).encode()).hexdigest()
+
+
+# -------- PERSISTED STORE --------
+class MonthlyRollupStore:
+    """Per-month partial aggregates for the slider-wise report.
+
+    Closed months are kept as-is while their source fingerprint is unchanged;
+    only new, changed or still-open months are re-aggregated on ``update``.
+    A store written with another ``transform_version()`` is dropped whole.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.version = transform_version()
+        self.fingerprints = {}
+        self.groups = pd.DataFrame()
+        self.categories = pd.DataFrame()
+        if self.path.exists():
+            with open(self.path, "rb") as f:
+                state = pickle.load(f)
+            if state.get("version") != self.version:
+                print(f"ℹ️ {self.path.name}: transform config or code changed, regrouping every month")
+                return
+            self.fingerprints = state["fingerprints"]
+            self.groups = state["groups"]
+            self.categories = state["categories"]
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "wb") as f:
+            pickle.dump({
+                "version": self.version,
+                "fingerprints": self.fingerprints,
+                "groups": self.groups,
+                "categories": self.categories,
+            }, f)
+
+    def update(self, df: pd.DataFrame, open_from=None, months=None) -> list:
+        """Recompute months that changed or start at/after ``open_from``; returns them.
+
+        ``df`` normally holds the full history. When it only covers some whole
+        ``months`` (e.g. a report window), the stored state of every other month is kept.
+        """
+        open_from = open_from or pd.Timestamp.today().normalize().replace(day=1)
+        fresh = month_fingerprints(df)
+        stale = [m for m, fp in fresh.items() if m >= open_from or self.fingerprints.get(m) != fp]
+        if months is None:
+            dropped = [m for m in self.fingerprints if m not in fresh]
+            fingerprints = fresh
+        else:
+            months = set(months)
+            dropped = [m for m in self.fingerprints if m in months and m not in fresh]
+            fingerprints = {**{m: fp for m, fp in self.fingerprints.items() if m not in months}, **fresh}
+
+        groups, categories = monthly_partials(df[df["Month"].isin(stale)])
+        if not self.groups.empty:
+            kept = ~self.groups["Month"].isin(stale + dropped)
+            groups = pd.concat([self.groups[kept], groups], ignore_index=True)
+        if not self.categories.empty:
+            kept = ~self.categories["Month"].isin(stale + dropped)
+            categories = pd.concat([self.categories[kept], categories], ignore_index=True)
+
+        self.groups, self.categories, self.fingerprints = groups, categories, fingerprints
+        return sorted(stale)
+
+    def merged(self):
+        """Final grouped frame and the STD TZP_Code -> most frequent Category map."""
+        grouped = self.groups.sort_values(SLIDER_GROUP_KEYS, ignore_index=True)
+        grouped["Avg_Unit_Price"] = grouped["Unit_Price_sum"] / grouped["Unit_Price_count"].where(grouped["Unit_Price_count"] > 0)
+        grouped = grouped.drop(columns=["Unit_Price_sum", "Unit_Price_count"])
+
+        category_map = most_frequent(self.categories, "TZP_Code", "Category", weight="rows")
+        return grouped, category_map
@@ -0,0 +1,93 @@
+import io
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from ordercycle import jobs
+from ordercycle.telemetry import current_job, span
+
+
+class _JobOutput(io.TextIOBase):
+    """Line-buffered stdout proxy prefixing each line with the job that printed it."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+        self.lock = threading.Lock()
+
+    def write(self, s):
+        *lines, self.local.buffer = (getattr(self.local, "buffer", "") + s).split("\n")
+        if lines:
+            job = current_job.get()
+            prefix = f"[{job}] " if job else ""
+            with self.lock:
+                self.stream.write("".join(f"{prefix}{line}\n" for line in lines))
+        return len(s)
+
+    def flush(self):
+        self.stream.flush()
+
+
+def _run_one(name, ctx, out):
+    print(f"▶️ {name}")
+    token = current_job.set(name)
+    start = time.perf_counter()
+    error = None
+    try:
+        with span("job"):
+            jobs.load(name).run(ctx)
+    except Exception as e:
+        error = e
+    finally:
+        if getattr(out.local, "buffer", ""):
+            print()  # flush a trailing partial line under the job prefix
+        current_job.reset(token)
+    elapsed = time.perf_counter() - start
+    if error is not None:
+        print(f"❌ {name} failed after {elapsed:.1f}s: {error!r}")
+        return name, "failed", elapsed, error
+    ctx.finish_checkpoint(name)
+    print(f"✅ {name} finished in {elapsed:.1f}s")
+    return name, "ok", elapsed, None
+
+
+def run_dag(names, ctx, workers=1):
+    """Run ``names`` on ``workers`` threads, starting each job once its DEPENDS have succeeded.
+
+    Jobs whose dependency failed are skipped. Returns [(name, status, seconds, error)]
+    in ``names`` order, status being "ok", "failed" or "skipped".
+    """
+    depends = {n: [d for d in jobs.DEPENDS.get(n, []) if d in names] for n in names}
+    status, results = {}, {}
+    out = _JobOutput(sys.stdout)
+    stdout, sys.stdout = sys.stdout, out
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            running = {}
+            while len(results) < len(names):
+                skipped = False
+                for name in names:
+                    if name in results or name in running.values():
+                        continue
+                    if any(status.get(d) in ("failed", "skipped") for d in depends[name]):
+                        print(f"⏭️ {name} skipped, dependency failed: {depends[name]}")
+                        status[name] = "skipped"
+                        results[name] = (name, "skipped", 0.0, None)
+                        skipped = True
+                    elif all(status.get(d) == "ok" for d in depends[name]):
+                        running[pool.submit(_run_one, name, ctx, out)] = name
+                if not running:
+                    if skipped:
+                        continue
+                    raise RuntimeError(f"Dependency cycle among {[n for n in names if n not in results]}")
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    results[name] = future.result()
+                    status[name] = results[name][1]
+    finally:
+        if getattr(out.local, "buffer", ""):
+            stdout.write(out.local.buffer)
+        sys.stdout = stdout
+    return [results[n] for n in names]
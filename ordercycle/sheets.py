@@ -0,0 +1,220 @@
+import contextvars
+import os
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from ordercycle.telemetry import span
+
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+SHEET_WRITE_WORKERS = int(os.getenv("SHEET_WRITE_WORKERS", "4"))
+
+SHEETS_TIMEOUT = float(os.getenv("SHEETS_TIMEOUT", "120"))  # seconds, per Sheets / Drive API call
+# POSTs that set or clear fixed ranges, so resending them is harmless (unlike :append or copies)
+_IDEMPOTENT_POSTS = (":batchUpdate", ":batchClear", ":clear", ":batchGet", ":batchGetByDataFilter")
+
+# infer_dtype results whose values can be sent to the Sheets API as-is
+_PLAIN_KINDS = {"string", "empty", "integer", "floating", "mixed-integer-float", "boolean"}
+
+
+def endpoint(method, path):
+    """Timeout and idempotency of a Sheets / Drive API request (see ordercycle.retry)."""
+    from ordercycle import retry  # imports requests, only needed once the Sheets client exists
+
+    idempotent = method in ("GET", "PUT", "DELETE") or path.endswith(_IDEMPOTENT_POSTS)
+    return retry.Endpoint(f"sheets {method}", SHEETS_TIMEOUT, idempotent, ("sheets",))
+
+
+# --------- DataFrame -> values payload ---------
+def _column_values(col: pd.Series) -> np.ndarray:
+    """Convert one column to a JSON-safe object array ('' for NaN/NaT)."""
+    kind = col.dtype.kind
+    if kind == "M":
+        # set_with_dataframe writes str(Timestamp); strftime gives the same text unless
+        # the column carries a timezone or fractions of a second
+        if col.dt.tz is None and not (col.dt.microsecond.any() or col.dt.nanosecond.any()):
+            return col.dt.strftime(DATETIME_FORMAT).to_numpy(dtype=object, na_value="")
+        return np.array([_cell_value(v) for v in col.to_numpy(dtype=object, na_value="")], dtype=object)
+    if kind in "biuf":
+        return col.to_numpy(dtype=object, na_value="")
+    if isinstance(col.dtype, pd.PeriodDtype):
+        return col.astype("string").to_numpy(dtype=object, na_value="")
+
+    values = col.to_numpy(dtype=object, na_value="")
+    inferred = pd.api.types.infer_dtype(values, skipna=True)
+    if inferred not in _PLAIN_KINDS:
+        # Mixed object column (timestamps, numpy scalars, dicts...): fall back
+        # to the same per-cell rules gspread_dataframe uses.
+        values = np.array([_cell_value(v) for v in values], dtype=object)
+    elif inferred == "string":
+        # Keep a leading apostrophe literal, as set_with_dataframe does
+        quoted = col.str.startswith("'", na=False).to_numpy(dtype=bool)
+        if quoted.any():
+            values[quoted] = "'" + values[quoted]
+    return values
+
+
+def _cell_value(value):
+    if isinstance(value, str):
+        return "'" + value if value.startswith("'") else value
+    if value is None or value is pd.NA or value is pd.NaT:
+        return ""
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        return "" if np.isnan(value) else float(value)
+    return _cell_value(str(value))
+
+
+def frame_to_values(df: pd.DataFrame, include_header: bool = True) -> list:
+    """Serialize ``df`` column-wise into a Sheets ``values`` payload.
+
+    Produces the same cells as ``set_with_dataframe`` after ``fillna("")``,
+    without copying the frame or visiting cells one by one in Python.
+    """
+    out = np.empty((len(df), len(df.columns)), dtype=object)
+    for i in range(len(df.columns)):
+        out[:, i] = _column_values(df.iloc[:, i])
+    values = out.tolist()
+    if include_header:
+        values.insert(0, [_cell_value(c) for c in df.columns])
+    return values
+
+
+def _write_values(worksheet, values: list, row: int, width: int):
+    last_row = row + len(values) - 1
+    if last_row > worksheet.row_count or width > worksheet.col_count:
+        worksheet.resize(max(last_row, worksheet.row_count), max(width, worksheet.col_count))
+    if values:
+        worksheet.update(values, f"A{row}", value_input_option="USER_ENTERED")
+
+
+def write_frame(worksheet, df: pd.DataFrame, row: int = 1, include_header: bool = True):
+    """Write ``df`` to ``worksheet`` starting at ``row`` in a single values update."""
+    with span("serialize", rows=len(df), sheet=worksheet.title):
+        values = frame_to_values(df, include_header=include_header)
+    with span("sheets_write", rows=len(df), sheet=worksheet.title):
+        _write_values(worksheet, values, row, len(df.columns))
+    return len(values)
+
+
+# --------- Incremental (upsert) paste ---------
+# Text USER_ENTERED turns into a date; compared as the serial number the sheet stores
+_DATE_TEXT = re.compile(r"^\d{4}-\d{2}-\d{2}( \d{2}:\d{2}(:\d{2})?)?$")
+_SERIAL_EPOCH = datetime(1899, 12, 30)
+
+
+def _norm(value) -> str:
+    """Comparable form of a cell, whether it came from a frame or from the sheet."""
+    if isinstance(value, bool):
+        return str(value).upper()
+    if isinstance(value, str) and _DATE_TEXT.match(value.strip()):
+        value = (datetime.fromisoformat(value.strip()) - _SERIAL_EPOCH) / timedelta(days=1)
+    try:
+        return format(float(value), ".10g")
+    except (TypeError, ValueError):
+        return str(value).strip()
+
+
+def _row_keys(rows: list, key_idx: list) -> list:
+    # Occurrence counter keeps duplicate natural keys addressable
+    seen = Counter()
+    keys = []
+    for r in rows:
+        k = tuple(_norm(r[i]) if i < len(r) else "" for i in key_idx)
+        seen[k] += 1
+        keys.append(k + (seen[k],))
+    return keys
+
+
+def upsert_frame(worksheet, df: pd.DataFrame, key) -> dict:
+    """Make the data columns hold ``df``, rewriting only the rows that change.
+
+    Rows are matched on the ``key`` columns: kept rows stay in sheet order (patched
+    where they changed), rows missing from ``df`` are removed, the ones below them
+    move up, and new rows follow. Dates are read back as serial numbers so the
+    sheet's display format does not matter. The result has the same rows as a
+    full rewrite of ``df``; if the sheet is empty or its header no longer matches,
+    the data columns are rewritten in full. Returns counts of inserted / updated /
+    deleted / unchanged rows.
+    """
+    from gspread.utils import DateTimeOption, ValueRenderOption, rowcol_to_a1  # deferred until a sheet is touched
+
+    with span("sheets_upsert", rows=len(df), sheet=worksheet.title):
+        key = [key] if isinstance(key, str) else list(key)
+        values = frame_to_values(df)
+        header, rows = values[0], values[1:]
+        width = len(header)
+        last_col = rowcol_to_a1(1, width)[:-1]
+
+        existing = worksheet.get(
+            f"A1:{last_col}",
+            value_render_option=ValueRenderOption.unformatted,
+            date_time_render_option=DateTimeOption.serial_number,
+        )
+        if not existing or [_norm(v) for v in existing[0]] != [_norm(v) for v in header]:
+            print(f"ℹ️ {worksheet.title}: header changed or sheet empty, rewriting A:{last_col}")
+            worksheet.batch_clear([f"A:{last_col}"])
+            _write_values(worksheet, values, 1, width)
+            return {"inserted": len(rows), "updated": 0, "deleted": 0, "unchanged": 0}
+
+        key_idx = [header.index(k) for k in key]
+        old_rows = [[_norm(v) for v in r[:width]] + [""] * (width - len(r)) for r in existing[1:]]
+        old_by_key = dict(zip(_row_keys(existing[1:], key_idx), old_rows))
+        incoming = dict(zip(_row_keys(rows, key_idx), rows))
+        # Target layout: surviving rows in sheet order, then the new ones
+        kept = [k for k in old_by_key if k in incoming]
+        new = [k for k in incoming if k not in old_by_key]
+        target = [incoming[k] for k in kept + new]
+        updated = sum(old_by_key[k] != [_norm(v) for v in incoming[k]] for k in kept)
+
+        # Rewrite every run of rows whose content at that position changes
+        blocks = []
+        for i, row in enumerate(target):
+            if i < len(old_rows) and old_rows[i] == [_norm(v) for v in row]:
+                continue
+            if blocks and blocks[-1][1] == i - 1:
+                blocks[-1][1] = i
+                blocks[-1][2].append(row)
+            else:
+                blocks.append([i, i, [row]])
+
+        if len(target) < len(old_rows):
+            worksheet.batch_clear([f"A{len(target) + 2}:{last_col}{len(old_rows) + 1}"])
+        if len(target) + 1 > worksheet.row_count or width > worksheet.col_count:
+            worksheet.resize(max(len(target) + 1, worksheet.row_count), max(width, worksheet.col_count))
+        if blocks:
+            worksheet.batch_update([{"range": f"A{start + 2}:{last_col}{end + 2}", "values": block}
+                                    for start, end, block in blocks], value_input_option="USER_ENTERED")
+        return {"inserted": len(new), "updated": updated, "deleted": len(old_rows) - len(kept),
+                "unchanged": len(kept) - updated}
+
+
+# --------- Concurrent worksheet writes ---------
+def write_concurrently(writes: dict, max_workers: int = SHEET_WRITE_WORKERS) -> dict:
+    """Run independent worksheet writes in a bounded thread pool.
+
+    ``writes`` maps a label (usually the tab name) to a zero-argument callable.
+    A failed write is reported and does not stop the others; the failures are
+    returned as ``{label: exception}``.
+    """
+    failures = {}
+    if not writes:
+        return failures
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(writes)))) as pool:
+        # Each write runs in a copy of the caller's context (keeps the scheduler's job log prefix)
+        futures = {pool.submit(contextvars.copy_context().run, fn): label for label, fn in writes.items()}
+        for future in as_completed(futures):
+            label = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                print(f"❌ Write to {label} failed: {e}")
+                failures[label] = e
+    return failures
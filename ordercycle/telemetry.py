@@ -0,0 +1,130 @@
+import contextvars
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+TELEMETRY_FILE = os.getenv("TELEMETRY_FILE", "")  # JSON lines, appended across runs; "" to keep them in memory
+
+current_job = contextvars.ContextVar("current_job", default=None)  # set by the scheduler
+_active_span = contextvars.ContextVar("active_span", default=None)
+
+
+class Span:
+    """One timed phase; ``rows`` / ``bytes`` are filled in by the code being timed."""
+
+    __slots__ = ("phase", "job", "company", "rows", "bytes", "extra")
+
+    def __init__(self, phase, job=None, company=None, rows=None, nbytes=None, **extra):
+        self.phase, self.job, self.company = phase, job, company
+        self.rows, self.bytes, self.extra = rows, nbytes, extra
+
+    def add_bytes(self, n):
+        self.bytes = (self.bytes or 0) + n
+
+
+class Telemetry:
+    """Collects spans of one run, appends them to ``path`` as JSON lines and prints a summary."""
+
+    def __init__(self, path=None):
+        self.path = path
+        self.run_id = uuid.uuid4().hex[:12]
+        self.events = []
+        self._lock = threading.Lock()
+
+    def emit(self, span, duration, status):
+        event = {
+            "ts": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            "run_id": self.run_id,
+            "job": span.job,
+            "company": span.company,
+            "phase": span.phase,
+            "duration": round(duration, 4),
+            "rows": span.rows,
+            "bytes": span.bytes,
+            "status": status,
+            **span.extra,
+        }
+        with self._lock:
+            self.events.append(event)
+            if self.path:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(event, default=str) + "\n")
+
+    def print_summary(self):
+        """Per job and phase: calls, total / max seconds, rows and bytes."""
+        if not self.events:
+            return
+        jobs = {}
+        for e in self.events:
+            job = e["job"] or "-"
+            phases = jobs.setdefault(job, {})
+            s = phases.setdefault(e["phase"], {"n": 0, "total": 0.0, "max": 0.0, "rows": None, "bytes": None, "errors": 0})
+            s["n"] += 1
+            s["total"] += e["duration"]
+            s["max"] = max(s["max"], e["duration"])
+            if e["rows"] is not None:
+                s["rows"] = (s["rows"] or 0) + e["rows"]
+            if e["bytes"] is not None:
+                s["bytes"] = (s["bytes"] or 0) + e["bytes"]
+            s["errors"] += e["status"] != "ok"
+        # jobs in order of their first recorded phase, the "job" total last within each
+        for phases in jobs.values():
+            if "job" in phases:
+                phases["job"] = phases.pop("job")
+        width = max(len(job) for job in jobs)
+        print(f"\n📊 Phase timings (run {self.run_id})")
+        print(f"{'job':<{width}}  {'phase':<22} {'calls':>5} {'total s':>9} {'max s':>8} {'rows':>9} {'MiB':>8}")
+        for job, phases in jobs.items():
+            for phase, s in phases.items():
+                rows = "" if s["rows"] is None else s["rows"]
+                mib = "" if s["bytes"] is None else f"{s['bytes'] / 2**20:.2f}"
+                line = (f"{job:<{width}}  {phase:<22} {s['n']:>5} {s['total']:>9.2f} {s['max']:>8.2f} "
+                        f"{rows:>9} {mib:>8}")
+                print(line + (f"  ({s['errors']} failed)" if s["errors"] else ""))
+
+
+_telemetry = Telemetry(TELEMETRY_FILE or None)
+
+
+def configure(path=None):
+    """Start a fresh run; spans go to ``path`` (JSON lines) as well as memory."""
+    global _telemetry
+    _telemetry = Telemetry(path)
+    return _telemetry
+
+
+def current():
+    return _telemetry
+
+
+@contextmanager
+def span(phase, company=None, rows=None, **extra):
+    """Time the enclosed block as ``phase`` of the running job.
+
+    The job name comes from the scheduler; set ``s.rows`` / ``s.add_bytes()`` inside
+    the block. Response sizes of Odoo calls made inside are added automatically.
+    """
+    s = Span(phase, current_job.get(), company, rows, **extra)
+    token = _active_span.set(s)
+    start = time.perf_counter()
+    status = "ok"
+    try:
+        yield s
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        _active_span.reset(token)
+        _telemetry.emit(s, time.perf_counter() - start, status)
+
+
+def add_bytes(n):
+    """Count ``n`` transferred bytes against the innermost open span, if any."""
+    s = _active_span.get()
+    if s is not None:
+        s.add_bytes(n)
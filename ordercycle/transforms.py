@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+
+# -------- SLIDER-WISE ORDER RELEASED --------
+STD_TZP_CODES = ["TZP-1862", "TZP-2239", "TZP-294", "TZP-305", "TZP-331", "TZP-373",
+                 "TZP-684", "TZP-793", "TZP-794", "TZP-645", "TZP-574"]
+SLIDER_GROUP_KEYS = ["TZP_Type", "Product", "Category", "TZP_Code", "Month", "Release Date"]
+
+
+def add_tzp_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Parse dates/numbers and derive Month, TZP_Code and TZP_Type (in place)."""
+    df["Release Date"] = pd.to_datetime(df["Release Date"], errors="coerce")
+    df["Month"] = df["Release Date"].values.astype("datetime64[M]")
+    df["TZP_Code"] = (
+        df["Slider"].astype(str)
+        .str.extract(r"(TZP.*$)", expand=False)
+        .fillna("Others")
+        .str.replace("\xa0", "", regex=False)
+    )
+    df["Quantity (PCS)"] = pd.to_numeric(df["Quantity (PCS)"], errors="coerce")
+    df["Unit Price"] = pd.to_numeric(df["Unit Price"], errors="coerce")
+    df["TZP_Type"] = np.where(df["TZP_Code"].isin(STD_TZP_CODES), "STD", "SPEC")
+    return df
+
+
+def aggregate_slider_wise(df: pd.DataFrame) -> pd.DataFrame:
+    """Sum quantities and average unit prices per slider group."""
+    return df.groupby(SLIDER_GROUP_KEYS, as_index=False).agg(
+        Quantity_PCS_sum=("Quantity (PCS)", "sum"),
+        Avg_Unit_Price=("Unit Price", "mean"),
+    )
+
+
+# -------- MAJORITY-VOTE NORMALIZATION --------
+def most_frequent(df: pd.DataFrame, key: str, value: str, weight: str | None = None) -> dict:
+    """Most frequent ``value`` per ``key``, optionally weighted by a count column.
+
+    Ties go to the smallest value, matching ``groupby(key)[value].agg(lambda x: x.mode()[0])``.
+    """
+    if weight is None:
+        counts = df[[key, value]].value_counts().reset_index(name="n")
+    else:
+        counts = df.groupby([key, value], as_index=False)[weight].sum().rename(columns={weight: "n"})
+    winners = counts.sort_values(["n", value], ascending=[False, True], kind="stable").drop_duplicates(key)
+    return dict(zip(winners[key], winners[value]))
+
+
+def apply_majority_fix(df: pd.DataFrame, key: str, value: str, fix_mask: pd.Series, mapping: dict) -> pd.DataFrame:
+    """Overwrite ``value`` on ``fix_mask`` rows with ``mapping[key]`` (in place)."""
+    df.loc[fix_mask, value] = df.loc[fix_mask, key].map(mapping)
+    return df
+
+
+def normalize_std_category(grouped: pd.DataFrame, category_map: dict | None = None) -> pd.DataFrame:
+    """Replace "Others" on STD rows with the TZP_Code's most frequent real category."""
+    std = grouped["TZP_Type"] == "STD"
+    if category_map is None:
+        votes = grouped[std & (grouped["Category"] != "Others")]
+        category_map = most_frequent(votes, "TZP_Code", "Category")
+    return apply_majority_fix(grouped, "TZP_Code", "Category", std & (grouped["Category"] == "Others"), category_map)